@@ -0,0 +1,562 @@
+import asyncio
+import logging
+import re
+import time
+import aiohttp
+from moncli.api_v2 import MondayApiError
+
+from MondayWrapper import API_TIMEOUT, DEFAULT_CONNECTION, MondayClientPool, ColumnCodecRegistry, graphql_json, graphql_string
+
+logger = logging.getLogger(__name__)
+
+# FIRST FIELD OF A GRAPHQL DOCUMENT, USED AS THE OPERATION NAME IN THE METRICS
+OPERATION_PATTERN = re.compile(r"^\s*(?:query|mutation)?\s*\{\s*(?:\w+\s*:\s*)?(\w+)")
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of MondayWrapper.SingleFlight: while a coroutine for a key is running, the other tasks
+    calling do() with the same key await it and share its result or error instead of sending the same request again.
+    """
+
+    def __init__(self):
+        # KEY -> TASK OF THE IN-FLIGHT CALL
+        self.calls = {}
+        self.calls_made = 0
+        self.calls_shared = 0
+
+    async def do(self, key, func, *args, **kwargs):
+        """
+        Awaits func(*args, **kwargs), unless a call for the same key is already in flight: then awaits that call.
+        :param key: Hashable identifier of the read, e.g. ("columns", board id)
+        :param func: Coroutine function to call
+        :return: Result of the call
+        """
+        task = self.calls.get(key)
+        if task is None:
+            task = self.calls[key] = asyncio.ensure_future(func(*args, **kwargs))
+            task.add_done_callback(lambda _: self.calls.pop(key, None))
+            self.calls_made += 1
+        else:
+            self.calls_shared += 1
+        # A CANCELLED CALLER MUST NOT CANCEL THE CALL THE OTHER CALLERS ARE WAITING FOR
+        return await asyncio.shield(task)
+
+    def stats(self):
+        """
+        :return: Number of calls made and of calls answered by an in-flight call: dict
+        """
+        return {"in_flight": len(self.calls), "calls": self.calls_made, "shared": self.calls_shared}
+
+
+class AsyncMondayWrapper:
+    """
+    asyncio counterpart of MondayWrapper for running many independent operations in flight from one process.
+    Requests are sent over a pooled keep-alive HTTP session and the number of requests in flight is bounded
+    by a semaphore. Requests are metered and retried by the same RequestScheduler as MondayWrapper, waiting with
+    asyncio.sleep so the event loop is never blocked.
+    Methods return plain dicts (id, name, ...) instead of moncli objects.
+    Requires a board name which will be the base/main board we are working with.
+
+    Usage:
+        async with AsyncMondayWrapper("My Board", max_concurrency=20) as mon:
+            await asyncio.gather(*[mon.change_value_of_column(name, "Status", "Done") for name in names])
+    """
+
+    def __init__(self, board_name, api_key=None, endpoint=None, max_concurrency=10, max_connections=20, scheduler=None, connection=None):
+        """
+        :param board_name: str
+        :param api_key: Monday API v2 key. Defaults to the key of the connection: str
+        :param endpoint: Monday API v2 endpoint. Defaults to the endpoint of the connection: str
+        :param max_concurrency: Maximum number of API requests in flight at the same time: int
+        :param max_connections: Maximum number of pooled keep-alive connections: int
+        :param scheduler: RequestScheduler used for complexity budget and retries. Defaults to the scheduler of the connection
+        :param connection: MondayConnection, or a MondayClientPool to take one from. Defaults to DEFAULT_CONNECTION
+        """
+        if isinstance(connection, MondayClientPool):
+            connection = connection.get()
+        connection = connection or DEFAULT_CONNECTION
+        self.board_name = board_name
+        self.api_key = api_key or connection.api_key_v2
+        self.endpoint = endpoint or connection.endpoint
+        self.max_connections = max_connections
+        self.scheduler = scheduler or connection.scheduler
+
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = None
+
+        # BOARD NAME -> BOARD ID, BOARD ID -> LIST OF COLUMN DICTS, BOARD ID -> ColumnCodecRegistry
+        self.board_ids_cache = {}
+        self.columns_cache = {}
+        self.column_codecs_cache = {}
+
+        # CONCURRENT CACHE MISSES FOR THE BOARD LIST, THE SAME COLUMN LIST OR ITEM NAME SHARE ONE API REQUEST
+        self.single_flight = AsyncSingleFlight()
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Authorization': self.api_key, 'Content-Type': 'application/json'},
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT))
+        return self.session
+
+    async def close(self):
+        """
+        Closes the pooled HTTP session.
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def execute(self, query, cost=None, idempotent=True):
+        """
+        Sends a GraphQL document to the Monday API and returns its data.
+        The request waits for complexity budget and retryable failures (complexity budget, network, HTTP 429 and 5xx)
+        are retried as decided by the scheduler. Any other error is raised right away.
+        When the document selects the complexity field, the remaining budget it reports corrects the scheduler.
+        :param query: GraphQL document: str
+        :param cost: Estimated complexity of the request: int
+        :param idempotent: False for requests that must not be applied twice (e.g. creations). They are then only retried
+        when the API rejected them (see RequestScheduler.is_rejected): Boolean
+        :return: The 'data' part of the response: dict
+        """
+        session = await self._get_session()
+        metrics = self.scheduler.metrics
+        match = OPERATION_PATTERN.match(query)
+        operation = match.group(1) if match else 'graphql'
+        attempt = 0
+        while True:
+            wait = self.scheduler.reserve(cost)
+            if wait > 0:
+                metrics.record_throttle(operation, wait)
+                await asyncio.sleep(wait)
+            try:
+                async with self.semaphore:
+                    start = time.perf_counter()
+                    try:
+                        async with session.post(self.endpoint, json={'query': query}) as response:
+                            status_code = response.status
+                            try:
+                                response_json = await response.json(content_type=None)
+                            except ValueError:
+                                # GATEWAY ERROR PAGES (E.G. AN HTML 502/ 504) ARE NOT JSON: THEY ARE REPORTED AS A SERVER ERROR
+                                raise MondayApiError(query, status_code if status_code >= 500 else 503, [f'Invalid JSON response (HTTP {status_code})'])
+                    finally:
+                        duration = time.perf_counter() - start
+                errors = response_json.get('errors') or []
+                if status_code < 400 and not errors:
+                    metrics.record_call(operation, duration)
+                    self.scheduler.report_complexity(response_json.get('data'))
+                    return response_json.get('data')
+                raise MondayApiError(query, status_code, errors or [response_json.get('error_message', f'HTTP {status_code}')])
+            except (aiohttp.ClientError, asyncio.TimeoutError, MondayApiError) as e:
+                metrics.record_call(operation, duration, success=False)
+                # NETWORK ERRORS ARE REPORTED AS STATUS 503 SO THE SCHEDULER TREATS THEM AS TRANSIENT
+                error = e if isinstance(e, MondayApiError) else MondayApiError(query, 503, [str(e)])
+                if not self.scheduler.is_retryable(error):
+                    logger.error("Monday API request failed and will not be retried. ERROR DETAILS: %s", error.messages)
+                    raise error
+                if not idempotent and not self.scheduler.is_rejected(error):
+                    logger.error("Monday API request failed and will not be retried, as it may have been applied. ERROR DETAILS: %s", error.messages)
+                    raise error
+                attempt = attempt + 1
+                if attempt > self.scheduler.max_retries:
+                    logger.error("Monday API request failed after %s retries. ERROR DETAILS: %s", self.scheduler.max_retries, error.messages)
+                    raise error
+                delay = self.scheduler.backoff_delay(attempt, error)
+                logger.warning("Monday API request failed (%s). Try #%s, will retry in %.1fs", error.messages, attempt, delay)
+                metrics.record_retry(operation, delay)
+                await asyncio.sleep(delay)
+
+    # BOARDS
+    # ======================================================================================================
+
+    async def get_list_of_existing_boards(self):
+        """
+        Gets a list of boards in all workspaces.
+        :return: List of board dicts with id and name: List
+        """
+        boards = []
+        page = 1
+        while True:
+            data = await self.execute(f"query {{ boards (limit: 500, page: {page}) {{ id name }} }}")
+            boards.extend(data['boards'])
+            if len(data['boards']) < 500:
+                return boards
+            page = page + 1
+
+    async def get_board_id(self, board_name=None):
+        """
+        Get's the board id of the board name passed.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: id of the board specified, or None if no board has that name: int
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        self.scheduler.metrics.record_cache("board", board_name in self.board_ids_cache)
+        if board_name in self.board_ids_cache:
+            return self.board_ids_cache[board_name]
+
+        for board in await self.single_flight.do("boards", self.get_list_of_existing_boards):
+            self.board_ids_cache.setdefault(board['name'], int(board['id']))
+
+        return self.board_ids_cache.get(board_name)
+
+    async def check_board_exists(self, board_name=None):
+        """
+        Checks if board with board name passed exists.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: Boolean
+        """
+        return await self.get_board_id(board_name) is not None
+
+    async def new_board(self, board_name=None):
+        """
+        Makes a new board with name passed into the method.
+        If the board with the name exists, the id of the existing board is returned.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: id of the board (existing or created): int
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        existing_board_id = await self.get_board_id(board_name)
+        if existing_board_id is not None:
+            logger.info("Not making board for '%s'. Will return id of existing board with same name. Id: %s", board_name, existing_board_id)
+            return existing_board_id
+
+        data = await self.execute(f"mutation {{ create_board (board_name: {graphql_string(board_name)}, board_kind: public) {{ id }} }}", idempotent=False)
+        board_id = int(data['create_board']['id'])
+        logger.info("New board created with id %s", board_id)
+        self.board_ids_cache[board_name] = board_id
+        return board_id
+
+    # COLUMNS
+    # ======================================================================================================
+
+    async def get_columns_in_single_board(self, board_name=None):
+        """
+        Gets a list of all columns in the board with the name passed.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: List of column dicts with id, title, type and settings_str: List
+        """
+        board_id = await self.get_board_id(board_name)
+        if board_id is None:
+            return []
+
+        self.scheduler.metrics.record_cache("column", board_id in self.columns_cache)
+        if board_id not in self.columns_cache:
+            data = await self.single_flight.do(("columns", board_id), self.execute, f"query {{ boards (ids: [{board_id}]) {{ columns {{ id title type settings_str }} }} }}")
+            self.columns_cache[board_id] = data['boards'][0]['columns']
+        return self.columns_cache[board_id]
+
+    async def get_column_codecs(self, board_name=None):
+        """
+        Returns the column codec registry of a board, built once from its column list.
+        :param board_name: str
+        :return: ColumnCodecRegistry
+        """
+        board_id = await self.get_board_id(board_name)
+        self.scheduler.metrics.record_cache("column_codec", board_id in self.column_codecs_cache)
+        if board_id not in self.column_codecs_cache:
+            self.column_codecs_cache[board_id] = ColumnCodecRegistry(await self.get_columns_in_single_board(board_name))
+        return self.column_codecs_cache[board_id]
+
+    async def get_column_id_by_name(self, col_name, board_name=None):
+        """
+        Gets the id of a column whose name is passed into the method.
+        :param col_name: str
+        :param board_name: str
+        :return: Id of the column specified: str
+        """
+        codec = (await self.get_column_codecs(board_name)).get(col_name)
+        return codec.id if codec else None
+
+    async def get_column_type_by_name(self, col_title, board_name=None):
+        """
+        Gets the column type using the column name/ title supplied.
+        :param col_title: str
+        :param board_name: str
+        :return: column type: str
+        """
+        codec = (await self.get_column_codecs(board_name)).get(col_title)
+        return codec.type if codec else None
+
+    async def get_column_settings_string_for_board(self, board_name=None, col_title="Status"):
+        """
+        Returns the label settings of a column.
+        :param board_name: str
+        :param col_title: str
+        :return: label settings: str
+        """
+        codec = (await self.get_column_codecs(board_name)).get(col_title)
+        return codec.settings_str if codec else None
+
+    async def add_column_to_board(self, column_title, board_name=None):
+        """
+        Add column to the board name passed. (Only implemented for columns of type long_text)
+        :param column_title: Title of column: str
+        :param board_name: str
+        :return: column id of the column added
+        """
+        board_id = await self.get_board_id(board_name)
+        data = await self.execute(f"mutation {{ create_column (board_id: {board_id}, title: {graphql_string(column_title)}, column_type: long_text) {{ id title type settings_str }} }}", idempotent=False)
+        column = data['create_column']
+        if board_id in self.columns_cache:
+            self.columns_cache[board_id].append(column)
+        self.column_codecs_cache.pop(board_id, None)
+        return column['id']
+
+    # ITEMS
+    # ======================================================================================================
+
+    async def get_items_in_single_board(self, board_name=None, page_size=500):
+        """
+        Gets a list of all items in the board passed to the method.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :param page_size: Number of items fetched per request: int
+        :return: List of item dicts with id, name and group id: List
+        """
+        board_id = await self.get_board_id(board_name)
+        item_fields = "id name group { id }"
+        data = await self.execute(f"query {{ complexity {{ query after reset_in_x_seconds }} boards (ids: [{board_id}]) {{ items_page (limit: {page_size}) {{ cursor items {{ {item_fields} }} }} }} }}")
+        page = data['boards'][0]['items_page']
+        items = list(page['items'])
+        while page['cursor']:
+            data = await self.execute(f"query {{ complexity {{ query after reset_in_x_seconds }} next_items_page (limit: {page_size}, cursor: {graphql_string(page['cursor'])}) {{ cursor items {{ {item_fields} }} }} }}")
+            page = data['next_items_page']
+            items.extend(page['items'])
+        logger.info("%s found.", len(items))
+        return items
+
+    async def _get_items_by_name(self, item_name, board_name=None):
+        board_id = await self.get_board_id(board_name)
+        if board_id is None:
+            return []
+        query = (f"query {{ items_page_by_column_values (board_id: {board_id}, limit: 500, "
+                 f"columns: [{{column_id: \"name\", column_values: [{graphql_string(item_name)}]}}]) "
+                 f"{{ items {{ id name group {{ id }} }} }} }}")
+        data = await self.single_flight.do(("items", board_id, item_name), self.execute, query)
+        return [item for item in data['items_page_by_column_values']['items'] if item['name'] == item_name]
+
+    async def get_specific_item_by_name(self, item_name, board_name=None):
+        """
+        Gets a specific item whose name is passed.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param item_name: str
+        :param board_name: str
+        :return: Item dict, or None if no item has that name: dict
+        """
+        items = await self._get_items_by_name(item_name, board_name)
+        if items:
+            return items[0]
+        logger.info("No item/task found with name '%s' in '%s'", item_name, board_name or self.board_name)
+        return None
+
+    async def check_item_exists(self, item_name, board_name=None):
+        """
+        Checks if item exists.
+        :param item_name: str
+        :param board_name: str
+        :return: Boolean
+        """
+        return await self.get_specific_item_by_name(item_name, board_name) is not None
+
+    async def get_item_id_by_name(self, item_name, board_name=None):
+        """
+        Gets the item id of the item whose name is passed.
+        :param item_name: str
+        :param board_name: str
+        :return: item id: int
+        """
+        item = await self.get_specific_item_by_name(item_name, board_name)
+        return int(item['id']) if item else None
+
+    async def add_new_item_to_board(self, item_name, board_name=None):
+        """
+        Adds a new item or task to a board. If an item with the same name exists, its id is returned.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param item_name: Name of the task/ item you want to add to the board.
+        :param board_name: str
+        :return: item id of the item added (or existing): int
+        """
+        existing_item_id = await self.get_item_id_by_name(item_name, board_name)
+        if existing_item_id is not None:
+            logger.info("Item with name '%s' already exists. Returning id of existing item", item_name)
+            return existing_item_id
+
+        board_id = await self.get_board_id(board_name)
+        try:
+            data = await self.execute(f"mutation {{ create_item (board_id: {board_id}, item_name: {graphql_string(item_name)}) {{ id name }} }}", idempotent=False)
+        except MondayApiError as e:
+            logger.error("Could not add new item %s. ERROR DETAILS: %s", item_name, e.messages)
+            return None
+        item_id = int(data['create_item']['id'])
+        logger.info("New item '%s' added with item ID %s", item_name, item_id)
+        return item_id
+
+    async def get_all_items_in_all_boards(self):
+        """
+        Gets a list of all items in all boards.
+        :return: List of item dicts: List
+        """
+        all_items = []
+        for board in await self.get_list_of_existing_boards():
+            all_items.extend(await self.get_items_in_single_board(board['name']))
+        return all_items
+
+    # COLUMN VALUES
+    # ======================================================================================================
+
+    async def _get_column_value(self, item_name, col_title, board_name=None):
+        item = await self.get_specific_item_by_name(item_name, board_name)
+        col_id = await self.get_column_id_by_name(col_title, board_name)
+        if item is None or col_id is None:
+            return None
+        data = await self.execute(f"query {{ items (ids: [{item['id']}]) {{ column_values (ids: [{graphql_string(col_id)}]) {{ id text value }} }} }}")
+        column_values = data['items'][0]['column_values']
+        return column_values[0] if column_values else None
+
+    async def get_value_of_column_for_item(self, item_name, col_title, board_name=None):
+        """
+        Get the value of a particular cell with the item name passed, column title passed and board name passed.
+        :param item_name: str
+        :param col_title: str
+        :param board_name: str
+        :return: text of the cell: str
+        """
+        column_value = await self._get_column_value(item_name, col_title, board_name)
+        return column_value['text'] if column_value else None
+
+    async def get_status_of_item(self, item_name, col_title="Status", board_name=None):
+        """
+        Gets the status label of an item.
+        :param item_name: str
+        :param col_title: str
+        :param board_name: str
+        :return: status of item: str
+        """
+        column_value = await self._get_column_value(item_name, col_title, board_name)
+        if column_value is None:
+            return None
+
+        codec = (await self.get_column_codecs(board_name)).get(col_title)
+        return codec.decode(column_value['value'], column_value['text'])
+
+    async def _compose_column_values(self, column_values, board_name=None):
+        composed = {}
+        for col_title, new_value in column_values.items():
+            if new_value is None:
+                continue
+            link_text = None
+            if isinstance(new_value, tuple):
+                new_value, link_text = new_value
+            codec = (await self.get_column_codecs(board_name)).get(col_title)
+            if codec is None:
+                logger.warning('No column "%s" found. Column will be skipped.', col_title)
+                continue
+            column_value = codec.encode(new_value, link_text=link_text)
+            if column_value is None:
+                logger.warning('Could not compose value for column "%s". Column will be skipped.', col_title)
+                continue
+            composed[column_value.id] = column_value.format()
+        return composed
+
+    async def update_item_columns(self, item_name, column_values, board_name=None):
+        """
+        Changes the values of several columns of one item in a single mutation.
+        For link columns, the value can be a tuple of (url, link text).
+        :param item_name: Name of item/ task: str
+        :param column_values: Mapping of column title to new value: dict
+        :param board_name: str
+        :return: The composed column values sent, or None if nothing was changed: dict
+        """
+        item = await self.get_specific_item_by_name(item_name, board_name)
+        if item is None:
+            logger.warning('Item "%s" not found. Column values will not be changed!', item_name)
+            return None
+
+        composed = await self._compose_column_values(column_values, board_name)
+        if not composed:
+            return None
+
+        board_id = await self.get_board_id(board_name)
+        try:
+            await self.execute(f"mutation {{ change_multiple_column_values (board_id: {board_id}, item_id: {item['id']}, column_values: {graphql_json(composed)}) {{ id }} }}")
+        except MondayApiError as e:
+            logger.error("Changing column values for item %s failed: DETAILS: %s", item_name, e.messages)
+            return None
+        return composed
+
+    async def change_value_of_column(self, item_name, col_title, new_value, board_name=None, link_text=None):
+        """
+        Changes the value of a column.
+        :param item_name: Name of item/ task: str
+        :param col_title: Name/ title of column: str
+        :param new_value: New value: Date values should be entered in the format. YYYY-MM-DD: str
+        :param board_name: Name of board: str
+        :param link_text: Text displayed for link columns: str
+        :return: The new value: str
+        """
+        if new_value is None:
+            return None
+
+        value = (new_value, link_text) if link_text else new_value
+        if await self.update_item_columns(item_name, {col_title: value}, board_name):
+            return new_value
+        return None
+
+    # GROUPS
+    # ======================================================================================================
+
+    async def move_item_to_group(self, item_name, group_name, board_name=None):
+        """
+        Moves an item with name specified to the group with the group name specified
+        :param item_name: item name: str
+        :param group_name: group name: str
+        :param board_name: str
+        :return: id of the moved item: int
+        """
+        board_id = await self.get_board_id(board_name)
+        item, data = await asyncio.gather(
+            self.get_specific_item_by_name(item_name, board_name),
+            self.execute(f"query {{ boards (ids: [{board_id}]) {{ groups {{ id title }} }} }}"))
+
+        group_ids = [group['id'] for group in data['boards'][0]['groups'] if group['title'] == group_name]
+        if item is None or not group_ids:
+            logger.error("Could not move item %s to group %s. Item or group not found.", item_name, group_name)
+            return None
+
+        try:
+            await self.execute(f"mutation {{ move_item_to_group (item_id: {item['id']}, group_id: {graphql_string(group_ids[0])}) {{ id }} }}")
+        except MondayApiError as e:
+            logger.error("Moving item to group failed! Item Name: %s. ERROR DETAILS: %s", item_name, e.messages)
+            return None
+
+        logger.info("Item %s successfully moved to group %s", item_name, group_name)
+        return int(item['id'])
+
+    # USERS
+    # ======================================================================================================
+
+    async def get_list_of_users(self):
+        """
+        Gets a list of users for the workspace
+        :return: List of user dicts with id, name, email and is_guest: List
+        """
+        data = await self.execute("query { users (kind: all) { id name email is_guest } }")
+        return data['users']
@@ -0,0 +1,1039 @@
+import ast
+import calendar
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import requests
+
+# DEFAULT LABELS OF A NEW STATUS COLUMN, SAME AS ON A NEW MONDAY.COM BOARD
+DEFAULT_STATUS_LABELS = {"0": "Working on it", "1": "Done", "2": "Stuck"}
+
+# COLUMN TYPE NAMES USED BY THE create_column MUTATION (ColumnType ENUM) -> COLUMN TYPE REPORTED BY THE API
+COLUMN_TYPES_BY_ENUM_NAME = {
+    "checkbox": "boolean",
+    "date": "date",
+    "dropdown": "dropdown",
+    "email": "email",
+    "link": "link",
+    "long_text": "long-text",
+    "numbers": "numeric",
+    "people": "multiple-person",
+    "status": "color",
+    "text": "text",
+}
+
+# PREFIX OF THE IDS GENERATED FOR NEW COLUMNS OF EACH TYPE
+COLUMN_ID_PREFIXES = {
+    "boolean": "check",
+    "color": "status",
+    "long-text": "long_text",
+    "multiple-person": "person",
+    "numeric": "numbers",
+}
+
+# STATIC COMPLEXITY MODEL: COST OF EACH FIELD, MULTIPLIED BY THE NUMBER OF OBJECTS A LIST FIELD CAN RETURN
+QUERY_FIELD_COMPLEXITY = 10
+MUTATION_COMPLEXITY = 30000
+DEFAULT_LIST_LIMIT = 25
+LIST_FIELDS = {"boards", "items", "items_by_column_values", "users", "column_values", "columns", "groups", "subscribers", "teams", "activity_logs"}
+# BODY OF THE ERRORS SERVED BY A GATEWAY IN FRONT OF THE API: IT IS NOT JSON
+GATEWAY_ERROR_PAGE = "<html><head><title>502 Bad Gateway</title></head><body><h1>502 Bad Gateway</h1></body></html>"
+
+
+class FakeMondayError(Exception):
+    """
+    Error returned to the client in the 'errors' list of a GraphQL response.
+    """
+
+    def __init__(self, message, code="InvalidArgumentException"):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class FakeMondayResponseLost(Exception):
+    """
+    Raised by handle_http_body when the request was applied but its response must not reach the client
+    (see FakeMonday.inject_lost_responses).
+    """
+
+
+class GraphQLField:
+    """
+    A field of a parsed GraphQL document: alias, name, arguments and the fields selected from its result.
+    """
+
+    def __init__(self, name, alias=None, arguments=None, selections=None):
+        self.name = name
+        self.alias = alias or name
+        self.arguments = arguments or {}
+        self.selections = selections or []
+
+
+class GraphQLParser:
+    """
+    Minimal parser for the GraphQL documents sent by moncli and by the wrappers.
+    Supports query/ mutation operations, aliases, arguments (strings, numbers, booleans, enums, lists,
+    objects and variables) and nested selections. Fragments and directives are not supported.
+    """
+
+    TOKEN_PATTERN = re.compile(r'''
+        (?P<ignored>[\s,]+|\#[^\n]*)
+        |(?P<punct>[{}()\[\]:!=])
+        |(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+        |(?P<variable>\$[A-Za-z_][A-Za-z0-9_]*)
+        |(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    ''', re.VERBOSE)
+
+    def __init__(self, document, variables=None):
+        self.tokens = self._tokenize(document)
+        self.position = 0
+        self.variables = variables or {}
+
+    def _tokenize(self, document):
+        tokens = []
+        position = 0
+        while position < len(document):
+            match = self.TOKEN_PATTERN.match(document, position)
+            if match is None:
+                raise FakeMondayError(f"Parse error on \"{document[position:position + 20]}\"", "ParseError")
+            position = match.end()
+            if match.lastgroup != "ignored":
+                tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        return tokens
+
+    def _peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def _next(self):
+        token = self._peek()
+        if token[0] is None:
+            raise FakeMondayError("Parse error on end of document", "ParseError")
+        self.position += 1
+        return token
+
+    def _expect(self, value):
+        kind, token = self._next()
+        if token != value:
+            raise FakeMondayError(f"Parse error on \"{token}\", expected \"{value}\"", "ParseError")
+
+    def parse(self):
+        """
+        :return: Operation type ('query' or 'mutation') and the list of root fields: tuple
+        """
+        operation = "query"
+        kind, token = self._peek()
+        if kind == "name" and token in ("query", "mutation"):
+            operation = token
+            self._next()
+            if self._peek()[0] == "name":
+                self._next()
+            if self._peek()[1] == "(":
+                self._skip_variable_definitions()
+        selections = self._parse_selections()
+        return operation, selections
+
+    def _skip_variable_definitions(self):
+        depth = 0
+        while True:
+            kind, token = self._next()
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _parse_selections(self):
+        self._expect("{")
+        selections = []
+        while self._peek()[1] != "}":
+            selections.append(self._parse_field())
+        self._expect("}")
+        return selections
+
+    def _parse_field(self):
+        kind, name = self._next()
+        if kind != "name":
+            raise FakeMondayError(f"Parse error on \"{name}\"", "ParseError")
+        alias = None
+        if self._peek()[1] == ":":
+            self._next()
+            alias = name
+            kind, name = self._next()
+
+        arguments = {}
+        if self._peek()[1] == "(":
+            self._next()
+            while self._peek()[1] != ")":
+                kind, argument_name = self._next()
+                self._expect(":")
+                arguments[argument_name] = self._parse_value()
+            self._next()
+
+        selections = []
+        if self._peek()[1] == "{":
+            selections = self._parse_selections()
+        return GraphQLField(name, alias, arguments, selections)
+
+    def _parse_value(self):
+        kind, token = self._next()
+        if kind == "string":
+            if token.startswith("'"):
+                # PYTHON REPR OF STRING LISTS, AS FORMATTED BY MONCLI LIST ARGUMENTS
+                return ast.literal_eval(token)
+            return json.loads(token)
+        if kind == "number":
+            return float(token) if any(char in token for char in ".eE") else int(token)
+        if kind == "variable":
+            return self.variables.get(token[1:])
+        if kind == "name":
+            if token == "true":
+                return True
+            if token == "false":
+                return False
+            if token == "null":
+                return None
+            # ENUM VALUES ARE KEPT AS THEIR NAME
+            return token
+        if token == "[":
+            values = []
+            while self._peek()[1] != "]":
+                values.append(self._parse_value())
+            self._next()
+            return values
+        if token == "{":
+            values = {}
+            while self._peek()[1] != "}":
+                kind, key = self._next()
+                self._expect(":")
+                values[key] = self._parse_value()
+            self._next()
+            return values
+        raise FakeMondayError(f"Parse error on \"{token}\"", "ParseError")
+
+
+class FakeMondayStats:
+    """
+    Counters of the traffic served by a FakeMonday instance.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Sets all the counters back to zero.
+        """
+        self.round_trips = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.complexity = 0
+        self.errors = 0
+        self.operations = {}
+
+    def as_dict(self):
+        """
+        :return: Copy of the counters: dict
+        """
+        return {
+            "round_trips": self.round_trips,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "complexity": self.complexity,
+            "errors": self.errors,
+            "operations": dict(self.operations),
+        }
+
+
+class FakeMonday:
+    """
+    In-memory stand-in for the monday.com GraphQL API v2 (boards, columns, groups, items and users).
+    It serves the queries generated by moncli as well as the raw queries of the wrappers (aliased mutations,
+    items_page cursors, complexity), and can inject latency, complexity budget errors, server errors, gateway error pages and lost responses.
+
+    It can be used in-process, by patching the requests transport (install()/ uninstall() or as a context manager),
+    or over HTTP with serve() for clients that do not use requests (e.g. the aiohttp based AsyncMondayWrapper).
+    Bytes are counted on the encoded request and response bodies.
+    """
+
+    ENDPOINT_PREFIX = "https://api.monday.com/"
+
+    def __init__(self, me_email="made_up_user@email.com", complexity_budget=5000000, budget_window=60, latency=0.0, latency_jitter=0.0, seed=None):
+        """
+        :param me_email: Email of the account owner returned by the 'me' query. moncli checks it against the user name passed to MondayClient: str
+        :param complexity_budget: Complexity budget of the account, reset every budget window: int
+        :param budget_window: Length of the budget window in seconds: int
+        :param latency: Seconds added to each request: float
+        :param latency_jitter: Random seconds (0 to this value) added to each request on top of latency: float
+        :param seed: Seed of the random generator used for jitter and random error injection
+        """
+        self.lock = threading.RLock()
+        self.random = random.Random(seed)
+        self.stats = FakeMondayStats()
+
+        self.complexity_budget = complexity_budget
+        self.budget_window = budget_window
+        self.budget_remaining = complexity_budget
+        self.budget_reset_at = time.time() + budget_window
+
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.complexity_error_rate = 0.0
+        self.injected_errors = []
+        self.lost_responses = 0
+
+        self.boards = {}
+        self.items = {}
+        self.users = {}
+        self.cursors = {}
+        self.next_id = 1000
+
+        self.me_id = self.add_user("Account Owner", me_email)
+
+        self._original_request = None
+        self._http_server = None
+
+    # ---------------------------------------------------------------------------------------------
+    # SEEDING
+    # ---------------------------------------------------------------------------------------------
+
+    def _new_id(self):
+        self.next_id += 1
+        return self.next_id
+
+    def add_user(self, name, email, is_guest=False):
+        """
+        :param name: str
+        :param email: str
+        :param is_guest: Boolean
+        :return: Id of the new user: int
+        """
+        with self.lock:
+            user_id = self._new_id()
+            self.users[user_id] = {"id": user_id, "name": name, "email": email, "is_guest": is_guest}
+            return user_id
+
+    def add_board(self, name, columns=None, groups=None, board_kind="public"):
+        """
+        Adds a board with a name column, the columns passed (or a default Status and Date column) and the groups passed
+        (or a default group).
+        :param name: str
+        :param columns: List of (title, column type) or (title, column type, status labels) tuples. Column types are the API types (color, text, numeric, long-text, date, link ...): List
+        :param groups: List of group titles: List
+        :param board_kind: str
+        :return: Id of the new board: int
+        """
+        with self.lock:
+            board_id = self._new_id()
+            self.boards[board_id] = {
+                "id": board_id,
+                "name": name,
+                "board_kind": board_kind,
+                "description": None,
+                "state": "active",
+                "columns": [{"id": "name", "title": "Name", "type": "name", "settings_str": "{}"}],
+                "groups": [],
+                "item_ids": [],
+                "activity_logs": [],
+            }
+            if columns is None:
+                columns = [("Status", "color"), ("Date", "date")]
+            for column in columns:
+                self.add_column(board_id, *column)
+            for group_title in groups or ["Group Title"]:
+                self.add_group(board_id, group_title)
+            return board_id
+
+    def add_column(self, board_id, title, column_type, labels=None):
+        """
+        :param board_id: int
+        :param title: str
+        :param column_type: Column type as reported by the API (color, text, numeric ...): str
+        :param labels: Labels of a status (color) column, mapping index to label. Defaults to the monday.com default labels: dict
+        :return: Id of the new column: str
+        """
+        with self.lock:
+            board = self._get_board(board_id)
+            prefix = COLUMN_ID_PREFIXES.get(column_type, column_type.replace("-", "_"))
+            existing_ids = {column["id"] for column in board["columns"]}
+            column_id = prefix
+            counter = 0
+            while column_id in existing_ids:
+                counter += 1
+                column_id = f"{prefix}{counter}"
+
+            settings = {}
+            if column_type == "color":
+                settings = {"labels": {str(index): label for index, label in (labels or DEFAULT_STATUS_LABELS).items()}}
+            board["columns"].append({"id": column_id, "title": title, "type": column_type, "settings_str": json.dumps(settings)})
+            return column_id
+
+    def add_group(self, board_id, title):
+        """
+        :param board_id: int
+        :param title: str
+        :return: Id of the new group: str
+        """
+        with self.lock:
+            board = self._get_board(board_id)
+            group_id = "topics" if not board["groups"] else f"group_{self._new_id()}"
+            board["groups"].append({"id": group_id, "title": title, "color": "#579bfc", "position": str(len(board["groups"]))})
+            return group_id
+
+    def add_item(self, board_id, name, group_id=None, column_values=None):
+        """
+        :param board_id: int
+        :param name: str
+        :param group_id: Id of the group. Defaults to the first group of the board: str
+        :param column_values: Mapping of column id or column title to value, in the format accepted by change_multiple_column_values: dict
+        :return: Id of the new item: int
+        """
+        with self.lock:
+            board = self._get_board(board_id)
+            if group_id is None:
+                group_id = board["groups"][0]["id"]
+            elif not any(group["id"] == group_id for group in board["groups"]):
+                raise FakeMondayError(f"Group {group_id} not found in board {board_id}", "ResourceNotFoundException")
+
+            item_id = self._new_id()
+            now = time.time()
+            self.items[item_id] = {"id": item_id, "name": name, "board_id": board_id, "group_id": group_id, "state": "active",
+                                   "created_at": now, "updated_at": now, "values": {}}
+            board["item_ids"].append(item_id)
+            for column_ref, value in (column_values or {}).items():
+                self._set_column_value(self.items[item_id], self._get_column(board, column_ref), value)
+            self._log_activity(self.items[item_id], "create_pulse")
+            return item_id
+
+    def get_item_values(self, item_id):
+        """
+        :param item_id: int
+        :return: Mapping of column title to column text for the item: dict
+        """
+        with self.lock:
+            item = self._get_item(item_id)
+            board = self._get_board(item["board_id"])
+            return {column["title"]: self._column_text(column, item) for column in board["columns"]}
+
+    # ---------------------------------------------------------------------------------------------
+    # FAULT INJECTION
+    # ---------------------------------------------------------------------------------------------
+
+    def inject_complexity_errors(self, count=1, reset_in=0):
+        """
+        Makes the next requests fail with a complexity budget error.
+        :param count: Number of requests to fail: int
+        :param reset_in: Seconds until the budget reset reported in the error message: int
+        """
+        with self.lock:
+            self.injected_errors.extend([("complexity", reset_in)] * count)
+
+    def inject_server_errors(self, count=1, status_code=500):
+        """
+        Makes the next requests fail with an HTTP error.
+        :param count: Number of requests to fail: int
+        :param status_code: HTTP status code of the failures: int
+        """
+        with self.lock:
+            self.injected_errors.extend([("http", status_code)] * count)
+
+    def inject_gateway_errors(self, count=1, status_code=502):
+        """
+        Makes the next requests fail with an HTML error page, as served by a gateway in front of the API.
+        :param count: Number of requests to fail: int
+        :param status_code: HTTP status code of the failures: int
+        """
+        with self.lock:
+            self.injected_errors.extend([("gateway", status_code)] * count)
+
+    def inject_lost_responses(self, count=1):
+        """
+        Makes the next requests be applied but their responses lost, as when the connection times out after the API
+        committed the request. In-process the client gets a requests.ReadTimeout, over HTTP the connection is closed
+        without a response.
+        :param count: Number of responses to lose: int
+        """
+        with self.lock:
+            self.lost_responses += count
+
+    # ---------------------------------------------------------------------------------------------
+    # TRANSPORT
+    # ---------------------------------------------------------------------------------------------
+
+    def install(self):
+        """
+        Routes every requests call to the monday.com API to this instance. Other urls are not affected.
+        :return: self
+        """
+        if self._original_request is not None:
+            return self
+        original_request = requests.Session.request
+        fake = self
+
+        def request(session, method, url, *args, **kwargs):
+            if not str(url).startswith(fake.ENDPOINT_PREFIX):
+                return original_request(session, method, url, *args, **kwargs)
+            return fake._handle_requests_call(method, url, **kwargs)
+
+        self._original_request = original_request
+        requests.Session.request = request
+        return self
+
+    def uninstall(self):
+        """
+        Restores the real requests transport.
+        """
+        if self._original_request is not None:
+            requests.Session.request = self._original_request
+            self._original_request = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.uninstall()
+
+    def _handle_requests_call(self, method, url, **kwargs):
+        prepared = requests.Request(method, url, headers=kwargs.get("headers"), data=kwargs.get("data"), json=kwargs.get("json"), params=kwargs.get("params")).prepare()
+        try:
+            status_code, body = self.handle_http_body(prepared.body, prepared.headers.get("Content-Type"))
+        except FakeMondayResponseLost as e:
+            raise requests.ReadTimeout(str(e), request=prepared)
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response.url = url
+        response.request = prepared
+        return response
+
+    def serve(self, host="127.0.0.1", port=0):
+        """
+        Serves the fake API over HTTP in a background thread.
+        :param host: str
+        :param port: Port to listen on. 0 picks a free port: int
+        :return: Url of the GraphQL endpoint: str
+        """
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    status_code, response_body = fake.handle_http_body(body, self.headers.get("Content-Type"))
+                except FakeMondayResponseLost:
+                    self.close_connection = True
+                    return
+                self.send_response(status_code)
+                self.send_header("Content-Type", "text/html" if response_body.startswith(b"<") else "application/json")
+                self.send_header("Content-Length", str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+            def log_message(self, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._http_server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._http_server.server_address[1]}/v2"
+
+    def shutdown(self):
+        """
+        Stops the HTTP server started by serve().
+        """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def handle_http_body(self, body, content_type=None):
+        """
+        Serves one HTTP request to the GraphQL endpoint.
+        :param body: Request body, JSON or form encoded (moncli posts form encoded bodies): bytes
+        :param content_type: Content type of the request: str
+        :return: HTTP status code and response body: tuple
+        :raises FakeMondayResponseLost: When the response is lost (see inject_lost_responses)
+        """
+        if body is None:
+            body = b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        if content_type and "json" in content_type:
+            payload = json.loads(body.decode("utf-8") or "{}")
+        else:
+            form = parse_qs(body.decode("utf-8"))
+            payload = {"query": form.get("query", [""])[0], "variables": form.get("variables", [None])[0]}
+        variables = payload.get("variables")
+        if isinstance(variables, str):
+            variables = json.loads(variables) if variables and variables != "None" else None
+
+        delay = self.latency + (self.random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+        with self.lock:
+            status_code, response = self._handle_payload(payload.get("query") or "", variables)
+            response_body = response.encode("utf-8") if isinstance(response, str) else json.dumps(response).encode("utf-8")
+            self.stats.round_trips += 1
+            self.stats.bytes_sent += len(body)
+            self.stats.bytes_received += len(response_body)
+            if status_code >= 400 or isinstance(response, dict) and "errors" in response:
+                self.stats.errors += 1
+            lost = self.lost_responses > 0
+            if lost:
+                self.lost_responses -= 1
+        if lost:
+            raise FakeMondayResponseLost("The request was applied but its response was lost")
+        return status_code, response_body
+
+    # ---------------------------------------------------------------------------------------------
+    # GRAPHQL EXECUTION
+    # ---------------------------------------------------------------------------------------------
+
+    def _refill_budget(self):
+        now = time.time()
+        if now >= self.budget_reset_at:
+            self.budget_remaining = self.complexity_budget
+            self.budget_reset_at = now + self.budget_window
+
+    def _budget_error(self, cost, reset_in):
+        message = (f"Complexity budget exhausted, query cost {cost} budget remaining {max(self.budget_remaining, 0)} "
+                   f"out of {self.complexity_budget} reset in {reset_in} seconds")
+        return 200, {"errors": [{"message": message, "extensions": {"code": "ComplexityException"}}], "account_id": 1}
+
+    def _handle_payload(self, query, variables):
+        try:
+            operation, fields = GraphQLParser(query, variables).parse()
+        except FakeMondayError as e:
+            return 200, {"errors": [{"message": e.message, "extensions": {"code": e.code}}]}
+
+        for field in fields:
+            self.stats.operations[field.name] = self.stats.operations.get(field.name, 0) + 1
+
+        self._refill_budget()
+        cost = self._estimate_complexity(fields, operation == "mutation")
+
+        if self.injected_errors:
+            kind, detail = self.injected_errors.pop(0)
+            if kind == "complexity":
+                return self._budget_error(cost, detail)
+            if kind == "gateway":
+                return detail, GATEWAY_ERROR_PAGE
+            return detail, {"error_message": "Internal server error", "status_code": detail}
+        if self.complexity_error_rate and self.random.random() < self.complexity_error_rate:
+            return self._budget_error(cost, 0)
+        if cost > self.budget_remaining:
+            return self._budget_error(cost, max(int(self.budget_reset_at - time.time()), 0))
+
+        before = self.budget_remaining
+        self.budget_remaining -= cost
+        self.stats.complexity += cost
+        complexity = {"before": before, "query": cost, "after": self.budget_remaining,
+                      "reset_in_x_seconds": max(int(self.budget_reset_at - time.time()), 0)}
+
+        data = {}
+        errors = []
+        for field in fields:
+            try:
+                if field.name == "complexity":
+                    value = complexity
+                else:
+                    resolver = getattr(self, f"_{operation}_{field.name}", None)
+                    if resolver is None:
+                        raise FakeMondayError(f"Field '{field.name}' doesn't exist on type '{operation.capitalize()}'", "undefinedField")
+                    value = resolver(**field.arguments)
+                data[field.alias] = self._project(value, field)
+            except FakeMondayError as e:
+                data[field.alias] = None
+                errors.append({"message": e.message, "path": [field.alias], "extensions": {"code": e.code}})
+
+        response = {"data": data, "account_id": 1}
+        if errors:
+            response["errors"] = errors
+        return 200, response
+
+    def _estimate_complexity(self, fields, is_mutation):
+        def field_cost(field):
+            children = sum(field_cost(child) for child in field.selections)
+            multiplier = 1
+            if field.name in LIST_FIELDS or field.name.startswith("items_page") or field.name == "next_items_page":
+                multiplier = field.arguments.get("limit") or len(field.arguments.get("ids") or []) or DEFAULT_LIST_LIMIT
+            return QUERY_FIELD_COMPLEXITY + multiplier * children
+
+        total = 0
+        for field in fields:
+            if field.name == "complexity":
+                continue
+            total += MUTATION_COMPLEXITY if is_mutation else field_cost(field)
+        return total
+
+    def _project(self, value, field):
+        if callable(value):
+            value = value(**field.arguments)
+        if not field.selections or value is None:
+            return value
+        if isinstance(value, list):
+            return [self._project_object(element, field.selections) for element in value]
+        return self._project_object(value, field.selections)
+
+    def _project_object(self, view, selections):
+        result = {}
+        for selection in selections:
+            if selection.name == "__typename":
+                result[selection.alias] = view["__typename"]
+                continue
+            if selection.name not in view:
+                raise FakeMondayError(f"Field '{selection.name}' doesn't exist on type '{view['__typename']}'", "undefinedField")
+            result[selection.alias] = self._project(view[selection.name], selection)
+        return result
+
+    # ---------------------------------------------------------------------------------------------
+    # LOOKUPS AND VIEWS
+    # ---------------------------------------------------------------------------------------------
+
+    def _get_board(self, board_id):
+        board = self.boards.get(int(board_id))
+        if board is None:
+            raise FakeMondayError(f"Board {board_id} not found", "ResourceNotFoundException")
+        return board
+
+    def _get_item(self, item_id):
+        item = self.items.get(int(item_id))
+        if item is None:
+            raise FakeMondayError(f"Item {item_id} not found", "ResourceNotFoundException")
+        return item
+
+    @staticmethod
+    def _get_column(board, column_ref):
+        for column in board["columns"]:
+            if column["id"] == column_ref:
+                return column
+        for column in board["columns"]:
+            if column["title"] == column_ref:
+                return column
+        raise FakeMondayError(f"Column {column_ref} not found in board {board['id']}", "ResourceNotFoundException")
+
+    @staticmethod
+    def _page(values, limit=None, page=None, default_limit=DEFAULT_LIST_LIMIT):
+        limit = limit or default_limit
+        page = page or 1
+        return values[(page - 1) * limit:page * limit]
+
+    def _board_view(self, board):
+        return {
+            "__typename": "Board",
+            "id": str(board["id"]),
+            "name": board["name"],
+            "board_folder_id": None,
+            "board_kind": board["board_kind"],
+            "description": board["description"],
+            "state": board["state"],
+            "permissions": "everyone",
+            "pos": None,
+            "owner": {"__typename": "User", "id": str(self.me_id)},
+            "columns": lambda ids=None, **kwargs: [self._column_view(board, column) for column in board["columns"] if ids is None or column["id"] in ids],
+            "groups": lambda ids=None, **kwargs: [self._group_view(board, group) for group in board["groups"] if ids is None or group["id"] in ids],
+            "items": lambda limit=None, page=None, **kwargs: [self._item_view(self.items[item_id]) for item_id in (self._page(board["item_ids"], limit, page) if limit else board["item_ids"])],
+            # LIKE THE API, ITEMS PAGES ONLY LIST THE ACTIVE ITEMS
+            "items_page": lambda limit=None, cursor=None, **kwargs: self._items_page(self._active_item_ids(board), limit),
+            # "FROM" IS A PYTHON KEYWORD, SO THE ARGUMENTS ARE READ FROM KWARGS
+            "activity_logs": lambda **kwargs: self._activity_logs(board, kwargs.get("from"), kwargs.get("to"), kwargs.get("limit"), kwargs.get("page")),
+        }
+
+    def _activity_logs(self, board, from_date=None, to_date=None, limit=None, page=None):
+        # NEWEST FIRST, FILTERED ON THE ISO 8601 'FROM' AND 'TO' DATES. CREATED_AT IS IN UNITS OF 100 NANOSECONDS, AS IN THE REAL API
+        logs = list(reversed(board["activity_logs"]))
+        if from_date:
+            logs = [log for log in logs if int(log["created_at"]) >= self._parse_timestamp(from_date) * 10 ** 7]
+        if to_date:
+            logs = [log for log in logs if int(log["created_at"]) <= self._parse_timestamp(to_date) * 10 ** 7]
+        return self._page(logs, limit, page, default_limit=25)
+
+    def _log_activity(self, item, event, **data):
+        board = self.boards[item["board_id"]]
+        log_data = {"board_id": item["board_id"], "pulse_id": item["id"], "pulse_name": item["name"]}
+        log_data.update(data)
+        board["activity_logs"].append({"__typename": "ActivityLogType", "id": "%032x" % self.random.getrandbits(128), "event": event,
+                                       "entity": "pulse", "account_id": "1", "user_id": str(self.me_id),
+                                       "created_at": str(int(time.time() * 10 ** 7)), "data": json.dumps(log_data)})
+
+    def _column_view(self, board, column):
+        return {"__typename": "Column", "id": column["id"], "title": column["title"], "type": column["type"],
+                "settings_str": column["settings_str"], "archived": False, "width": None, "description": None}
+
+    def _group_view(self, board, group):
+        return {"__typename": "Group", "id": group["id"], "title": group["title"], "color": group["color"],
+                "position": group["position"], "archived": False, "deleted": False,
+                "items": lambda **kwargs: [{"__typename": "Item", "id": str(item_id)} for item_id in board["item_ids"] if self.items[item_id]["group_id"] == group["id"]]}
+
+    def _item_view(self, item):
+        board = self.boards[item["board_id"]]
+        group = next((group for group in board["groups"] if group["id"] == item["group_id"]), None)
+        return {
+            "__typename": "Item",
+            "id": str(item["id"]),
+            "name": item["name"],
+            "state": item["state"],
+            "creator_id": str(self.me_id),
+            "created_at": self._timestamp(item["created_at"]),
+            "updated_at": self._timestamp(item["updated_at"]),
+            "board": lambda **kwargs: self._board_view(board),
+            "group": {"__typename": "Group", "id": group["id"], "title": group["title"]} if group else None,
+            "subscribers": [],
+            "column_values": lambda ids=None, **kwargs: [self._column_value_view(column, item) for column in board["columns"]
+                                                         if column["type"] != "name" and (ids is None or column["id"] in ids)],
+        }
+
+    def _column_value_view(self, column, item):
+        value = item["values"].get(column["id"])
+        return {"__typename": "ColumnValue", "id": column["id"], "title": column["title"], "type": column["type"],
+                "value": json.dumps(value) if value is not None else None, "text": self._column_text(column, item), "additional_info": None}
+
+    def _user_view(self, user):
+        return {"__typename": "User", "id": str(user["id"]), "name": user["name"], "email": user["email"], "url": f"https://fake.monday.com/users/{user['id']}",
+                "enabled": True, "is_guest": user["is_guest"], "is_pending": False, "birthday": None, "country_code": None,
+                "created_at": None, "join_date": None, "account": {"__typename": "Account", "id": "1", "name": "Fake account"}, "teams": []}
+
+    @staticmethod
+    def _timestamp(value):
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(value))
+
+    @staticmethod
+    def _parse_timestamp(value):
+        try:
+            return calendar.timegm(time.strptime(value[:19], "%Y-%m-%dT%H:%M:%S"))
+        except ValueError:
+            raise FakeMondayError(f"Invalid date: {value}", "InvalidArgumentException")
+
+    def _active_item_ids(self, board):
+        return [item_id for item_id in board["item_ids"] if self.items[item_id]["state"] == "active"]
+
+    def _items_page(self, item_ids, limit=None):
+        limit = limit or DEFAULT_LIST_LIMIT
+        page_ids, remaining = item_ids[:limit], item_ids[limit:]
+        cursor = None
+        if remaining:
+            cursor = f"cursor_{self._new_id()}"
+            self.cursors[cursor] = remaining
+        return {"__typename": "ItemsResponse", "cursor": cursor, "items": [self._item_view(self.items[item_id]) for item_id in page_ids if item_id in self.items]}
+
+    # ---------------------------------------------------------------------------------------------
+    # COLUMN VALUES
+    # ---------------------------------------------------------------------------------------------
+
+    def _column_text(self, column, item):
+        if column["type"] == "name":
+            return item["name"]
+        value = item["values"].get(column["id"])
+        if value is None:
+            return ""
+        if column["type"] == "color":
+            return json.loads(column["settings_str"])["labels"].get(str(value.get("index")), "")
+        if column["type"] in ("long-text",):
+            return value.get("text", "")
+        if column["type"] == "date":
+            return " ".join(part for part in (value.get("date"), value.get("time")) if part)
+        if column["type"] == "link":
+            return f"{value.get('text') or value.get('url')} - {value.get('url')}"
+        if column["type"] == "multiple-person":
+            names = [self.users[int(person["id"])]["name"] for person in value.get("personsAndTeams", []) if int(person["id"]) in self.users]
+            return ", ".join(names)
+        if isinstance(value, dict):
+            return value.get("text") or value.get("label") or json.dumps(value)
+        return str(value)
+
+    def _set_column_value(self, item, column, value):
+        if column["type"] == "name":
+            item["name"] = str(value)
+            return
+        if value is None or value == "" or value == {}:
+            item["values"].pop(column["id"], None)
+            return
+
+        column_type = column["type"]
+        if column_type == "color":
+            labels = json.loads(column["settings_str"])["labels"]
+            if isinstance(value, dict) and value.get("index") is not None:
+                index = str(value["index"])
+                if index not in labels:
+                    raise FakeMondayError(f"This status label index doesn't exist: {index}", "ColumnValueException")
+            else:
+                label = value.get("label") if isinstance(value, dict) else str(value)
+                index = next((key for key, existing in labels.items() if existing == label), None)
+                if index is None:
+                    raise FakeMondayError(f"This status label doesn't exist, possible statuses are: {labels}", "ColumnValueException")
+            value = {"index": int(index)}
+        elif column_type == "numeric":
+            try:
+                float(value)
+            except (TypeError, ValueError):
+                raise FakeMondayError(f"Invalid number value: {value}", "ColumnValueException")
+            value = str(value)
+        elif column_type == "long-text":
+            value = value if isinstance(value, dict) else {"text": str(value)}
+        elif column_type == "date":
+            value = value if isinstance(value, dict) else {"date": str(value)}
+        elif column_type == "link":
+            if not isinstance(value, dict):
+                url, _, text = str(value).partition(" ")
+                value = {"url": url, "text": text or url}
+        elif column_type == "text":
+            value = str(value)
+
+        item["values"][column["id"]] = value
+        item["updated_at"] = time.time()
+
+    # ---------------------------------------------------------------------------------------------
+    # QUERIES
+    # ---------------------------------------------------------------------------------------------
+
+    def _query_me(self, **kwargs):
+        return self._user_view(self.users[self.me_id])
+
+    def _query_boards(self, ids=None, limit=None, page=None, state=None, board_kind=None, newest_first=None, **kwargs):
+        boards = list(self.boards.values())
+        if ids:
+            boards = [self._get_board(board_id) for board_id in ids if int(board_id) in self.boards]
+        if newest_first:
+            boards.reverse()
+        return [self._board_view(board) for board in self._page(boards, limit, page)]
+
+    def _query_items(self, ids=None, limit=None, page=None, newest_first=None, **kwargs):
+        items = list(self.items.values())
+        if ids:
+            items = [self.items[int(item_id)] for item_id in ids if int(item_id) in self.items]
+        if newest_first:
+            items.reverse()
+        return [self._item_view(item) for item in self._page(items, limit, page)]
+
+    def _query_items_by_column_values(self, board_id, column_id, column_value, limit=None, page=None, **kwargs):
+        board = self._get_board(board_id)
+        column = self._get_column(board, column_id)
+        items = [self.items[item_id] for item_id in board["item_ids"] if self._column_text(column, self.items[item_id]) == column_value]
+        return [self._item_view(item) for item in self._page(items, limit, page, default_limit=len(items) or 1)]
+
+    def _query_items_page_by_column_values(self, board_id, columns=None, limit=None, cursor=None, **kwargs):
+        if cursor:
+            return self._query_next_items_page(cursor, limit)
+        board = self._get_board(board_id)
+        item_ids = self._active_item_ids(board)
+        for rule in columns or []:
+            column = self._get_column(board, rule["column_id"])
+            item_ids = [item_id for item_id in item_ids if self._column_text(column, self.items[item_id]) in rule["column_values"]]
+        return self._items_page(item_ids, limit)
+
+    def _query_next_items_page(self, cursor, limit=None, **kwargs):
+        item_ids = self.cursors.pop(cursor, None)
+        if item_ids is None:
+            raise FakeMondayError("CursorExpiredError: The cursor provided for pagination has expired", "CursorException")
+        return self._items_page(item_ids, limit)
+
+    def _query_users(self, ids=None, kind=None, limit=None, emails=None, **kwargs):
+        users = list(self.users.values())
+        if ids:
+            users = [user for user in users if user["id"] in [int(user_id) for user_id in ids]]
+        if emails:
+            users = [user for user in users if user["email"] in emails]
+        if kind == "guests":
+            users = [user for user in users if user["is_guest"]]
+        elif kind == "non_guests":
+            users = [user for user in users if not user["is_guest"]]
+        return [self._user_view(user) for user in self._page(users, limit, None, default_limit=len(users) or 1)]
+
+    # ---------------------------------------------------------------------------------------------
+    # MUTATIONS
+    # ---------------------------------------------------------------------------------------------
+
+    def _mutation_create_board(self, board_name, board_kind="public", **kwargs):
+        return self._board_view(self.boards[self.add_board(board_name, board_kind=board_kind)])
+
+    def _mutation_archive_board(self, board_id, **kwargs):
+        board = self._get_board(board_id)
+        board["state"] = "archived"
+        return self._board_view(board)
+
+    def _mutation_create_column(self, board_id, title, column_type, defaults=None, **kwargs):
+        board = self._get_board(board_id)
+        if isinstance(defaults, str):
+            defaults = json.loads(defaults)
+        labels = (defaults or {}).get("labels")
+        column_id = self.add_column(board["id"], title, COLUMN_TYPES_BY_ENUM_NAME.get(column_type, column_type), labels=labels)
+        return self._column_view(board, self._get_column(board, column_id))
+
+    def _mutation_create_group(self, board_id, group_name, **kwargs):
+        board = self._get_board(board_id)
+        group_id = self.add_group(board["id"], group_name)
+        return self._group_view(board, next(group for group in board["groups"] if group["id"] == group_id))
+
+    def _mutation_create_item(self, board_id, item_name, group_id=None, column_values=None, **kwargs):
+        if isinstance(column_values, str):
+            column_values = json.loads(column_values)
+        return self._item_view(self.items[self.add_item(board_id, item_name, group_id, column_values)])
+
+    def _mutation_change_column_value(self, item_id, column_id, value, board_id=None, **kwargs):
+        item = self._get_item(item_id)
+        value = json.loads(value) if isinstance(value, str) else value
+        column = self._get_column(self.boards[item["board_id"]], column_id)
+        self._set_column_value(item, column, value)
+        self._log_column_change(item, column)
+        return self._item_view(item)
+
+    def _mutation_change_simple_column_value(self, item_id, column_id, value, board_id=None, **kwargs):
+        item = self._get_item(item_id)
+        column = self._get_column(self.boards[item["board_id"]], column_id)
+        self._set_column_value(item, column, value)
+        self._log_column_change(item, column)
+        return self._item_view(item)
+
+    def _mutation_change_multiple_column_values(self, item_id, column_values, board_id=None, **kwargs):
+        item = self._get_item(item_id)
+        board = self.boards[item["board_id"]]
+        if isinstance(column_values, str):
+            column_values = json.loads(column_values)
+        for column_id, value in column_values.items():
+            column = self._get_column(board, column_id)
+            self._set_column_value(item, column, value)
+            self._log_column_change(item, column)
+        return self._item_view(item)
+
+    def _log_column_change(self, item, column):
+        if column["type"] == "name":
+            self._log_activity(item, "update_name")
+        else:
+            self._log_activity(item, "update_column_value", column_id=column["id"], column_title=column["title"])
+
+    def _mutation_move_item_to_group(self, item_id, group_id, **kwargs):
+        item = self._get_item(item_id)
+        if not any(group["id"] == group_id for group in self.boards[item["board_id"]]["groups"]):
+            raise FakeMondayError(f"Group {group_id} not found", "ResourceNotFoundException")
+        item["group_id"] = group_id
+        item["updated_at"] = time.time()
+        self._log_activity(item, "move_pulse_into_group", dest_group_id=group_id)
+        return self._item_view(item)
+
+    def _mutation_archive_item(self, item_id, **kwargs):
+        item = self._get_item(item_id)
+        item["state"] = "archived"
+        self._log_activity(item, "archive_pulse")
+        return self._item_view(item)
+
+    def _mutation_delete_item(self, item_id, **kwargs):
+        item = self._get_item(item_id)
+        view = self._item_view(item)
+        item["state"] = "deleted"
+        self._log_activity(item, "delete_pulse")
+        self.boards[item["board_id"]]["item_ids"].remove(item["id"])
+        del self.items[item["id"]]
+        return view
@@ -0,0 +1,368 @@
+import argparse
+import itertools
+import json
+import logging
+import sys
+import time
+
+import MondayWrapper
+from FakeMondayServer import FakeMonday
+
+BENCHMARK_BOARD = "Benchmark Board"
+BENCHMARK_COLUMNS = [("Status", "color"), ("Notes", "long-text"), ("Task Weight", "numeric"), ("Text", "text"), ("Date", "date"), ("Link", "link")]
+BENCHMARK_GROUPS = ["Group Title", "Done"]
+
+# THE FAKE AND THE SCHEDULER GET A BUDGET LARGE ENOUGH THAT NO BENCHMARK EVER WAITS FOR A BUDGET RESET
+UNLIMITED_COMPLEXITY_BUDGET = 10 ** 12
+
+
+class BenchmarkResult:
+    """
+    Round trips, bytes and wall time measured for one benchmark case.
+    """
+
+    def __init__(self, name, round_trips, bytes_sent, bytes_received, wall_time, operations=None, error=None):
+        self.name = name
+        self.round_trips = round_trips
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.wall_time = wall_time
+        self.operations = operations or {}
+        self.error = error
+
+    def as_dict(self):
+        return {
+            "round_trips": self.round_trips,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "wall_time": round(self.wall_time, 4),
+            "operations": self.operations,
+            "error": self.error,
+        }
+
+
+class MondayBenchmark:
+    """
+    Benchmark suite for MondayWrapper run against the in-memory FakeMonday API.
+    Reports the number of API round trips, the bytes sent/ received and the wall time of every public
+    MondayWrapper method and of bulk scenarios (e.g. updating 1,000 rows x 5 columns).
+    Round trip counts are deterministic, so they can be compared to a baseline to catch regressions.
+    """
+
+    def __init__(self, item_count=100, latency=0.0):
+        """
+        :param item_count: Number of items on the board used by the method benchmarks: int
+        :param latency: Seconds of simulated network latency added to each request: float
+        """
+        self.fake = FakeMonday(me_email=MondayWrapper.USER_NAME, complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, latency=latency)
+        self.fake.install()
+
+        self.module = MondayWrapper
+        # THE CLIENT IS CREATED (ONE API REQUEST) BEFORE ANY MEASUREMENT AND SHARED BY ALL THE WRAPPERS
+        self.connection = MondayWrapper.MondayConnection()
+        self.connection.client
+
+        self.counter = itertools.count(1)
+        self.item_count = item_count
+        self.board_id = self._seed_board(BENCHMARK_BOARD, item_count)
+        self.fake.add_user("Guest User", "guest@email.com", is_guest=True)
+
+    def close(self):
+        """
+        Restores the real requests transport.
+        """
+        self.connection.close()
+        self.fake.uninstall()
+
+    def _seed_board(self, board_name, item_count):
+        board_id = self.fake.add_board(board_name, columns=BENCHMARK_COLUMNS, groups=BENCHMARK_GROUPS)
+        for index in range(item_count):
+            self.fake.add_item(board_id, f"Item {index}", column_values={"Status": "Working on it", "Text": f"Text {index}"})
+        return board_id
+
+    def new_wrapper(self, board_name=BENCHMARK_BOARD):
+        """
+        :param board_name: str
+        :return: A MondayWrapper with empty caches and a scheduler that does not throttle: MondayWrapper
+        """
+        scheduler = self.module.RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, backoff_base=0.01)
+        return self.module.MondayWrapper(board_name, scheduler=scheduler, connection=self.connection)
+
+    def measure(self, name, func):
+        """
+        Runs func and measures the API traffic it generates.
+        :param name: Name of the benchmark case: str
+        :param func: Function without arguments
+        :return: BenchmarkResult
+        """
+        self.fake.stats.reset()
+        error = None
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        wall_time = time.perf_counter() - start
+        stats = self.fake.stats
+        return BenchmarkResult(name, stats.round_trips, stats.bytes_sent, stats.bytes_received, wall_time, dict(stats.operations), error)
+
+    def method_cases(self):
+        """
+        One benchmark case per public MondayWrapper method. Each case runs on a wrapper with empty caches.
+        A case is either a function taking the wrapper, or a (setup, function) tuple when the method needs some state first.
+        The setup is not measured.
+        :return: Mapping of method name to case: dict
+        """
+        unique = lambda prefix: f"{prefix} {next(self.counter)}"
+
+        def batch_writer(wrapper):
+            writer = wrapper.batch_writer()
+            for index in range(10):
+                writer.change_columns(f"Item {index}", {"Status": "Done", "Text": "Batched"})
+            writer.execute()
+
+        def write_behind_changes(wrapper):
+            wrapper.get_column_codecs()
+            wrapper.enable_write_behind(max_delay=None)
+            for index in range(10):
+                wrapper.change_value_of_column(f"Item {index}", "Status", "Stuck")
+                wrapper.change_value_of_column(f"Item {index}", "Status", "Done")
+
+        def sync_rows(wrapper):
+            # ONE ROW IN TEN DIFFERS FROM THE BOARD
+            rows = [{"Name": f"Item {index}", "Status": "Working on it", "Text": "Synced" if index % 10 == 0 else f"Text {index}"} for index in range(self.item_count)]
+            wrapper.sync_rows(rows)
+
+        return {
+            "new_board": lambda wrapper: wrapper.new_board(unique("Benchmark New Board")),
+            "get_board_id": lambda wrapper: wrapper.get_board_id(),
+            "check_board_exists": lambda wrapper: wrapper.check_board_exists(),
+            "get_list_of_existing_boards": lambda wrapper: wrapper.get_list_of_existing_boards(),
+            "fan_out": lambda wrapper: wrapper.fan_out(lambda board_name: wrapper.get_board_id(board_name)),
+            "get_items_in_boards": lambda wrapper: wrapper.get_items_in_boards(),
+            "get_columns_in_boards": lambda wrapper: wrapper.get_columns_in_boards(),
+            "add_column_to_board": lambda wrapper: wrapper.add_column_to_board(unique("Benchmark Column")),
+            "ensure_schema": lambda wrapper: wrapper.ensure_schema(BENCHMARK_COLUMNS + [(unique("Schema Column"), "numeric"), (unique("Schema Status"), "color", ["New", "Open", "Closed"])],
+                                                               groups=BENCHMARK_GROUPS + [unique("Schema Group")]),
+            "get_columns_in_single_board": lambda wrapper: wrapper.get_columns_in_single_board(),
+            "get_column_codecs": lambda wrapper: wrapper.get_column_codecs(),
+            "get_column_settings_string_for_board": lambda wrapper: wrapper.get_column_settings_string_for_board(),
+            "get_column_id_by_name": lambda wrapper: wrapper.get_column_id_by_name("Text"),
+            "get_column_type_by_name": lambda wrapper: wrapper.get_column_type_by_name("Text"),
+            "add_new_item_to_board": lambda wrapper: wrapper.add_new_item_to_board(unique("Benchmark Item")),
+            "add_items": lambda wrapper: wrapper.add_items([unique("Bulk Item") for _ in range(20)], column_values={"Status": "Done"}),
+            "check_item_exists": lambda wrapper: wrapper.check_item_exists("Item 1"),
+            "get_specific_item_by_name": lambda wrapper: wrapper.get_specific_item_by_name("Item 1"),
+            "get_item_id_by_name": lambda wrapper: wrapper.get_item_id_by_name("Item 1"),
+            "get_items_in_single_board": lambda wrapper: wrapper.get_items_in_single_board(),
+            "get_all_items_in_all_boards": lambda wrapper: wrapper.get_all_items_in_all_boards(),
+            "iter_board_items": lambda wrapper: sum(1 for _ in wrapper.iter_board_items(columns=["Status", "Text"])),
+            "iter_all_items": lambda wrapper: sum(1 for _ in wrapper.iter_all_items()),
+            "get_list_of_users": lambda wrapper: wrapper.get_list_of_users(),
+            "get_user_by_email": lambda wrapper: wrapper.get_user_by_email("guest@email.com"),
+            "get_user_by_name": lambda wrapper: wrapper.get_user_by_name("Guest User"),
+            "get_columns_for_item_from_board": lambda wrapper: wrapper.get_columns_for_item_from_board("Item 1"),
+            "get_value_of_column_for_item": lambda wrapper: wrapper.get_value_of_column_for_item("Item 1", "Text"),
+            "get_column_values": lambda wrapper: wrapper.get_column_values(["Status", "Text"]),
+            "get_status_of_item": lambda wrapper: wrapper.get_status_of_item("Item 1"),
+            "change_value_of_column": lambda wrapper: wrapper.change_value_of_column("Item 2", "Text", "Changed"),
+            "update_item_columns": lambda wrapper: wrapper.update_item_columns("Item 2", {"Status": "Done", "Task Weight": 5, "Text": "Changed"}),
+            "move_item_to_group": lambda wrapper: wrapper.move_item_to_group("Item 3", "Done"),
+            "move_items_to_groups": lambda wrapper: wrapper.move_items_to_groups({f"Item {index}": "Done" for index in range(10, 30)}),
+            "create_index": lambda wrapper: wrapper.create_index("Text", unique=True),
+            "drop_index": (lambda wrapper: wrapper.create_index("Text"), lambda wrapper: wrapper.drop_index("Text")),
+            "find_items": (lambda wrapper: wrapper.create_index("Text"), lambda wrapper: [wrapper.find_items("Text", f"Text {index}") for index in range(20)]),
+            "find_items_in_range": (lambda wrapper: wrapper.create_index("Text"), lambda wrapper: wrapper.find_items_in_range("Text", "Text 10", "Text 19")),
+            "get_group_ids": lambda wrapper: wrapper.get_group_ids(),
+            "get_group_id": lambda wrapper: wrapper.get_group_id("Done"),
+            "enable_board_snapshot": lambda wrapper: wrapper.enable_board_snapshot(),
+            "refresh_board_snapshot": (lambda wrapper: wrapper.enable_board_snapshot(), lambda wrapper: wrapper.refresh_board_snapshot()),
+            "disable_board_snapshot": (lambda wrapper: wrapper.enable_board_snapshot(), lambda wrapper: wrapper.disable_board_snapshot()),
+            "invalidate_caches": (lambda wrapper: wrapper.get_item_id_by_name("Item 1"), lambda wrapper: wrapper.invalidate_caches()),
+            "cache_stats": (lambda wrapper: wrapper.get_item_id_by_name("Item 1"), lambda wrapper: wrapper.cache_stats()),
+            "apply_webhook_event": (lambda wrapper: wrapper.enable_board_snapshot(),
+                                    lambda wrapper: wrapper.apply_webhook_event({"type": "move_pulse_into_group", "boardId": wrapper.get_board_id(), "pulseId": wrapper.get_item_id_by_name("Item 1"), "destGroupId": "done"})),
+            "sync_board_snapshot": (lambda wrapper: (wrapper.enable_board_snapshot(incremental=True), wrapper.sync_board_snapshot()),
+                                    lambda wrapper: wrapper.sync_board_snapshot()),
+            "batch_writer": batch_writer,
+            "sync_rows": sync_rows,
+            "enable_write_behind": lambda wrapper: wrapper.enable_write_behind(max_delay=None),
+            "flush_writes": (write_behind_changes, lambda wrapper: wrapper.flush_writes()),
+            "disable_write_behind": (write_behind_changes, lambda wrapper: wrapper.disable_write_behind()),
+        }
+
+    def uncovered_methods(self):
+        """
+        :return: Public MondayWrapper methods that have no benchmark case: List
+        """
+        cases = self.method_cases()
+        public_methods = [name for name in dir(self.module.MondayWrapper) if not name.startswith("_") and callable(getattr(self.module.MondayWrapper, name))]
+        return [name for name in public_methods if name not in cases]
+
+    def run_methods(self):
+        """
+        :return: One result per public method: List of BenchmarkResult
+        """
+        results = []
+        for name, case in self.method_cases().items():
+            wrapper = self.new_wrapper()
+            if isinstance(case, tuple):
+                setup, case = case
+                setup(wrapper)
+            results.append(self.measure(name, lambda: case(wrapper)))
+        return results
+
+    def _scenario_values(self, row, columns):
+        values = {
+            "Status": ["Done", "Stuck", "Working on it"][row % 3],
+            "Notes": f"Notes for row {row}",
+            "Task Weight": row % 100,
+            "Text": f"Row {row}",
+            "Date": f"2020-01-{row % 28 + 1:02d}",
+            "Link": (f"https://example.com/{row}", f"Row {row}"),
+        }
+        return dict(list(values.items())[:columns])
+
+    def scenario_cases(self, rows, columns):
+        """
+        Bulk update scenarios: rows x columns values written to existing items, with the different write paths of the wrapper.
+        :param rows: Number of items updated: int
+        :param columns: Number of columns updated per item (up to 6): int
+        :return: Mapping of scenario name to function taking the wrapper: dict
+        """
+        def per_cell(wrapper):
+            for row in range(rows):
+                for col_title, value in self._scenario_values(row, columns).items():
+                    link_text = None
+                    if isinstance(value, tuple):
+                        value, link_text = value
+                    wrapper.change_value_of_column(f"Item {row}", col_title, value, link_text=link_text)
+
+        def per_row(wrapper):
+            for row in range(rows):
+                wrapper.update_item_columns(f"Item {row}", self._scenario_values(row, columns))
+
+        def snapshot_per_row(wrapper):
+            wrapper.enable_board_snapshot()
+            per_row(wrapper)
+
+        def snapshot_batch_writer(wrapper):
+            wrapper.enable_board_snapshot()
+            writer = wrapper.batch_writer()
+            for row in range(rows):
+                writer.change_columns(f"Item {row}", self._scenario_values(row, columns))
+            writer.execute()
+
+        def diff_sync(wrapper):
+            wrapper.sync_rows([dict(self._scenario_values(row, columns), Name=f"Item {row}") for row in range(rows)])
+
+        def snapshot_write_behind(wrapper):
+            wrapper.enable_board_snapshot()
+            wrapper.enable_write_behind(max_delay=None)
+            per_cell(wrapper)
+            wrapper.disable_write_behind()
+
+        prefix = f"update {rows} rows x {columns} columns"
+        return {
+            f"{prefix}: change_value_of_column per cell": per_cell,
+            f"{prefix}: update_item_columns per row": per_row,
+            f"{prefix}: snapshot + update_item_columns": snapshot_per_row,
+            f"{prefix}: snapshot + batch_writer": snapshot_batch_writer,
+            f"{prefix}: snapshot + write-behind per cell": snapshot_write_behind,
+            f"{prefix}: sync_rows": diff_sync,
+        }
+
+    def run_scenarios(self, rows=1000, columns=5, skip=()):
+        """
+        Runs each scenario on its own freshly seeded board.
+        :param rows: int
+        :param columns: int
+        :param skip: Names of scenarios not to run: tuple
+        :return: List of BenchmarkResult
+        """
+        results = []
+        for name, scenario in self.scenario_cases(rows, columns).items():
+            if any(skipped in name for skipped in skip):
+                continue
+            board_name = f"Scenario Board {next(self.counter)}"
+            self._seed_board(board_name, rows)
+            wrapper = self.new_wrapper(board_name)
+            results.append(self.measure(name, lambda: scenario(wrapper)))
+        return results
+
+
+def format_results(results):
+    """
+    :param results: List of BenchmarkResult
+    :return: Results formatted as a text table: str
+    """
+    name_width = max([len(result.name) for result in results] + [4])
+    lines = [f"{'Case':<{name_width}}  {'Round trips':>11}  {'Bytes sent':>10}  {'Bytes recv':>10}  {'Wall time':>9}"]
+    for result in results:
+        line = f"{result.name:<{name_width}}  {result.round_trips:>11}  {result.bytes_sent:>10}  {result.bytes_received:>10}  {result.wall_time:>8.3f}s"
+        if result.error:
+            line += f"  ERROR: {result.error}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def compare_to_baseline(results, baseline):
+    """
+    Regression gate: round trips are deterministic, so any case making more round trips than its baseline is a regression.
+    :param results: List of BenchmarkResult
+    :param baseline: Mapping of case name to a dict with a 'round_trips' key: dict
+    :return: Descriptions of the regressions found: List
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if result.error:
+            regressions.append(f"{result.name}: failed with {result.error}")
+        elif expected is not None and result.round_trips > expected["round_trips"]:
+            regressions.append(f"{result.name}: {result.round_trips} round trips, baseline is {expected['round_trips']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the API usage of MondayWrapper against an in-memory monday.com API.")
+    parser.add_argument("--items", type=int, default=100, help="Number of items on the board used by the method benchmarks")
+    parser.add_argument("--rows", type=int, default=1000, help="Number of rows updated by the scenarios")
+    parser.add_argument("--columns", type=int, default=5, help="Number of columns updated per row by the scenarios (up to 6)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency per request, in seconds")
+    parser.add_argument("--skip", action="append", default=[], help="Skip scenarios whose name contains this text (e.g. 'per cell')")
+    parser.add_argument("--baseline", help="JSON file with the baseline results. The run fails if a case makes more round trips than its baseline")
+    parser.add_argument("--write-baseline", action="store_true", help="Write the results of this run to the baseline file")
+    parser.add_argument("--verbose", action="store_true", help="Show the log output of the wrapper")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL, format="%(levelname)s %(name)s: %(message)s")
+    benchmark = MondayBenchmark(item_count=args.items, latency=args.latency)
+    try:
+        results = benchmark.run_methods() + benchmark.run_scenarios(rows=args.rows, columns=args.columns, skip=tuple(args.skip))
+        uncovered = benchmark.uncovered_methods()
+    finally:
+        benchmark.close()
+
+    print(format_results(results))
+    if uncovered:
+        print(f"\nPublic methods without a benchmark case: {', '.join(uncovered)}")
+
+    if args.baseline and args.write_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            # ONLY THE DETERMINISTIC COUNTS ARE KEPT: WALL TIMES DEPEND ON THE MACHINE
+            json.dump({result.name: {"round_trips": result.round_trips} for result in results}, baseline_file, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare_to_baseline(results, json.load(baseline_file))
+        if regressions:
+            print("\nRound trip regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo round trip regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+
+class MondayWebhookReceiver:
+    """
+    Embedded HTTP endpoint for monday.com webhooks. It answers the challenge monday.com sends when a webhook is
+    created, and applies the events it receives (item created, renamed, moved, archived or deleted, column value
+    changed) to the caches and board snapshots of one or more wrappers (see MondayWrapper.apply_webhook_event),
+    so their cached lookups stay fresh without polling the boards.
+
+    Usage:
+        receiver = MondayWebhookReceiver(mon, port=8080)
+        receiver.start()
+        # CREATE THE WEBHOOKS OF THE BOARDS ON MONDAY.COM WITH THE PUBLIC URL OF THE RECEIVER
+        ...
+        receiver.shutdown()
+
+    Events can also be applied without HTTP with handle_http_body(), e.g. to replay sample payloads.
+    """
+
+    def __init__(self, wrappers, host="127.0.0.1", port=0, path="/", signing_secret=None, on_event=None):
+        """
+        :param wrappers: MondayWrapper, or list of MondayWrapper, the events are applied to
+        :param host: Address to listen on: str
+        :param port: Port to listen on. 0 picks a free port: int
+        :param path: Path the webhooks are posted to: str
+        :param signing_secret: Signing secret of the monday.com app. When set, requests without a valid JWT
+        in their Authorization header are rejected: str
+        :param on_event: Function called with each event after it is applied, e.g. to invalidate other caches. Optional
+        """
+        self.wrappers = wrappers if isinstance(wrappers, (list, tuple)) else [wrappers]
+        self.host = host
+        self.port = port
+        self.path = path
+        self.signing_secret = signing_secret
+        self.on_event = on_event
+        self.lock = threading.Lock()
+        self.events_received = 0
+        self.events_applied = 0
+        self._http_server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    @property
+    def url(self):
+        """
+        :return: Url the webhooks are posted to, or None if the receiver is not started: str
+        """
+        if self._http_server is None:
+            return None
+        return f"http://{self.host}:{self._http_server.server_address[1]}{self.path}"
+
+    def start(self):
+        """
+        Starts serving the webhook endpoint in a background thread.
+        :return: Url the webhooks are posted to: str
+        """
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.split("?")[0] != receiver.path:
+                    status_code, response_body = 404, b'{"error": "Not found"}'
+                else:
+                    body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                    status_code, response_body = receiver.handle_http_body(body, self.headers.get("Authorization"))
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+            def log_message(self, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((self.host, self.port), Handler)
+        threading.Thread(target=self._http_server.serve_forever, name="monday-webhook-receiver", daemon=True).start()
+        logger.info("Receiving monday.com webhooks on %s", self.url)
+        return self.url
+
+    def shutdown(self):
+        """
+        Stops the HTTP server started by start().
+        """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def verify_authorization(self, authorization):
+        """
+        Checks the JWT monday.com signs webhook requests of apps with (HS256, with the signing secret of the app).
+        :param authorization: Value of the Authorization header: str
+        :return: True if the token is valid and not expired: bool
+        """
+        if not authorization:
+            return False
+        token = authorization[len("Bearer "):] if authorization.startswith("Bearer ") else authorization
+        try:
+            header, payload, signature = token.split(".")
+            expected = hmac.new(self.signing_secret.encode("utf-8"), f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                return False
+            if json.loads(_b64decode(header)).get("alg") != "HS256":
+                return False
+            claims = json.loads(_b64decode(payload))
+        except (ValueError, UnicodeError):
+            return False
+        return not (isinstance(claims, dict) and "exp" in claims and claims["exp"] < time.time())
+
+    def handle_http_body(self, body, authorization=None):
+        """
+        Serves one webhook request: answers the challenge handshake or applies the event to the wrappers.
+        :param body: JSON request body: bytes
+        :param authorization: Value of the Authorization header: str
+        :return: HTTP status code and response body: tuple
+        """
+        if self.signing_secret is not None and not self.verify_authorization(authorization):
+            logger.warning("Rejected webhook request with an invalid authorization token")
+            return 401, b'{"error": "Invalid authorization"}'
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, b'{"error": "Body is not valid JSON"}'
+        if not isinstance(payload, dict):
+            return 400, b'{"error": "Body is not a JSON object"}'
+
+        # monday.com CHECKS THE URL OF A NEW WEBHOOK BY POSTING A CHALLENGE THAT MUST BE ECHOED BACK
+        if "challenge" in payload:
+            logger.info("Answering monday.com webhook challenge")
+            return 200, json.dumps({"challenge": payload["challenge"]}).encode("utf-8")
+
+        event = payload.get("event")
+        if not isinstance(event, dict):
+            return 400, b'{"error": "No event in the body"}'
+        self.handle_event(event)
+        return 200, b'{}'
+
+    def handle_event(self, event):
+        """
+        Applies one webhook event to the wrappers.
+        Errors are logged and not raised: monday.com would otherwise retry the same event.
+        :param event: The "event" object of the webhook payload: dict
+        :return: True if at least one wrapper applied the event: bool
+        """
+        applied = False
+        for wrapper in self.wrappers:
+            try:
+                applied = wrapper.apply_webhook_event(event) or applied
+            except Exception as e:
+                logger.error("Could not apply webhook event %s of item %s. ERROR DETAILS: %s", event.get("type"), event.get("pulseId"), e)
+        with self.lock:
+            self.events_received += 1
+            self.events_applied += int(applied)
+
+        if self.on_event is not None:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                logger.error("Webhook event listener failed. ERROR DETAILS: %s", e)
+        return applied
+
+
+def _b64decode(value):
+    # JWT SEGMENTS ARE BASE64URL ENCODED WITHOUT PADDING
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
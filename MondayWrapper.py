@@ -1,14 +1,2528 @@
+import bisect
+import csv
+import hashlib
 import json
+import logging
+import os
+import queue
+import random
+import re
+import sqlite3
+import sys
+import threading
 import time
-from moncli import MondayClient, BoardKind, UserKind, ColumnType, create_column_value
-from moncli.entities.objects import StatusSettings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from moncli import MondayClient, BoardKind, UserKind, ColumnType, create_column_value, api_v2
+from moncli.api_v2 import MondayApiError
+from moncli.entities.objects import StatusSettings, MondayClientCredentials, Column
+from moncli.entities.board import Board
+from moncli.entities.item import Item
 
-USER_NAME = 'made_up_user@email.com'
-API_V1 = 'apikeyapikeyapikeyv1apikeyv1apikeyv1apikeyv1'
-API_V2 = 'apikeyv2apikeyv2apikeyv2apikeyv2apikeyv2'
-# THIS MAY BE MODIFIED TO USE ENVIRONMENT VARIABLE FOR USERNAME AND API KEYS
+logger = logging.getLogger(__name__)
+
+# DEFAULT CREDENTIALS, READ FROM THE ENVIRONMENT WHEN SET. A MondayWrapper MAY ALSO BE GIVEN ITS OWN CONNECTION
+USER_NAME = os.environ.get('MONDAY_USER_NAME', 'made_up_user@email.com')
+API_V1 = os.environ.get('MONDAY_API_KEY_V1', 'apikeyapikeyapikeyv1apikeyv1apikeyv1apikeyv1')
+API_V2 = os.environ.get('MONDAY_API_KEY_V2', 'apikeyv2apikeyv2apikeyv2apikeyv2apikeyv2')
+
+API_V2_ENDPOINT = 'https://api.monday.com/v2'
+API_TIMEOUT = 30  # SECONDS
+
+# MONDAY.COM REJECTS ANY SINGLE REQUEST WHOSE COMPLEXITY IS ABOVE THIS LIMIT
+MAX_COMPLEXITY_PER_REQUEST = 5000000
+# COMPLEXITY BUDGET OF THE ACCOUNT, REFILLED OVER EACH BUDGET WINDOW (SECONDS)
+COMPLEXITY_BUDGET = 5000000
+COMPLEXITY_BUDGET_WINDOW = 60
+# COMPLEXITY ASSUMED FOR A REQUEST WHEN THE CALLER DOES NOT PROVIDE AN ESTIMATE
+DEFAULT_REQUEST_COMPLEXITY = 10000
+# NUMBER OF BOARDS LISTED PER REQUEST
+BOARDS_PAGE_SIZE = 100
+# DEFAULT SIZE LIMITS (ENTRIES) AND TIME TO LIVE (SECONDS) OF THE IN-MEMORY CACHES OF A MondayWrapper
+BOARD_CACHE_SIZE = 256
+ITEM_CACHE_SIZE = 10000
+CACHE_TTL = 300
+# SECONDS BEFORE THE USER DIRECTORY OF A MondayWrapper IS RELOADED
+USER_DIRECTORY_TTL = 3600
+# COLUMN TYPE REPORTED BY THE API -> COLUMN TYPE NAME OF THE create_column MUTATION (ColumnType ENUM), WHERE THEY DIFFER
+COLUMN_TYPE_ENUM_NAMES = {"color": "status", "numeric": "numbers", "long-text": "long_text", "multiple-person": "people", "boolean": "checkbox"}
+
+class WrapperMetrics:
+    """
+    Metrics of the Monday API usage of a process: per operation call/ error/ retry counters and latency histograms,
+    time spent waiting for complexity budget and cache hit/ miss counters.
+    Listeners added with add_listener() are called on every event, e.g. to export the metrics to a monitoring system.
+    Thread safe. Shared by default by all the schedulers and wrappers of a process (see METRICS).
+    """
+
+    # UPPER BOUNDS (SECONDS) OF THE LATENCY HISTOGRAM BUCKETS. A LAST BUCKET COUNTS THE SLOWER CALLS
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.listeners = []
+        self.reset()
+
+    def reset(self):
+        """
+        Sets all the metrics back to zero. Listeners are kept.
+        """
+        with self.lock:
+            self.operations = {}
+            self.caches = {}
+            self.throttle_waits = 0
+            self.throttle_wait_time = 0.0
+
+    def add_listener(self, listener):
+        """
+        Adds a function called as listener(event, data) for each 'api_call', 'retry', 'throttle' and 'cache' event.
+        :param listener: Function
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        :param listener: Function added with add_listener()
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _notify(self, event, data):
+        for listener in list(self.listeners):
+            try:
+                listener(event, data)
+            except Exception:
+                logger.exception("Metrics listener failed for event %s", event)
+
+    def _operation_metrics(self, operation):
+        metrics = self.operations.get(operation)
+        if metrics is None:
+            metrics = {"calls": 0, "errors": 0, "retries": 0, "total_time": 0.0, "latency_buckets": [0] * (len(self.LATENCY_BUCKETS) + 1)}
+            self.operations[operation] = metrics
+        return metrics
+
+    def record_call(self, operation, duration, success=True):
+        """
+        Records one API request.
+        :param operation: Name of the API operation (e.g. change_column_value): str
+        :param duration: Duration of the request in seconds: float
+        :param success: False if the request failed: Boolean
+        """
+        with self.lock:
+            metrics = self._operation_metrics(operation)
+            metrics["calls"] += 1
+            metrics["total_time"] += duration
+            if not success:
+                metrics["errors"] += 1
+            bucket = next((index for index, bound in enumerate(self.LATENCY_BUCKETS) if duration <= bound), len(self.LATENCY_BUCKETS))
+            metrics["latency_buckets"][bucket] += 1
+        self._notify("api_call", {"operation": operation, "duration": duration, "success": success})
+
+    def record_retry(self, operation, delay):
+        """
+        :param operation: Name of the API operation retried: str
+        :param delay: Seconds waited before the retry: float
+        """
+        with self.lock:
+            self._operation_metrics(operation)["retries"] += 1
+        self._notify("retry", {"operation": operation, "delay": delay})
+
+    def record_throttle(self, operation, wait):
+        """
+        :param operation: Name of the API operation that waited for complexity budget: str
+        :param wait: Seconds waited: float
+        """
+        with self.lock:
+            self.throttle_waits += 1
+            self.throttle_wait_time += wait
+        self._notify("throttle", {"operation": operation, "wait": wait})
+
+    def record_cache(self, cache, hit):
+        """
+        :param cache: Name of the cache (board, item, column ...): str
+        :param hit: True for a hit, False for a miss: Boolean
+        """
+        with self.lock:
+            counters = self.caches.setdefault(cache, {"hits": 0, "misses": 0})
+            counters["hits" if hit else "misses"] += 1
+        self._notify("cache", {"cache": cache, "hit": hit})
+
+    def cache_hit_ratio(self, cache):
+        """
+        :param cache: Name of the cache: str
+        :return: Ratio of hits to lookups, or None if the cache was never used: float
+        """
+        counters = self.caches.get(cache)
+        if not counters or not counters["hits"] + counters["misses"]:
+            return None
+        return counters["hits"] / (counters["hits"] + counters["misses"])
+
+    def snapshot(self):
+        """
+        :return: Copy of all the metrics: dict
+        """
+        with self.lock:
+            return {
+                "operations": {name: dict(metrics, latency_buckets=list(metrics["latency_buckets"])) for name, metrics in self.operations.items()},
+                "latency_bucket_bounds": list(self.LATENCY_BUCKETS),
+                "caches": {name: dict(counters, hit_ratio=self.cache_hit_ratio(name)) for name, counters in self.caches.items()},
+                "throttle_waits": self.throttle_waits,
+                "throttle_wait_time": self.throttle_wait_time,
+            }
+
+
+METRICS = WrapperMetrics()
+
+
+class RequestScheduler:
+    """
+    Central scheduler that every Monday API call goes through.
+    Outgoing requests are metered against the complexity budget of the account with a token bucket,
+    which is corrected whenever the API reports the remaining budget.
+    Failed calls are classified: complexity budget errors wait for the reset window, transient errors
+    (network, HTTP 429 and 5xx) are retried with exponential backoff and jitter, anything else fails fast.
+    Calls that are not idempotent, such as creations, are only retried when the API rejected them without applying them
+    (complexity budget errors and HTTP 429): after a timeout, a network error or a 5xx they may have been applied.
+    The scheduler is thread safe and is shared by all the wrappers of a process (see SCHEDULER).
+    """
+
+    RESET_IN_PATTERN = re.compile(r"reset in (\d+) seconds?")
+    # ERROR CODES OF AN EXHAUSTED COMPLEXITY BUDGET. OTHER COMPLEXITY ERRORS (E.G. A SINGLE QUERY ABOVE THE MAXIMUM COMPLEXITY) WILL NEVER SUCCEED
+    BUDGET_ERROR_CODES = {"ComplexityException", "COMPLEXITY_BUDGET_EXHAUSTED"}
+
+    def __init__(self, complexity_budget=COMPLEXITY_BUDGET, budget_window=COMPLEXITY_BUDGET_WINDOW, default_cost=DEFAULT_REQUEST_COMPLEXITY, max_retries=8, backoff_base=1.0, backoff_max=60.0, metrics=None):
+        """
+        :param complexity_budget: Complexity budget of the account per budget window: int
+        :param budget_window: Number of seconds over which the budget is refilled: int
+        :param default_cost: Complexity assumed for a request without an estimate: int
+        :param max_retries: Maximum number of retries of a retryable failure: int
+        :param backoff_base: Delay before the first retry, doubled on each retry: float
+        :param backoff_max: Maximum delay between retries: float
+        :param metrics: WrapperMetrics the calls are recorded in. Defaults to the shared METRICS
+        """
+        self.complexity_budget = complexity_budget
+        self.refill_rate = complexity_budget / budget_window
+        self.default_cost = default_cost
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.metrics = metrics or METRICS
+
+        self.lock = threading.Lock()
+        self.tokens = float(complexity_budget)
+        self.updated_at = time.monotonic()
+        # SET WHEN THE API REPORTS THE BUDGET AS EXHAUSTED: NO REQUEST IS SENT BEFORE THIS TIME
+        self.blocked_until = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.complexity_budget, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def available(self):
+        """
+        Complexity budget currently left, negative when callers are queued up for budget.
+        :return: float
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.blocked_until > now:
+                return min(self.tokens, 0.0)
+            return self.tokens
+
+    def reserve(self, cost=None):
+        """
+        Takes the cost of a request from the budget.
+        The budget can go into debt, so that concurrent callers queue up behind each other instead of all
+        being released together.
+        :param cost: Estimated complexity of the request: int
+        :return: Number of seconds the caller must wait before sending the request: float
+        """
+        if cost is None:
+            cost = self.default_cost
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self.blocked_until - now)
+            self.tokens -= cost
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.refill_rate)
+            return wait
+
+    def report_budget(self, remaining=None, reset_in=None):
+        """
+        Corrects the token bucket with the budget reported by the API.
+        :param remaining: Complexity budget left, as reported by the API: int
+        :param reset_in: Seconds until the budget is reset, as reported by the API: int
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            if remaining is not None:
+                self.tokens = min(self.tokens, float(remaining))
+            if reset_in is not None and remaining is not None and remaining <= 0:
+                self.blocked_until = max(self.blocked_until, now + reset_in)
+
+    def report_complexity(self, data):
+        """
+        Corrects the token bucket with the 'complexity { query after reset_in_x_seconds }' field of a response, if it was requested.
+        :param data: 'data' of the response: dict
+        :return: The complexity field of the response, empty if it was not requested: dict
+        """
+        complexity = (data or {}).get("complexity") or {}
+        if complexity.get("after") is not None:
+            self.report_budget(remaining=complexity["after"], reset_in=complexity.get("reset_in_x_seconds"))
+        return complexity
+
+    @staticmethod
+    def _error_messages(error):
+        messages = getattr(error, 'messages', None)
+        if not messages:
+            return [str(error)]
+        if not isinstance(messages, (list, tuple)):
+            messages = [messages]
+        return [message.get('message', str(message)) if isinstance(message, dict) else str(message) for message in messages]
+
+    @staticmethod
+    def _error_codes(error):
+        codes = set()
+        for message in getattr(error, 'messages', None) or []:
+            if isinstance(message, dict):
+                codes.add(message.get('error_code'))
+                codes.add((message.get('extensions') or {}).get('code'))
+        return codes
+
+    def is_budget_error(self, error):
+        """
+        Checks if an error means the complexity budget was exhausted, from its error code or its message.
+        A query that is too complex on its own is not a budget error: waiting for the reset would not help.
+        :param error: Exception
+        :return: Boolean
+        """
+        if self._error_codes(error) & self.BUDGET_ERROR_CODES:
+            return True
+        return any('budget exhausted' in message.lower() for message in self._error_messages(error))
+
+    def is_retryable(self, error):
+        """
+        Checks if a failed call is worth retrying: complexity budget errors, network errors, HTTP 429 and 5xx.
+        Errors such as missing boards/ items/ groups or bad values fail fast.
+        :param error: Exception
+        :return: Boolean
+        """
+        if self.is_budget_error(error):
+            return True
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, MondayApiError):
+            return error.status_code == 429 or error.status_code >= 500
+        return False
+
+    def is_rejected(self, error):
+        """
+        Checks if a failed call was rejected by the API without being applied: complexity budget errors and HTTP 429.
+        Only these failures are retried for calls that are not idempotent.
+        :param error: Exception
+        :return: Boolean
+        """
+        if self.is_budget_error(error):
+            return True
+        return isinstance(error, MondayApiError) and error.status_code == 429
+
+    def reset_in(self, error):
+        """
+        :param error: Exception
+        :return: Seconds until the complexity budget is reset if the error says so, otherwise None: int
+        """
+        for message in self._error_messages(error):
+            match = self.RESET_IN_PATTERN.search(message)
+            if match:
+                return int(match.group(1))
+        return None
+
+    def backoff_delay(self, attempt, error=None):
+        """
+        Delay before the next retry: exponential backoff with jitter, and at least until the budget reset
+        when the error is a complexity budget error.
+        :param attempt: Number of the retry (1 for the first retry): int
+        :param error: The error that caused the retry: Exception
+        :return: Number of seconds to wait: float
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        delay = random.uniform(delay / 2, delay)
+        if error is not None and self.is_budget_error(error):
+            reset_in = self.reset_in(error)
+            if reset_in is not None:
+                self.report_budget(remaining=0, reset_in=reset_in)
+                delay = max(delay, reset_in + random.uniform(0, 1))
+        return delay
+
+    def call(self, func, *args, description=None, cost=None, operation=None, idempotent=True, **kwargs):
+        """
+        Calls func(*args, **kwargs) once the budget allows it, retrying retryable failures.
+        :param func: Function making one Monday API request
+        :param description: Description of the call used in logs: str
+        :param cost: Estimated complexity of the request: int
+        :param operation: Name of the API operation the call is recorded under in the metrics. Defaults to the name of func: str
+        :param idempotent: False for requests that must not be applied twice (e.g. creations). They are then only retried
+        when the API rejected them (see is_rejected): Boolean
+        :return: The return value of func
+        """
+        if operation is None:
+            operation = getattr(func, '__name__', 'monday_api_call')
+        if description is None:
+            description = operation
+
+        attempt = 0
+        while True:
+            wait = self.reserve(cost)
+            if wait > 0:
+                logger.info("Waiting %.1fs for complexity budget before %s", wait, description)
+                self.metrics.record_throttle(operation, wait)
+                time.sleep(wait)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self.metrics.record_call(operation, time.perf_counter() - start, success=False)
+                if not self.is_retryable(e):
+                    logger.error("%s failed and will not be retried. ERROR DETAILS: %s", description, e)
+                    raise
+                if not idempotent and not self.is_rejected(e):
+                    logger.error("%s failed and will not be retried, as it may have been applied. ERROR DETAILS: %s", description, e)
+                    raise
+                attempt = attempt + 1
+                if attempt > self.max_retries:
+                    logger.error("%s failed after %s retries. ERROR DETAILS: %s", description, self.max_retries, e)
+                    raise
+                delay = self.backoff_delay(attempt, e)
+                logger.warning("%s failed. ERROR DETAILS: %s. Try #%s, will retry in %.1fs", description, e, attempt, delay)
+                self.metrics.record_retry(operation, delay)
+                time.sleep(delay)
+            else:
+                self.metrics.record_call(operation, time.perf_counter() - start)
+                return result
+
+
+SCHEDULER = RequestScheduler()
+
+
+class MondayConnection:
+    """
+    Credentials of one Monday account/ API token, with the moncli client and the HTTP session used for them.
+    Nothing is sent to the API when the connection is created: the moncli client (whose creation requests the
+    current user) and the HTTP session are created on first use.
+    Each connection has its own RequestScheduler, as each API token has its own complexity budget.
+    """
+
+    def __init__(self, user_name=None, api_key_v1=None, api_key_v2=None, client=None, scheduler=None, endpoint=API_V2_ENDPOINT):
+        """
+        :param user_name: Email of the account. Defaults to USER_NAME: str
+        :param api_key_v1: API key v1. Defaults to API_V1: str
+        :param api_key_v2: API key v2. Defaults to API_V2: str
+        :param client: Already created moncli MondayClient. moncli does not expose the API keys of a client: they must
+        also be passed when they are not the default ones
+        :param scheduler: RequestScheduler of the API token. A new one is created by default
+        :param endpoint: URL of the Monday API v2: str
+        """
+        self.user_name = user_name or USER_NAME
+        self.api_key_v1 = api_key_v1 or API_V1
+        self.api_key_v2 = api_key_v2 or API_V2
+        self.creds = MondayClientCredentials(self.api_key_v1, self.api_key_v2)
+        self.scheduler = scheduler or RequestScheduler()
+        self.endpoint = endpoint
+        self.lock = threading.Lock()
+        self._client = client
+        self._session = None
+
+    @property
+    def client(self):
+        """
+        moncli MondayClient of the connection, created on first use.
+        :return: MondayClient
+        """
+        if self._client is None:
+            with self.lock:
+                if self._client is None:
+                    logger.info("Creating Monday client for %s", self.user_name)
+                    self._client = self.scheduler.call(MondayClient, user_name=self.user_name, api_key_v1=self.api_key_v1, api_key_v2=self.api_key_v2,
+                                                       description="create Monday client", operation="get_me")
+        return self._client
+
+    @property
+    def session(self):
+        """
+        HTTP session (kept alive connections) used for the raw GraphQL requests of the connection, created on first use.
+        :return: requests.Session
+        """
+        if self._session is None:
+            with self.lock:
+                if self._session is None:
+                    self._session = requests.Session()
+                    self._session.headers.update({'Authorization': self.api_key_v2})
+        return self._session
+
+    def execute_graphql(self, query, raise_errors=False):
+        """
+        Posts a raw GraphQL document to the Monday API v2 endpoint with the API key of the connection.
+        Unlike the moncli request handlers, the full response is returned so that partial results
+        (data for some fields, errors for others) are not lost.
+        :param query: GraphQL document: str
+        :param raise_errors: Raise MondayApiError when the response has any error instead of returning it: bool
+        :return: Decoded JSON response with 'data' and possibly 'errors' keys: dict
+        """
+        response = self.session.post(self.endpoint, json={'query': query}, timeout=API_TIMEOUT)
+        response_json = response.json()
+        if response.status_code >= 400 and 'errors' not in response_json:
+            raise MondayApiError(query, response.status_code, [response_json.get('error_message', str(response_json))])
+        if raise_errors and response_json.get('errors'):
+            raise MondayApiError(query, response.status_code, response_json['errors'])
+        return response_json
+
+    def close(self):
+        """
+        Closes the HTTP session of the connection. It is created again if the connection is used afterwards.
+        """
+        with self.lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class MondayClientPool:
+    """
+    Pool of MondayConnection objects, one per API token, to spread the API load of a worker over several tokens
+    (each token has its own complexity budget) or to serve several tenants from one process.
+    get() returns the connection registered under a name or, without a name, the connection with the most
+    complexity budget left.
+    """
+
+    def __init__(self, connections=None):
+        """
+        :param connections: MondayConnection objects: list, or dict of name -> MondayConnection
+        """
+        self.lock = threading.Lock()
+        self.connections = {}
+        if isinstance(connections, dict):
+            for name, connection in connections.items():
+                self.add(connection, name)
+        else:
+            for connection in connections or []:
+                self.add(connection)
+
+    @classmethod
+    def from_api_keys(cls, api_keys_v2, user_name=None, api_key_v1=None):
+        """
+        Creates a pool with one connection per API key v2 of the same account.
+        :param api_keys_v2: API keys v2: list
+        :param user_name: Email of the account. Defaults to USER_NAME: str
+        :param api_key_v1: API key v1. Defaults to API_V1: str
+        :return: MondayClientPool
+        """
+        return cls([MondayConnection(user_name=user_name, api_key_v1=api_key_v1, api_key_v2=api_key_v2) for api_key_v2 in api_keys_v2])
+
+    def add(self, connection, name=None):
+        """
+        Adds a connection to the pool.
+        :param connection: MondayConnection
+        :param name: Name (e.g. tenant) of the connection. Defaults to the position of the connection in the pool: str
+        :return: MondayConnection
+        """
+        with self.lock:
+            self.connections[name if name is not None else len(self.connections)] = connection
+        return connection
+
+    def get(self, name=None):
+        """
+        Returns the connection registered under a name or, when no name is passed, the connection whose
+        scheduler has the most complexity budget left.
+        :param name: Name of the connection
+        :return: MondayConnection
+        """
+        with self.lock:
+            if name is not None:
+                return self.connections[name]
+            if not self.connections:
+                raise ValueError("The client pool has no connection")
+            connections = list(self.connections.values())
+        return max(connections, key=lambda connection: connection.scheduler.available())
+
+    def __len__(self):
+        return len(self.connections)
+
+    def close(self):
+        """
+        Closes the HTTP sessions of all the connections of the pool.
+        """
+        for connection in list(self.connections.values()):
+            connection.close()
+
+
+# CONNECTION USED BY THE WRAPPERS CREATED WITHOUT A CONNECTION. IT SHARES THE SCHEDULER OF THE PROCESS
+DEFAULT_CONNECTION = MondayConnection(scheduler=SCHEDULER)
+
+
+def __getattr__(name):
+    # THE DEFAULT CLIENT IS ONLY CREATED (ONE API REQUEST) WHEN CLIENT IS FIRST USED, NOT ON IMPORT
+    if name == 'CLIENT':
+        return DEFAULT_CONNECTION.client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def execute_graphql(query):
+    """
+    Posts a raw GraphQL document to the Monday API v2 endpoint with the default connection.
+    :param query: GraphQL document: str
+    :return: Decoded JSON response with 'data' and possibly 'errors' keys: dict
+    """
+    return DEFAULT_CONNECTION.execute_graphql(query)
+
+
+def graphql_string(value):
+    """
+    Formats a python value as a GraphQL string literal.
+    :param value: Value to format
+    :return: str
+    """
+    return json.dumps(str(value))
+
+
+def graphql_json(value):
+    """
+    Formats a python dict as a GraphQL JSON argument (a string literal containing the JSON encoded value).
+    :param value: dict
+    :return: str
+    """
+    return json.dumps(json.dumps(value))
+
+
+def read_rows(source):
+    """
+    Reads tabular data as dicts (column title -> value), one per row.
+    :param source: Iterable of dicts, pandas DataFrame, path of a CSV file or open CSV file (with a header row)
+    :return: Generator of dicts
+    """
+    if hasattr(source, 'to_dict') and hasattr(source, 'columns'):
+        # PANDAS DATAFRAME. MISSING VALUES (NaN, THE ONLY VALUES NOT EQUAL TO THEMSELVES) BECOME NONE
+        for row in source.to_dict('records'):
+            yield {key: (None if value != value else value) for key, value in row.items()}
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, newline='', encoding='utf-8-sig') as csv_file:
+            yield from csv.DictReader(csv_file)
+    elif hasattr(source, 'read'):
+        yield from csv.DictReader(source)
+    else:
+        yield from source
+
+
+def normalize_cell_value(value):
+    """
+    Normalizes a cell value for comparisons: None and empty values become '', link tuples their url, other values a stripped string.
+    :param value: Cell value
+    :return: str
+    """
+    if isinstance(value, tuple):
+        value = value[0]
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def cell_values_equal(new_value, current_value):
+    """
+    Checks if writing new_value to a cell holding current_value (as decoded by its ColumnCodec) would change it.
+    Numbers are compared by value, so that 5, '5' and 5.0 are equal.
+    :param new_value: Value to write
+    :param current_value: Current value of the cell
+    :return: Boolean
+    """
+    new_value = normalize_cell_value(new_value)
+    current_value = normalize_cell_value(current_value)
+    if new_value == current_value:
+        return True
+    try:
+        return float(new_value) == float(current_value)
+    except ValueError:
+        return False
+
+
+def column_type_names(column_type):
+    """
+    Normalizes a column type given as reported by the API (color, numeric, long-text ...), as a ColumnType name
+    (status, numbers, long_text ...) or as a ColumnType member.
+    :param column_type: str or ColumnType
+    :return: Column type as reported by the API and ColumnType name used by the create_column mutation: tuple
+    """
+    if isinstance(column_type, ColumnType):
+        column_type = column_type.name
+    api_types_by_enum_name = {enum_name: api_type for api_type, enum_name in COLUMN_TYPE_ENUM_NAMES.items()}
+    if column_type in api_types_by_enum_name:
+        return api_types_by_enum_name[column_type], column_type
+    if column_type in COLUMN_TYPE_ENUM_NAMES:
+        return column_type, COLUMN_TYPE_ENUM_NAMES[column_type]
+    return column_type.replace("_", "-"), column_type.replace("-", "_")
+
+
+def column_defaults(settings):
+    """
+    Builds the defaults (settings) of a new column from the settings given for it in a schema.
+    :param settings: List of status labels, mapping of label index to label, or settings dict (e.g. {"labels": {...}})
+    :return: Settings dict, or None for no settings: dict
+    """
+    if not settings:
+        return None
+    if isinstance(settings, (list, tuple)):
+        return {"labels": {str(index): label for index, label in enumerate(settings)}}
+    if all(str(key).isdigit() for key in settings):
+        return {"labels": {str(index): label for index, label in settings.items()}}
+    return dict(settings)
+
+
+def _webhook_column_value(value):
+    # COLUMN VALUE OF AN update_column_value WEBHOOK EVENT -> VALUE AS DECODED BY THE COLUMN CODECS
+    if not isinstance(value, dict):
+        return value
+    if isinstance(value.get("label"), dict):
+        return value["label"].get("text")
+    for key in ("date", "url", "text", "value"):
+        if key in value:
+            return value[key]
+    return None
+
+
+def compose_column_value(col_id, col_type, new_value, settings_str=None, link_text=None, status_settings=None):
+    """
+    Composes the moncli column value object used to write new_value into a column, according to the column type.
+    Shared by the synchronous and asynchronous wrappers.
+    :param col_id: Id of the column: str
+    :param col_type: Type of the column as reported by the API (long-text, numeric, text, name, color, date, link, multiple-person): str
+    :param new_value: New value: Date values should be entered in the format. YYYY-MM-DD: str
+    :param settings_str: Settings string of the column. Required for status (color) columns: str
+    :param link_text: Text displayed for link columns: str
+    :param status_settings: Already parsed settings of a status column. Used instead of settings_str when passed: StatusSettings
+    :return: Column value object, or None if the column type is not supported
+    """
+    column_value = None
+
+    if col_type == 'long-text':
+        column_type = ColumnType.long_text
+        column_value = create_column_value(id=col_id, column_type=column_type, text=str(new_value))
+
+    elif col_type == 'numeric':
+        column_type = ColumnType.numbers
+        column_value = create_column_value(id=col_id, column_type=column_type, value=float(new_value))
+
+    elif col_type == 'text':
+        column_type = ColumnType.text
+        column_value = create_column_value(id=col_id, column_type=column_type, value=str(new_value))
+
+    elif col_type == 'name':
+        column_type = ColumnType.name
+        column_value = create_column_value(id=col_id, column_type=column_type, value=str(new_value))
+
+    elif col_type == 'color':
+        column_type = ColumnType.status
+        settings = status_settings
+        if settings is None:
+            labels = json.loads(settings_str)
+            settings = StatusSettings(**labels)
+        column_value = create_column_value(id=col_id, column_type=column_type, label=str(new_value), settings=settings)
+        column_value.change_status_by_label(new_value)
+
+    elif col_type == 'date':
+        column_type = ColumnType.date
+        column_value = create_column_value(id=col_id, column_type=column_type, date=str(new_value))
+
+    elif col_type == 'link':
+        column_type = ColumnType.link
+        if link_text:
+            column_value = create_column_value(id=col_id, column_type=column_type, url=str(new_value), text=str(link_text))
+        else:
+            column_value = create_column_value(id=col_id, column_type=column_type, url=str(new_value))
+
+    elif col_type == 'multiple-person':
+        # NEW VALUE IS A USER ID OR A LIST OF USER IDS
+        column_type = ColumnType.people
+        user_ids = new_value if isinstance(new_value, (list, tuple, set)) else [new_value]
+        column_value = create_column_value(id=col_id, column_type=column_type, persons_and_teams=[{'id': int(user_id), 'kind': 'person'} for user_id in user_ids])
+
+    return column_value
+
+
+class ColumnCodec:
+    """
+    Encoder/ decoder for the values of one column of a board.
+    Built once from the column object: the settings string is parsed a single time, so encoding a value
+    needs no API request and no repeated parsing.
+    """
+
+    def __init__(self, column_id, title, column_type, settings_str=None):
+        """
+        :param column_id: Id of the column: str
+        :param title: Title of the column: str
+        :param column_type: Type of the column as reported by the API: str
+        :param settings_str: Settings string of the column: str
+        """
+        self.id = column_id
+        self.title = title
+        self.type = column_type
+        self.settings_str = settings_str
+
+        self.settings = {}
+        if settings_str:
+            try:
+                self.settings = json.loads(settings_str)
+            except ValueError:
+                logger.warning("Could not parse settings of column '%s'", title)
+
+        # STATUS COLUMNS: PARSED SETTINGS AND LABEL <-> INDEX MAPPINGS
+        self.status_settings = None
+        self.labels = {}
+        if column_type == 'color' and 'labels' in self.settings:
+            self.status_settings = StatusSettings(**self.settings)
+            self.labels = {str(index): label for index, label in self.settings['labels'].items()}
+
+    @classmethod
+    def from_column(cls, column):
+        """
+        Builds the codec from a moncli column object or from a column dict (id, title, type, settings_str).
+        :param column: Column object or dict
+        :return: ColumnCodec
+        """
+        if isinstance(column, dict):
+            return cls(column['id'], column['title'], column['type'], column.get('settings_str'))
+        return cls(column.id, column.title, column.type, getattr(column, 'settings_str', None))
+
+    def encode(self, new_value, link_text=None):
+        """
+        Composes the moncli column value object used to write new_value into this column.
+        :param new_value: New value: Date values should be entered in the format. YYYY-MM-DD: str
+        :param link_text: Text displayed for link columns: str
+        :return: Column value object, or None if the column type is not supported
+        """
+        return compose_column_value(col_id=self.id, col_type=self.type, new_value=new_value, settings_str=self.settings_str, link_text=link_text, status_settings=self.status_settings)
+
+    def decode(self, value, text=None):
+        """
+        Decodes a raw column value as returned by the API (the JSON 'value' string and the 'text').
+        Status columns are decoded to their label, numbers to float, links to their url, other columns to their text.
+        :param value: JSON encoded value of the column: str
+        :param text: Text of the column: str
+        :return: Decoded value
+        """
+        if value is None or value == '':
+            return text if text else None
+
+        try:
+            parsed = json.loads(value) if isinstance(value, str) else value
+        except ValueError:
+            return text
+
+        if self.type == 'color' and isinstance(parsed, dict):
+            return self.labels.get(str(parsed.get('index')), text)
+        if self.type == 'numeric':
+            try:
+                return float(parsed)
+            except (TypeError, ValueError):
+                return None
+        if self.type == 'date' and isinstance(parsed, dict):
+            return parsed.get('date')
+        if self.type == 'link' and isinstance(parsed, dict):
+            return parsed.get('url')
+        if self.type == 'long-text' and isinstance(parsed, dict):
+            return parsed.get('text')
+        return text if text is not None else parsed
+
+
+class ColumnCodecRegistry:
+    """
+    Per board registry of ColumnCodec objects, indexed by column title and by column id.
+    Built once from the column list of the board.
+    """
+
+    def __init__(self, columns_list):
+        """
+        :param columns_list: List of moncli column objects or column dicts: List
+        """
+        self.codecs_by_title = {}
+        self.codecs_by_id = {}
+        for column in columns_list:
+            codec = ColumnCodec.from_column(column)
+            # FIRST COLUMN WINS WHEN TWO COLUMNS SHARE A TITLE, SAME AS THE LINEAR LOOKUPS OF THE WRAPPER
+            self.codecs_by_title.setdefault(codec.title, codec)
+            self.codecs_by_id[codec.id] = codec
+
+    def get(self, col_title):
+        """
+        :param col_title: str
+        :return: Codec of the column with the title passed, or None: ColumnCodec
+        """
+        return self.codecs_by_title.get(col_title)
+
+    def get_by_id(self, col_id):
+        """
+        :param col_id: str
+        :return: Codec of the column with the id passed, or None: ColumnCodec
+        """
+        return self.codecs_by_id.get(col_id)
+
+    def encode(self, col_title, new_value, link_text=None):
+        """
+        :param col_title: str
+        :param new_value: New value
+        :param link_text: Text displayed for link columns: str
+        :return: Column value object, or None if the column does not exist or its type is not supported
+        """
+        codec = self.get(col_title)
+        if codec is None:
+            return None
+        return codec.encode(new_value, link_text=link_text)
+
+
+# SENTINEL TELLING A MISSING CACHE ENTRY FROM A CACHED None
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread safe in-memory cache bounded in size, with least recently used eviction and an optional time to live.
+    Supports the dict operations the wrapper uses (get, [], in, setdefault, pop, clear, len), plus
+    invalidate() to drop all the entries matching a predicate and stats() for hit/ miss/ eviction counters.
+    """
+
+    def __init__(self, name, max_size=1000, ttl=None):
+        """
+        :param name: Name of the cache, used in logs and statistics: str
+        :param max_size: Maximum number of entries. The least recently used entry is evicted beyond it: int
+        :param ttl: Number of seconds an entry is valid, or None for entries that do not expire: int
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        # KEY -> (VALUE, EXPIRY TIME OR None), IN LEAST TO MOST RECENTLY USED ORDER
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _lookup(self, key):
+        # RETURNS THE ENTRY FOR KEY, DROPPING IT IF IT EXPIRED. THE LOCK MUST BE HELD
+        entry = self.entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.entries[key]
+            self.expirations += 1
+            entry = None
+        return entry
+
+    def _purge_expired(self):
+        # DROPS ALL THE EXPIRED ENTRIES. THE LOCK MUST BE HELD
+        now = time.monotonic()
+        expired = [key for key, entry in self.entries.items() if entry[1] is not None and entry[1] <= now]
+        for key in expired:
+            del self.entries[key]
+        self.expirations += len(expired)
+
+    def _store(self, key, value):
+        # THE LOCK MUST BE HELD
+        self.entries[key] = (value, time.monotonic() + self.ttl if self.ttl is not None else None)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            evicted_key, _ = self.entries.popitem(last=False)
+            self.evictions += 1
+            logger.debug("Evicted %s from cache '%s'", evicted_key, self.name)
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self._store(key, value)
+
+    def __contains__(self, key):
+        with self.lock:
+            return self._lookup(key) is not None
+
+    def __len__(self):
+        with self.lock:
+            self._purge_expired()
+            return len(self.entries)
+
+    def setdefault(self, key, value):
+        with self.lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry[0]
+            self._store(key, value)
+            return value
+
+    def pop(self, key, default=None):
+        with self.lock:
+            entry = self._lookup(key)
+            if entry is None:
+                return default
+            del self.entries[key]
+            self.invalidations += 1
+            return entry[0]
+
+    def invalidate(self, predicate):
+        """
+        Drops all the entries whose key matches a predicate.
+        :param predicate: Function called with each key, returning True for the keys to drop: callable
+        :return: Number of entries dropped: int
+        """
+        with self.lock:
+            keys = [key for key in self.entries if predicate(key)]
+            for key in keys:
+                del self.entries[key]
+            self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        with self.lock:
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+
+    def items(self):
+        """
+        :return: (key, value) pairs of the entries that have not expired. Not counted as lookups: List
+        """
+        now = time.monotonic()
+        with self.lock:
+            return [(key, entry[0]) for key, entry in self.entries.items() if entry[1] is None or entry[1] > now]
+
+    def stats(self):
+        """
+        :return: Size, limits and hit/ miss/ eviction/ expiration/ invalidation counters of the cache: dict
+        """
+        with self.lock:
+            self._purge_expired()
+            lookups = self.hits + self.misses
+            return {"size": len(self.entries), "max_size": self.max_size, "ttl": self.ttl,
+                    "hits": self.hits, "misses": self.misses, "hit_ratio": self.hits / lookups if lookups else None,
+                    "evictions": self.evictions, "expirations": self.expirations, "invalidations": self.invalidations}
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical reads: while a call for a key is in flight, the other threads calling do() with
+    the same key wait for it and share its result or error instead of sending the same request again.
+    Keys are only held while their call is in flight: results are not cached (see LRUCache for that).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # KEY -> IN-FLIGHT CALL: [DONE EVENT, RESULT, ERROR]
+        self.calls = {}
+        self.calls_made = 0
+        self.calls_shared = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Calls func(*args, **kwargs), unless a call for the same key is already in flight: then waits for that call
+        and returns its result, or raises its error.
+        :param key: Hashable identifier of the read, e.g. ("board", board name)
+        :param func: Function to call
+        :return: Result of the call
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = [threading.Event(), None, None]
+                self.calls_made += 1
+            else:
+                self.calls_shared += 1
+
+        if not leader:
+            logger.debug("Waiting for the in-flight call for %s", key)
+            call[0].wait()
+            if call[2] is not None:
+                raise call[2]
+            return call[1]
+
+        try:
+            call[1] = func(*args, **kwargs)
+            return call[1]
+        except Exception as e:
+            call[2] = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call[0].set()
+
+    def stats(self):
+        """
+        :return: Number of calls made and of calls answered by an in-flight call: dict
+        """
+        with self.lock:
+            return {"in_flight": len(self.calls), "calls": self.calls_made, "shared": self.calls_shared}
+
+
+class PersistentMetadataCache:
+    """
+    SQLite backed cache of board metadata that outlives the process: board name -> board id, the column list
+    (id, title, type, settings) of each board and item name -> item ids.
+    A MondayWrapper created with a persistent cache resolves names from it before querying the API, so a short lived
+    process can start writing right away instead of rediscovering ids over the network.
+
+    Entries expire after ttl seconds. The database is rebuilt when its schema version differs from SCHEMA_VERSION.
+    Entries are namespaced by the API key, so several accounts can share one database file.
+    Only ids and names are stored: the moncli objects are rebuilt from them without any API request.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path, ttl=86400, api_key=None):
+        """
+        :param path: Path of the SQLite database file. It is created if it does not exist: str
+        :param ttl: Number of seconds an entry is valid: int
+        :param api_key: API key the cached ids belong to. Defaults to the API v2 key of this module: str
+        """
+        self.path = path
+        self.ttl = ttl
+        self.namespace = hashlib.sha256((api_key or API_V2).encode('utf-8')).hexdigest()[:16]
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)")
+            row = self.connection.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone()
+            if row is not None and int(row[0]) != self.SCHEMA_VERSION:
+                logger.info("Persistent cache %s has schema version %s, rebuilding it with version %s", self.path, row[0], self.SCHEMA_VERSION)
+                for table in ("boards", "columns", "items"):
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS boards (namespace TEXT, board_name TEXT, board_id TEXT, stored_at REAL, PRIMARY KEY (namespace, board_name))")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS columns (namespace TEXT, board_name TEXT, columns_json TEXT, stored_at REAL, PRIMARY KEY (namespace, board_name))")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS items (namespace TEXT, board_name TEXT, item_name TEXT, item_id TEXT, stored_at REAL, PRIMARY KEY (namespace, board_name, item_name, item_id))")
+            self.connection.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', ?)", (str(self.SCHEMA_VERSION),))
+
+    def _fetch(self, query, parameters):
+        # ENTRIES OLDER THAN THE TTL ARE TREATED AS MISSING
+        with self.lock:
+            return self.connection.execute(query, (self.namespace,) + parameters + (time.time() - self.ttl,)).fetchall()
+
+    def _write(self, statements):
+        with self.lock, self.connection:
+            for query, parameters in statements:
+                self.connection.execute(query, parameters)
+
+    def get_board_id(self, board_name):
+        """
+        :param board_name: str
+        :return: Cached id of the board, or None: str
+        """
+        rows = self._fetch("SELECT board_id FROM boards WHERE namespace = ? AND board_name = ? AND stored_at >= ?", (board_name,))
+        return rows[0][0] if rows else None
+
+    def set_board_id(self, board_name, board_id):
+        """
+        :param board_name: str
+        :param board_id: str
+        """
+        self._write([("INSERT OR REPLACE INTO boards VALUES (?, ?, ?, ?)", (self.namespace, board_name, str(board_id), time.time()))])
+
+    def get_columns(self, board_name):
+        """
+        :param board_name: str
+        :return: Cached columns of the board as dicts (id, title, type, settings_str), or None: List
+        """
+        rows = self._fetch("SELECT columns_json FROM columns WHERE namespace = ? AND board_name = ? AND stored_at >= ?", (board_name,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def set_columns(self, board_name, columns_list):
+        """
+        :param board_name: str
+        :param columns_list: List of moncli column objects or column dicts: List
+        """
+        columns = []
+        for column in columns_list:
+            codec = ColumnCodec.from_column(column)
+            columns.append({"id": codec.id, "title": codec.title, "type": codec.type, "settings_str": codec.settings_str})
+        self._write([("INSERT OR REPLACE INTO columns VALUES (?, ?, ?, ?)", (self.namespace, board_name, json.dumps(columns), time.time()))])
+
+    def get_item_ids(self, board_name, item_name):
+        """
+        :param board_name: str
+        :param item_name: str
+        :return: Cached ids of the items with the name passed. Empty if unknown: List
+        """
+        rows = self._fetch("SELECT item_id FROM items WHERE namespace = ? AND board_name = ? AND item_name = ? AND stored_at >= ?", (board_name, item_name))
+        return [row[0] for row in rows]
+
+    def set_item_ids(self, board_name, item_name, item_ids):
+        """
+        Replaces the cached ids of the items with the name passed.
+        :param board_name: str
+        :param item_name: str
+        :param item_ids: List of item ids: List
+        """
+        now = time.time()
+        statements = [("DELETE FROM items WHERE namespace = ? AND board_name = ? AND item_name = ?", (self.namespace, board_name, item_name))]
+        statements += [("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?)", (self.namespace, board_name, item_name, str(item_id), now)) for item_id in item_ids]
+        self._write(statements)
+
+    def add_item_id(self, board_name, item_name, item_id):
+        """
+        Adds the id of a new item to the ids cached for its name.
+        :param board_name: str
+        :param item_name: str
+        :param item_id: str
+        """
+        self._write([("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?)", (self.namespace, board_name, item_name, str(item_id), time.time()))])
+
+    def invalidate_item(self, board_name, item_name):
+        """
+        Forgets the ids cached for an item name, e.g. after a write with a cached id failed.
+        :param board_name: str
+        :param item_name: str
+        """
+        self._write([("DELETE FROM items WHERE namespace = ? AND board_name = ? AND item_name = ?", (self.namespace, board_name, item_name))])
+
+    def invalidate_columns(self, board_name):
+        """
+        :param board_name: str
+        """
+        self._write([("DELETE FROM columns WHERE namespace = ? AND board_name = ?", (self.namespace, board_name))])
+
+    def invalidate_board(self, board_name):
+        """
+        Forgets everything cached for a board: its id, its columns and its items.
+        :param board_name: str
+        """
+        self._write([(f"DELETE FROM {table} WHERE namespace = ? AND board_name = ?", (self.namespace, board_name)) for table in ("boards", "columns", "items")])
+
+    def clear(self):
+        """
+        Forgets everything cached for the API key of this cache.
+        """
+        self._write([(f"DELETE FROM {table} WHERE namespace = ?", (self.namespace,)) for table in ("boards", "columns", "items")])
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self.lock:
+            self.connection.close()
+
+
+class ItemRecord:
+    """
+    Compact record of an item (id, name, board id and group id) kept in the caches and snapshots instead of a moncli
+    item object, which carries its credentials and lazily loaded object graphs in a per instance __dict__.
+    The moncli item object is only built when it is needed, with to_item().
+    """
+
+    __slots__ = ("id", "name", "board_id", "group_id")
+
+    def __init__(self, item_id, name, board_id, group_id=None):
+        """
+        :param item_id: int
+        :param name: str
+        :param board_id: int
+        :param group_id: str
+        """
+        self.id = int(item_id)
+        self.name = name
+        self.board_id = int(board_id)
+        # GROUP IDS REPEAT FOR ALL THE ITEMS OF A GROUP: A SINGLE STRING IS KEPT PER GROUP ID
+        self.group_id = sys.intern(group_id) if group_id else None
+
+    @classmethod
+    def from_item(cls, item_object, board_id, group_id=None):
+        """
+        :param item_object: moncli item object
+        :param board_id: Id of the board of the item. moncli keeps the board and group ids of an item private: int
+        :param group_id: Id of the group of the item, when known: str
+        :return: ItemRecord
+        """
+        return cls(item_object.id, item_object.name, board_id, group_id)
+
+    @classmethod
+    def from_data(cls, item_data):
+        """
+        :param item_data: Item as returned by the API, with id, name, board.id and optionally group.id: dict
+        :return: ItemRecord
+        """
+        group = item_data.get('group') or {}
+        return cls(item_data['id'], item_data['name'], item_data['board']['id'], group.get('id'))
+
+    def to_item(self, creds):
+        """
+        Builds the moncli item object of the record.
+        :param creds: MondayClientCredentials used by the item object for its API requests
+        :return: moncli item object
+        """
+        item_data = {'id': str(self.id), 'name': self.name, 'board': {'id': str(self.board_id)}}
+        if self.group_id:
+            item_data['group'] = {'id': self.group_id}
+        return Item(creds=creds, **item_data)
+
+    def __repr__(self):
+        return f"<ItemRecord {self.id} '{self.name}'>"
+
+
+class UserDirectory:
+    """
+    In-memory directory of the users of the account, indexed by id, email and name.
+    The users are loaded with a single request and reloaded when the directory is older than its ttl or when
+    refresh() is called. Lookups against the directory do not query the Monday API.
+    """
+
+    def __init__(self, ttl=USER_DIRECTORY_TTL, scheduler=None, connection=None):
+        """
+        :param ttl: Number of seconds the loaded users are considered fresh: int
+        :param scheduler: RequestScheduler the API requests go through. Defaults to the scheduler of the connection
+        :param connection: MondayConnection whose credentials are used. Defaults to DEFAULT_CONNECTION
+        """
+        self.ttl = ttl
+        self.connection = connection or DEFAULT_CONNECTION
+        self.scheduler = scheduler or self.connection.scheduler
+        self.loaded_at = None
+        self.lock = threading.RLock()
+
+        self.users = []
+        self.users_by_id = {}
+        # EMAILS ARE INDEXED LOWER CASED: THEY ARE CASE INSENSITIVE
+        self.users_by_email = {}
+        self.users_by_name = {}
+
+    def refresh(self):
+        """
+        Reloads all the users of the account.
+        :return: Number of users loaded: int
+        """
+        with self.lock:
+            users = self.scheduler.call(self.connection.client.get_users, kind=UserKind.all, description="get users")
+            users_by_id = {}
+            users_by_email = {}
+            users_by_name = {}
+            for user in users:
+                users_by_id[int(user.id)] = user
+                if getattr(user, 'email', None):
+                    users_by_email.setdefault(user.email.strip().lower(), user)
+                if getattr(user, 'name', None):
+                    # FIRST USER WINS WHEN TWO USERS SHARE A NAME
+                    users_by_name.setdefault(user.name, user)
+            self.users = list(users)
+            self.users_by_id = users_by_id
+            self.users_by_email = users_by_email
+            self.users_by_name = users_by_name
+            self.loaded_at = time.time()
+        logger.info("User directory loaded with %s users", len(self.users))
+        return len(self.users)
+
+    def is_stale(self):
+        """
+        Checks if the directory was never loaded or was loaded more than ttl seconds ago.
+        :return: Boolean
+        """
+        if self.loaded_at is None:
+            return True
+        return time.time() - self.loaded_at > self.ttl
+
+    def ensure_fresh(self):
+        """
+        Reloads the directory if it is stale. Concurrent callers wait for a single reload.
+        """
+        if self.is_stale():
+            with self.lock:
+                if self.is_stale():
+                    self.refresh()
+
+    def get_by_id(self, user_id):
+        """
+        :param user_id: int
+        :return: User object or None
+        """
+        self.ensure_fresh()
+        return self.users_by_id.get(int(user_id))
+
+    def get_by_email(self, email):
+        """
+        :param email: str
+        :return: User object or None
+        """
+        self.ensure_fresh()
+        return self.users_by_email.get(email.strip().lower())
+
+    def get_by_name(self, name):
+        """
+        :param name: str
+        :return: User object or None
+        """
+        self.ensure_fresh()
+        return self.users_by_name.get(name)
+
+    def resolve_id(self, user):
+        """
+        Resolves a user given by id, email or name to its id.
+        :param user: User id, email or name: int or str
+        :return: Id of the user, or None if no user matches: int
+        """
+        if isinstance(user, int) or (isinstance(user, str) and user.strip().isdigit()):
+            user_object = self.get_by_id(user)
+        elif '@' in user:
+            user_object = self.get_by_email(user)
+        else:
+            user_object = self.get_by_name(user.strip())
+        return int(user_object.id) if user_object is not None else None
+
+    def __len__(self):
+        return len(self.users)
+
+
+class ColumnIndex:
+    """
+    In-memory secondary index of the values of one column of a board: value -> item ids, for O(1) exact match
+    lookups, and a sorted list of (value, item id), rebuilt lazily after changes, for range queries.
+    Values are indexed as decoded by the column codec (status label, number as float, date as YYYY-MM-DD, link url,
+    text). Empty values are not indexed. A unique index holds at most one item per value.
+    """
+
+    def __init__(self, board_name, col_title, column_id, column_type, unique=False):
+        """
+        :param board_name: str
+        :param col_title: Title of the indexed column: str
+        :param column_id: Id of the indexed column: str
+        :param column_type: Type of the indexed column as reported by the API: str
+        :param unique: Reject values held by another item: bool
+        """
+        self.board_name = board_name
+        self.col_title = col_title
+        self.column_id = column_id
+        self.column_type = column_type
+        self.unique = unique
+        self.lock = threading.RLock()
+
+        self.values_by_item = {}
+        self.items_by_value = {}
+        self.names_by_item = {}
+        # SORTED LIST OF (VALUE, ITEM ID). None WHEN IT MUST BE REBUILT
+        self.sorted_values = None
+
+    def normalize(self, value):
+        """
+        Converts a value written to or looked up in the column to its indexed form.
+        :param value: Value, as decoded by the column codec or as passed to a write. Link values can be (url, link text) tuples
+        :return: Indexed value, or None for an empty value
+        """
+        if isinstance(value, tuple):
+            value = value[0]
+        if value is None or value == '':
+            return None
+        if self.column_type == 'numeric':
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        return str(value)
+
+    def build(self, items):
+        """
+        Indexes the items of the board, replacing the current content of the index.
+        :param items: Iterable of (item id, item name, value)
+        :return: Number of items indexed: int
+        """
+        values_by_item = {}
+        items_by_value = {}
+        names_by_item = {}
+        duplicates = []
+        for item_id, item_name, value in items:
+            item_id = int(item_id)
+            names_by_item[item_id] = item_name
+            value = self.normalize(value)
+            if value is None:
+                continue
+            values_by_item[item_id] = value
+            same_value_items = items_by_value.setdefault(value, set())
+            if self.unique and same_value_items:
+                duplicates.append(value)
+            same_value_items.add(item_id)
+        if duplicates:
+            raise ValueError(f"Column '{self.col_title}' of board '{self.board_name}' has duplicate values: {duplicates[:10]}")
+
+        with self.lock:
+            self.values_by_item = values_by_item
+            self.items_by_value = items_by_value
+            self.names_by_item = names_by_item
+            self.sorted_values = None
+        return len(values_by_item)
+
+    def conflicting_item(self, item_id, value):
+        """
+        :param item_id: Id of the item the value is written to, or None for a new item: int
+        :param value: Value written
+        :return: Id of another item holding the value in a unique index, or None: int
+        """
+        value = self.normalize(value)
+        if not self.unique or value is None:
+            return None
+        with self.lock:
+            others = self.items_by_value.get(value, set()) - {int(item_id) if item_id is not None else None}
+        return next(iter(others), None)
+
+    def update(self, item_id, value, item_name=None):
+        """
+        Sets the indexed value of an item, e.g. after the wrapper wrote it.
+        :param item_id: int
+        :param value: New value of the column
+        :param item_name: Name of the item, when known: str
+        """
+        item_id = int(item_id)
+        value = self.normalize(value)
+        with self.lock:
+            self._discard(item_id)
+            if item_name is not None:
+                self.names_by_item[item_id] = item_name
+            if value is not None:
+                self.values_by_item[item_id] = value
+                self.items_by_value.setdefault(value, set()).add(item_id)
+            self.sorted_values = None
+
+    def rename(self, item_id, item_name):
+        """
+        Sets the name of an indexed item.
+        :param item_id: int
+        :param item_name: str
+        """
+        with self.lock:
+            if int(item_id) in self.names_by_item:
+                self.names_by_item[int(item_id)] = item_name
+
+    def remove(self, item_id):
+        """
+        Removes an item (e.g. one archived or deleted) from the index.
+        :param item_id: int
+        """
+        item_id = int(item_id)
+        with self.lock:
+            self._discard(item_id)
+            self.names_by_item.pop(item_id, None)
+            self.sorted_values = None
+
+    def _discard(self, item_id):
+        # THE LOCK MUST BE HELD
+        old_value = self.values_by_item.pop(item_id, None)
+        if old_value is not None:
+            same_value_items = self.items_by_value.get(old_value, set())
+            same_value_items.discard(item_id)
+            if not same_value_items:
+                self.items_by_value.pop(old_value, None)
+
+    def find(self, value):
+        """
+        :param value: Value looked up
+        :return: (item id, item name) of the items holding the value, in id order: List of tuples
+        """
+        value = self.normalize(value)
+        with self.lock:
+            return [(item_id, self.names_by_item.get(item_id)) for item_id in sorted(self.items_by_value.get(value, ()))]
+
+    def find_range(self, low=None, high=None):
+        """
+        :param low: Lowest value looked up (included), or None for no lower bound
+        :param high: Highest value looked up (included), or None for no upper bound
+        :return: (item id, item name, value) of the items whose value is within the bounds, in value order: List of tuples
+        """
+        low = self.normalize(low)
+        high = self.normalize(high)
+        with self.lock:
+            if self.sorted_values is None:
+                self.sorted_values = sorted((value, item_id) for item_id, value in self.values_by_item.items())
+            sorted_values = self.sorted_values
+            start = 0 if low is None else bisect.bisect_left(sorted_values, (low,))
+            entries = []
+            for value, item_id in sorted_values[start:]:
+                if high is not None and value > high:
+                    break
+                entries.append((item_id, self.names_by_item.get(item_id), value))
+            return entries
+
+    def __len__(self):
+        return len(self.values_by_item)
+
+
+class BoardSnapshot:
+    """
+    In-memory index of all the items of a single board, keyed by item name and by item id.
+    Items are held as ItemRecord objects and the moncli item objects returned by the lookups are built on demand.
+    The items are loaded once with paginated bulk reads and reloaded when the snapshot is older than its ttl
+    or when refresh() is called. Lookups against the snapshot do not query the Monday API.
+    In incremental mode, a stale snapshot is brought up to date with sync() instead of being reloaded: only the items
+    created, changed or deleted since the last activity log seen (the watermark) are fetched and patched in place.
+    """
+
+    # ACTIVITY LOG EVENTS AFTER WHICH AN ITEM IS NO LONGER ON THE BOARD
+    REMOVAL_EVENTS = {"delete_pulse", "archive_pulse", "move_pulse_from_board"}
+    # SECONDS SUBTRACTED FROM THE WATERMARK WHEN QUERYING THE ACTIVITY LOGS, TO COVER CLOCK DIFFERENCES AND LATE LOGS.
+    # LOGS SEEN BEFORE ARE RECOGNISED BY THEIR ID AND SKIPPED
+    SYNC_OVERLAP = 60
+    # NUMBER OF ACTIVITY LOGS FETCHED PER REQUEST
+    LOGS_PAGE_SIZE = 500
+
+    def __init__(self, board_object, ttl=300, page_size=100, scheduler=None, connection=None, incremental=False, on_sync=None):
+        """
+        :param board_object: moncli board object of the board to index
+        :param ttl: Number of seconds the loaded items are considered fresh: int
+        :param page_size: Number of items fetched per API request while loading: int
+        :param scheduler: RequestScheduler the API requests go through. Defaults to the scheduler of the connection
+        :param connection: MondayConnection whose credentials are used. Defaults to DEFAULT_CONNECTION
+        :param incremental: Bring a stale snapshot up to date with sync() instead of reloading every item: bool
+        :param on_sync: Function called with the changes (see sync()) after each sync that changed the snapshot
+        """
+        self.board = board_object
+        self.ttl = ttl
+        self.page_size = page_size
+        self.connection = connection or DEFAULT_CONNECTION
+        self.scheduler = scheduler or self.connection.scheduler
+        self.incremental = incremental
+        self.on_sync = on_sync
+        self.loaded_at = None
+        self.lock = threading.RLock()
+
+        self.items_by_id = {}
+        self.items_by_name = {}
+
+        # TIME (SECONDS, API CLOCK) OF THE LAST ACTIVITY LOG APPLIED AND IDS OF THE LOGS APPLIED WITHIN THE OVERLAP
+        self.watermark = None
+        self.seen_log_ids = {}
+
+    def refresh(self):
+        """
+        (Re)loads every item of the board into the index.
+        The items are streamed with cursor pagination (see ItemPageReader): one request is made per page of items.
+        :return: Number of items loaded: int
+        """
+        logger.info("Loading snapshot of items for board '%s'", self.board.name)
+        # CHANGES MADE WHILE LOADING ARE PICKED UP BY THE NEXT SYNC
+        watermark = time.time()
+        reader = ItemPageReader(self.board.id, page_size=self.page_size, scheduler=self.scheduler, connection=self.connection)
+
+        items_by_id = {}
+        items_by_name = {}
+        for item in reader:
+            record = ItemRecord(item["id"], item["name"], item["board_id"], item["group_id"])
+            items_by_id[record.id] = record
+            items_by_name.setdefault(record.name, []).append(record)
+
+        # LOOKUPS AND SYNCS HOLD THE LOCK: THEY NEVER SEE ONE INDEX REPLACED AND NOT THE OTHER
+        with self.lock:
+            self.items_by_id = items_by_id
+            self.items_by_name = items_by_name
+            self.loaded_at = time.time()
+            self.watermark = watermark
+            self.seen_log_ids = {}
+        logger.info("Snapshot of board '%s' loaded with %s items", self.board.name, len(items_by_id))
+        return len(items_by_id)
+
+    def _fetch_items(self, item_ids):
+        # ONLY THE ITEMS CHANGED SINCE THE LAST SYNC ARE FETCHED BY ID. FULL LOADS STREAM THE BOARD (SEE refresh)
+        records = []
+        for start in range(0, len(item_ids), self.page_size):
+            page_ids = item_ids[start:start + self.page_size]
+            # BOARD.GET_ITEMS ALWAYS LOADS EVERY ITEM OF THE BOARD IN ONE REQUEST, SO PAGES ARE REQUESTED WITH THE ITEMS QUERY
+            items_data = self.scheduler.call(api_v2.get_items, self.connection.api_key_v2, 'id', 'name', 'state', 'board.id', 'group.id', ids=page_ids, limit=len(page_ids), description="get page of items for snapshot")
+            for item_data in items_data:
+                # ARCHIVED/ DELETED ITEMS AND ITEMS MOVED TO ANOTHER BOARD ARE NOT PART OF THE BOARD
+                if item_data.get('state', 'active') != 'active' or str(item_data['board']['id']) != str(self.board.id):
+                    continue
+                records.append(ItemRecord.from_data(item_data))
+        return records
+
+    def _fetch_activity_logs(self):
+        since = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.watermark - self.SYNC_OVERLAP))
+        logs = []
+        page = 1
+        while True:
+            query = (f"query {{ complexity {{ query after reset_in_x_seconds }} boards (ids: [{int(self.board.id)}]) "
+                     f"{{ activity_logs (from: {graphql_string(since)}, limit: {self.LOGS_PAGE_SIZE}, page: {page}) {{ id event data created_at }} }} }}")
+            response = self.scheduler.call(self.connection.execute_graphql, query, raise_errors=True, description=f"get activity logs of board '{self.board.name}'", operation="activity_logs")
+            self.scheduler.report_complexity(response["data"])
+            boards = response["data"].get("boards") or []
+            page_logs = (boards[0].get("activity_logs") or []) if boards else []
+            logs.extend(page_logs)
+            if len(page_logs) < self.LOGS_PAGE_SIZE:
+                return logs
+            page += 1
+
+    def sync(self):
+        """
+        Brings the snapshot up to date from the activity logs of the board written since the watermark: the items
+        created or changed since then are fetched again and the deleted/ archived items are dropped from the index.
+        One request is made per page of activity logs, then one request per page of changed items.
+        A snapshot that was never loaded is loaded with refresh().
+        :return: Changes applied: dict with "changed" (new ItemRecord objects), "deleted" and "renamed" (previous ItemRecord objects)
+        """
+        if self.loaded_at is None or self.watermark is None:
+            self.refresh()
+            return {"changed": self.get_all_records(), "deleted": [], "renamed": []}
+
+        logs = [log for log in self._fetch_activity_logs() if log["id"] not in self.seen_log_ids]
+        # LOGS ARE RETURNED NEWEST FIRST. REPLAY THEM OLDEST FIRST SO THE LAST EVENT OF EACH ITEM WINS
+        logs.sort(key=lambda log: int(log["created_at"]))
+        changed_ids = set()
+        removed_ids = set()
+        for log in logs:
+            try:
+                data = json.loads(log.get("data") or "{}")
+            except ValueError:
+                data = {}
+            item_id = data.get("pulse_id")
+            if item_id is None:
+                continue
+            if log["event"] in self.REMOVAL_EVENTS:
+                removed_ids.add(int(item_id))
+                changed_ids.discard(int(item_id))
+            else:
+                changed_ids.add(int(item_id))
+                removed_ids.discard(int(item_id))
+
+        changed = self._fetch_items(sorted(changed_ids))
+        # CHANGED ITEMS THAT ARE NOT RETURNED ANY MORE (DELETED, ARCHIVED OR MOVED) ARE DROPPED AS WELL
+        removed_ids.update(changed_ids - {record.id for record in changed})
+
+        deleted = [record for record in (self.remove_item(item_id) for item_id in removed_ids) if record is not None]
+        renamed = []
+        for record in changed:
+            previous = self.items_by_id.get(record.id)
+            if previous is not None and previous.name != record.name:
+                self.remove_item(previous.id)
+                renamed.append(previous)
+            self.add_item(record)
+
+        # MOVE THE WATERMARK TO THE NEWEST LOG APPLIED AND FORGET THE LOG IDS THAT FELL OUT OF THE OVERLAP
+        for log in logs:
+            self.seen_log_ids[log["id"]] = int(log["created_at"]) / 10 ** 7
+        if self.seen_log_ids:
+            self.watermark = max(self.watermark, max(self.seen_log_ids.values()))
+            self.seen_log_ids = {log_id: created_at for log_id, created_at in self.seen_log_ids.items() if created_at >= self.watermark - self.SYNC_OVERLAP}
+        self.loaded_at = time.time()
+
+        changes = {"changed": changed, "deleted": deleted, "renamed": renamed}
+        logger.info("Snapshot of board '%s' synced from %s activity logs: %s changed, %s deleted items", self.board.name, len(logs), len(changed), len(deleted))
+        if self.on_sync is not None and (changed or deleted):
+            self.on_sync(changes)
+        return changes
+
+    def is_stale(self):
+        """
+        Checks if the snapshot was never loaded or was loaded more than ttl seconds ago.
+        :return: Boolean
+        """
+        if self.loaded_at is None:
+            return True
+        return time.time() - self.loaded_at > self.ttl
+
+    def ensure_fresh(self):
+        """
+        Reloads the snapshot if it is stale, or syncs it in incremental mode.
+        """
+        if self.is_stale():
+            if self.incremental and self.loaded_at is not None:
+                self.sync()
+            else:
+                self.refresh()
+
+    def get_records_by_name(self, item_name):
+        """
+        :param item_name: str
+        :return: List of the records of the items with the name passed: List of ItemRecord
+        """
+        with self.lock:
+            return list(self.items_by_name.get(item_name, []))
+
+    def get_all_records(self):
+        """
+        :return: List of the records of all the items in the snapshot: List of ItemRecord
+        """
+        with self.lock:
+            return list(self.items_by_id.values())
+
+    def get_items_by_name(self, item_name):
+        """
+        :param item_name: str
+        :return: List of item objects with the name passed: List
+        """
+        creds = self.connection.creds
+        return [record.to_item(creds) for record in self.get_records_by_name(item_name)]
+
+    def get_record_by_id(self, item_id):
+        """
+        :param item_id: int
+        :return: ItemRecord or None
+        """
+        with self.lock:
+            return self.items_by_id.get(int(item_id))
+
+    def get_item_by_id(self, item_id):
+        """
+        :param item_id: int
+        :return: Item object or None
+        """
+        record = self.get_record_by_id(item_id)
+        return record.to_item(self.connection.creds) if record is not None else None
+
+    def get_all_items(self):
+        """
+        :return: List of all item objects in the snapshot: List
+        """
+        creds = self.connection.creds
+        return [record.to_item(creds) for record in self.get_all_records()]
+
+    def add_item(self, item_object):
+        """
+        Adds an item (e.g. one just created through the API) to the index.
+        :param item_object: moncli item object or ItemRecord
+        """
+        record = item_object if isinstance(item_object, ItemRecord) else ItemRecord.from_item(item_object, self.board.id)
+        with self.lock:
+            self.items_by_id[record.id] = record
+            same_name_items = self.items_by_name.setdefault(record.name, [])
+            same_name_items[:] = [item for item in same_name_items if item.id != record.id]
+            same_name_items.append(record)
+
+    def remove_item(self, item_id):
+        """
+        Removes an item (e.g. one deleted through the API) from the index.
+        :param item_id: int
+        :return: The record of the removed item, or None if the item was not in the index: ItemRecord
+        """
+        with self.lock:
+            record = self.items_by_id.pop(int(item_id), None)
+            if record is not None:
+                same_name_items = self.items_by_name.get(record.name, [])
+                same_name_items[:] = [item for item in same_name_items if item.id != record.id]
+                if not same_name_items:
+                    self.items_by_name.pop(record.name, None)
+        return record
+
+
+class ItemPageReader:
+    """
+    Streams the items of one board with cursor pagination (items_page, then next_items_page).
+    Only the current page is held in memory, plus the next page when prefetch is on: a background thread then
+    fetches the next page while the caller processes the current one.
+    Items are plain dicts (id, name, board_id, group_id and, when columns are requested, column_values keyed by
+    column title and decoded with the column codecs) instead of moncli objects.
+    """
+
+    # COMPLEXITY ASSUMED FOR EACH ITEM OF A PAGE BEFORE THE API REPORTS THE ACTUAL COMPLEXITY
+    ESTIMATED_ITEM_COMPLEXITY = 20
+
+    def __init__(self, board_id, page_size=500, codecs=None, prefetch=False, scheduler=None, connection=None):
+        """
+        :param board_id: Id of the board to read: int
+        :param page_size: Number of items fetched per API request (monday.com allows at most 500): int
+        :param codecs: ColumnCodec objects of the columns to read with each item: List
+        :param prefetch: Fetch the next page in the background while the current page is processed: bool
+        :param scheduler: RequestScheduler the API requests go through. Defaults to the scheduler of the connection
+        :param connection: MondayConnection whose credentials are used. Defaults to DEFAULT_CONNECTION
+        """
+        self.board_id = board_id
+        self.page_size = page_size
+        self.codecs = list(codecs or [])
+        self.codecs_by_id = {codec.id: codec for codec in self.codecs}
+        self.prefetch = prefetch
+        self.connection = connection or DEFAULT_CONNECTION
+        self.scheduler = scheduler or self.connection.scheduler
+        self.estimated_complexity = page_size * self.ESTIMATED_ITEM_COMPLEXITY * (1 + len(self.codecs))
+
+        item_fields = "id name group { id }"
+        if self.codecs:
+            column_ids = ", ".join(graphql_string(codec.id) for codec in self.codecs)
+            item_fields += f" column_values (ids: [{column_ids}]) {{ id text value }}"
+        self.page_fields = f"cursor items {{ {item_fields} }}"
+
+    def fetch_page(self, cursor=None):
+        """
+        Fetches one page of items.
+        :param cursor: Cursor returned with the previous page. None for the first page: str
+        :return: Cursor of the next page (None after the last page) and the items of the page: tuple
+        """
+        if cursor is None:
+            query = f"query {{ complexity {{ query after reset_in_x_seconds }} boards (ids: [{int(self.board_id)}]) {{ items_page (limit: {self.page_size}) {{ {self.page_fields} }} }} }}"
+        else:
+            query = f"query {{ complexity {{ query after reset_in_x_seconds }} next_items_page (limit: {self.page_size}, cursor: {graphql_string(cursor)}) {{ {self.page_fields} }} }}"
+        data = self.scheduler.call(self.connection.execute_graphql, query, raise_errors=True, description=f"get page of items of board {self.board_id}",
+                                   cost=self.estimated_complexity, operation="items_page")["data"]
+
+        complexity = self.scheduler.report_complexity(data)
+        if complexity.get("query"):
+            self.estimated_complexity = complexity["query"]
+
+        if cursor is None:
+            boards = data.get("boards") or []
+            page = boards[0]["items_page"] if boards else {}
+        else:
+            page = data.get("next_items_page") or {}
+        return page.get("cursor"), [self._item_dict(item_data) for item_data in page.get("items") or []]
+
+    def _item_dict(self, item_data):
+        group = item_data.get("group") or {}
+        item = {"id": item_data["id"], "name": item_data["name"], "board_id": str(self.board_id), "group_id": group.get("id")}
+        if self.codecs:
+            item["column_values"] = {codec.title: None for codec in self.codecs}
+            for column_value in item_data.get("column_values") or []:
+                codec = self.codecs_by_id.get(column_value["id"])
+                if codec is not None:
+                    item["column_values"][codec.title] = codec.decode(column_value.get("value"), column_value.get("text"))
+        return item
+
+    def pages(self):
+        """
+        Generator of the pages of items of the board, in board order.
+        :return: Lists of item dicts
+        """
+        if self.prefetch:
+            yield from self._prefetched_pages()
+            return
+
+        cursor = None
+        while True:
+            cursor, items = self.fetch_page(cursor)
+            if items:
+                yield items
+            if not cursor:
+                return
+
+    def _prefetched_pages(self):
+        # THE QUEUE HOLDS ONE PAGE, SO THE READER IS NEVER MORE THAN ONE PAGE AHEAD OF THE CALLER
+        pages = queue.Queue(maxsize=1)
+        stop = threading.Event()
+
+        def put(entry):
+            # GIVE UP WHEN THE CALLER STOPS ITERATING, INSTEAD OF BLOCKING ON A FULL QUEUE FOREVER
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read_pages():
+            cursor = None
+            try:
+                while not stop.is_set():
+                    cursor, items = self.fetch_page(cursor)
+                    put(("page", items))
+                    if not cursor:
+                        break
+            except Exception as e:
+                put(("error", e))
+            put(("done", None))
+
+        reader = threading.Thread(target=read_pages, name=f"items-prefetch-{self.board_id}", daemon=True)
+        reader.start()
+        try:
+            while True:
+                kind, value = pages.get()
+                if kind == "error":
+                    raise value
+                if kind == "done":
+                    return
+                if value:
+                    yield value
+        finally:
+            stop.set()
+
+    def __iter__(self):
+        for items in self.pages():
+            yield from items
+
+
+class BatchOperation:
+    """
+    A single mutation queued in a BatchWriter.
+    """
+
+    def __init__(self, kind, description, arguments=None, fields=("id",), error=None, board_name=None, item_name=None, column_values=None):
+        """
+        :param kind: Name of the GraphQL mutation (e.g. change_multiple_column_values): str
+        :param description: Human readable description of the operation, used in logs and results: str
+        :param arguments: Mapping of argument name to already formatted GraphQL literal: dict
+        :param fields: Fields selected from the mutation result: tuple
+        :param error: Set when the operation could not be prepared (e.g. item not found). It is then never sent: str
+        :param board_name: Name of the board the operation applies to: str
+        :param item_name: Name of the item the operation applies to: str
+        :param column_values: Column values written by the operation, as passed by the caller (title -> value): dict
+        """
+        self.kind = kind
+        self.board_name = board_name
+        self.item_name = item_name
+        self.column_values = column_values
+        self.description = description
+        self.arguments = arguments or {}
+        self.fields = fields
+        self.error = error
+
+    def format_field(self, alias):
+        """
+        Formats the operation as an aliased field of a GraphQL mutation document.
+        :param alias: str
+        :return: str
+        """
+        formatted_args = ", ".join(f"{key}: {value}" for key, value in self.arguments.items())
+        return f"{alias}: {self.kind} ({formatted_args}) {{ {' '.join(self.fields)} }}"
+
+
+class BatchResult:
+    """
+    Outcome of one BatchOperation after BatchWriter.execute().
+    """
+
+    def __init__(self, operation, success, data=None, error=None):
+        self.operation = operation
+        self.success = success
+        self.data = data
+        self.error = error
+
+    def __repr__(self):
+        status = "OK" if self.success else f"FAILED ({self.error})"
+        return f"<BatchResult {self.operation.description}: {status}>"
+
+
+class BatchWriter:
+    """
+    Packs many mutations (column changes, moves to groups, new items, new columns and groups) into a few GraphQL documents
+    using aliased fields, so that thousands of writes need only a handful of HTTP requests.
+    Each document is sized to stay under the per request complexity limit and every result is mapped
+    back to the operation it belongs to.
+    """
+
+    # ROUGH COMPLEXITY COST OF EACH MUTATION. REFINED FROM THE COMPLEXITY REPORTED BY THE API AFTER EACH REQUEST
+    ESTIMATED_COMPLEXITY = {
+        "change_multiple_column_values": 30000,
+        "move_item_to_group": 30000,
+        "create_item": 30000,
+        "archive_item": 30000,
+        "create_column": 30000,
+        "create_group": 30000,
+    }
+    # MUTATIONS WHOSE EFFECT IS THE SAME WHEN APPLIED TWICE. A CHUNK WITH ANY OTHER MUTATION (CREATIONS) IS NOT SENT AGAIN
+    # AFTER A FAILURE THAT MAY HAVE HAPPENED ONCE IT WAS APPLIED (TIMEOUT, NETWORK ERROR, 5XX), AS THAT COULD DUPLICATE ITEMS
+    IDEMPOTENT_KINDS = {"change_multiple_column_values", "move_item_to_group", "archive_item"}
+
+    def __init__(self, wrapper, board_name=None, max_operations=50, max_complexity=MAX_COMPLEXITY_PER_REQUEST):
+        """
+        :param wrapper: MondayWrapper used to resolve board, item, group and column names
+        :param board_name: Default board for the operations. If not passed, the board of the wrapper is used: str
+        :param max_operations: Maximum number of aliased mutations sent in a single request: int
+        :param max_complexity: Maximum total estimated complexity of a single request: int
+        """
+        self.wrapper = wrapper
+        self.board_name = board_name or wrapper.board_name
+        self.max_operations = max_operations
+        self.max_complexity = max_complexity
+
+        self.operations = []
+        self.estimated_complexity = dict(self.ESTIMATED_COMPLEXITY)
+        # VALUES OF UNIQUE COLUMN INDEXES QUEUED IN THIS BATCH: (BOARD NAME, COLUMN TITLE, VALUE) -> ITEM ID
+        self.claimed_values = {}
+
+    def _resolve_item_id(self, item_name, board_name):
+        return self.wrapper.get_item_id_by_name(item_name=item_name, board_name=board_name)
+
+    def _resolve_group_id(self, group_name, board_name):
+        group_id = self.wrapper.get_group_id(group_name, board_name=board_name)
+        if group_id is None:
+            raise ValueError(f"No group with title '{group_name}' in board '{board_name}'")
+        return group_id
+
+    def _compose_column_values(self, column_values, board_name):
+        composed = {}
+        for col_title, new_value in column_values.items():
+            if new_value is None:
+                continue
+            link_text = None
+            if isinstance(new_value, tuple):
+                new_value, link_text = new_value
+            column_value = self.wrapper._compose_column_value(col_title=col_title, new_value=new_value, board_name=board_name, link_text=link_text)
+            if column_value is None:
+                raise ValueError(f"Could not compose value for column '{col_title}'")
+            composed[column_value.id] = column_value.format()
+        return composed
+
+    def change_columns(self, item_name, column_values, board_name=None, item_id=None):
+        """
+        Queues a change of several column values of one item.
+        :param item_name: Name of item/ task: str
+        :param column_values: Mapping of column title to new value. Link values can be (url, link text) tuples: dict
+        :param board_name: str
+        :param item_id: Id of the item, when already known. The item is then not looked up by name: int
+        :return: The queued operation: BatchOperation
+        """
+        board_name = board_name or self.board_name
+        description = f"change columns {list(column_values)} of item '{item_name}'"
+        try:
+            if item_id is None:
+                item_id = self._resolve_item_id(item_name, board_name)
+            if item_id is None:
+                raise ValueError(f"No item found with name '{item_name}' in board '{board_name}'")
+            self.wrapper._check_unique_indexes(board_name, item_id, column_values, claimed_values=self.claimed_values)
+            board = self.wrapper._get_board_object(board_name)
+            arguments = {
+                "board_id": int(board.id),
+                "item_id": int(item_id),
+                "column_values": graphql_json(self._compose_column_values(column_values, board_name)),
+            }
+            operation = BatchOperation("change_multiple_column_values", description, arguments, board_name=board_name, item_name=item_name, column_values=column_values)
+        except Exception as e:
+            operation = BatchOperation("change_multiple_column_values", description, error=str(e), board_name=board_name, item_name=item_name, column_values=column_values)
+
+        self.operations.append(operation)
+        return operation
+
+    def move_item(self, item_name, group_name, board_name=None, item_id=None):
+        """
+        Queues a move of an item to another group.
+        :param item_name: Name of item/ task: str
+        :param group_name: Title of the target group: str
+        :param board_name: str
+        :param item_id: Id of the item, when already known. The item is then not looked up by name: int
+        :return: The queued operation: BatchOperation
+        """
+        board_name = board_name or self.board_name
+        description = f"move item '{item_name}' to group '{group_name}'"
+        try:
+            if item_id is None:
+                item_id = self._resolve_item_id(item_name, board_name)
+            if item_id is None:
+                raise ValueError(f"No item found with name '{item_name}' in board '{board_name}'")
+            arguments = {
+                "item_id": int(item_id),
+                "group_id": graphql_string(self._resolve_group_id(group_name, board_name)),
+            }
+            operation = BatchOperation("move_item_to_group", description, arguments, board_name=board_name, item_name=item_name)
+        except Exception as e:
+            operation = BatchOperation("move_item_to_group", description, error=str(e), board_name=board_name, item_name=item_name)
+
+        self.operations.append(operation)
+        return operation
+
+    def add_item(self, item_name, group_name=None, column_values=None, board_name=None):
+        """
+        Queues the creation of a new item, optionally in a group and with initial column values.
+        :param item_name: Name of the new item/ task: str
+        :param group_name: Title of the group to create the item in: str
+        :param column_values: Mapping of column title to initial value: dict
+        :param board_name: str
+        :return: The queued operation: BatchOperation
+        """
+        board_name = board_name or self.board_name
+        description = f"add item '{item_name}'"
+        try:
+            board = self.wrapper._get_board_object(board_name)
+            arguments = {
+                "board_id": int(board.id),
+                "item_name": graphql_string(item_name),
+            }
+            if group_name:
+                arguments["group_id"] = graphql_string(self._resolve_group_id(group_name, board_name))
+            if column_values:
+                self.wrapper._check_unique_indexes(board_name, None, column_values, claimed_values=self.claimed_values)
+                arguments["column_values"] = graphql_json(self._compose_column_values(column_values, board_name))
+            operation = BatchOperation("create_item", description, arguments, fields=("id", "name", "group { id }"), board_name=board_name, item_name=item_name, column_values=column_values)
+        except Exception as e:
+            operation = BatchOperation("create_item", description, error=str(e), board_name=board_name, item_name=item_name, column_values=column_values)
+
+        self.operations.append(operation)
+        return operation
+
+    def archive_item(self, item_name, board_name=None, item_id=None):
+        """
+        Queues the archiving of an item.
+        :param item_name: Name of item/ task: str
+        :param board_name: str
+        :param item_id: Id of the item, when already known. The item is then not looked up by name: int
+        :return: The queued operation: BatchOperation
+        """
+        board_name = board_name or self.board_name
+        description = f"archive item '{item_name}'"
+        try:
+            if item_id is None:
+                item_id = self._resolve_item_id(item_name, board_name)
+            if item_id is None:
+                raise ValueError(f"No item found with name '{item_name}' in board '{board_name}'")
+            operation = BatchOperation("archive_item", description, {"item_id": int(item_id)}, board_name=board_name, item_name=item_name)
+        except Exception as e:
+            operation = BatchOperation("archive_item", description, error=str(e), board_name=board_name, item_name=item_name)
+
+        self.operations.append(operation)
+        return operation
+
+    def add_column(self, column_title, column_type, settings=None, board_name=None):
+        """
+        Queues the creation of a column of any type.
+        :param column_title: Title of the new column: str
+        :param column_type: Column type as reported by the API (color, numeric ...) or ColumnType name (status, numbers ...): str
+        :param settings: Status labels (list or index -> label mapping) or settings dict of the new column (see column_defaults)
+        :param board_name: str
+        :return: The queued operation: BatchOperation
+        """
+        board_name = board_name or self.board_name
+        description = f"add column '{column_title}'"
+        try:
+            board = self.wrapper._get_board_object(board_name)
+            arguments = {
+                "board_id": int(board.id),
+                "title": graphql_string(column_title),
+                # ENUM VALUE: NOT QUOTED
+                "column_type": column_type_names(column_type)[1],
+            }
+            defaults = column_defaults(settings)
+            if defaults:
+                arguments["defaults"] = graphql_json(defaults)
+            operation = BatchOperation("create_column", description, arguments, fields=("id", "title", "type", "settings_str"), board_name=board_name)
+        except Exception as e:
+            operation = BatchOperation("create_column", description, error=str(e), board_name=board_name)
+
+        self.operations.append(operation)
+        return operation
+
+    def add_group(self, group_name, board_name=None):
+        """
+        Queues the creation of a group.
+        :param group_name: Title of the new group: str
+        :param board_name: str
+        :return: The queued operation: BatchOperation
+        """
+        board_name = board_name or self.board_name
+        description = f"add group '{group_name}'"
+        try:
+            board = self.wrapper._get_board_object(board_name)
+            arguments = {
+                "board_id": int(board.id),
+                "group_name": graphql_string(group_name),
+            }
+            operation = BatchOperation("create_group", description, arguments, fields=("id", "title"), board_name=board_name)
+        except Exception as e:
+            operation = BatchOperation("create_group", description, error=str(e), board_name=board_name)
+
+        self.operations.append(operation)
+        return operation
+
+    def _chunk_operations(self, operations):
+        chunk = []
+        chunk_complexity = 0
+        for operation in operations:
+            cost = self.estimated_complexity.get(operation.kind, MAX_COMPLEXITY_PER_REQUEST // self.max_operations)
+            if chunk and (len(chunk) >= self.max_operations or chunk_complexity + cost > self.max_complexity):
+                yield chunk
+                chunk = []
+                chunk_complexity = 0
+            chunk.append(operation)
+            chunk_complexity += cost
+        if chunk:
+            yield chunk
+
+    def _execute_chunk_query(self, query):
+        # A RESPONSE WITH ERRORS AND NO DATA AT ALL (E.G. COMPLEXITY BUDGET EXHAUSTED) IS RAISED SO THE SCHEDULER CAN RETRY IT
+        response = self.wrapper.connection.execute_graphql(query)
+        if response.get("errors") and not response.get("data"):
+            raise MondayApiError(query, 200, response["errors"])
+        return response
+
+    def _send_chunk(self, chunk):
+        aliases = [f"op{index}" for index in range(len(chunk))]
+        fields = " ".join(operation.format_field(alias) for alias, operation in zip(aliases, chunk))
+        query = f"mutation {{ complexity {{ query after reset_in_x_seconds }} {fields} }}"
+        chunk_complexity = sum(self.estimated_complexity.get(operation.kind, DEFAULT_REQUEST_COMPLEXITY) for operation in chunk)
+        idempotent = all(operation.kind in self.IDEMPOTENT_KINDS for operation in chunk)
+
+        scheduler = self.wrapper.scheduler
+        try:
+            response = scheduler.call(self._execute_chunk_query, query, description=f"batch of {len(chunk)} operations", cost=chunk_complexity,
+                                      operation="batch_mutation", idempotent=idempotent)
+        except Exception as e:
+            logger.error("Batch request with %s operations failed. ERROR DETAILS: %s", len(chunk), e)
+            error = str(e)
+            if scheduler.is_retryable(e) and not scheduler.is_rejected(e):
+                # THE OPERATIONS ARE REPORTED AS FAILED, BUT THE API MAY HAVE APPLIED THEM
+                error = f"Request failed and may have been applied: {e}"
+            return [BatchResult(operation, False, error=error) for operation in chunk]
+
+        data = response.get("data") or {}
+        errors_by_alias = {}
+        global_errors = []
+        for error in response.get("errors", []):
+            path = error.get("path") or []
+            if path and path[0] in aliases:
+                errors_by_alias.setdefault(path[0], []).append(error.get("message"))
+            else:
+                global_errors.append(error.get("message"))
+
+        # USE THE REPORTED COMPLEXITY TO SIZE THE NEXT CHUNKS BETTER AND TO CORRECT THE SCHEDULER BUDGET
+        complexity = self.wrapper.scheduler.report_complexity(data)
+        kinds = {operation.kind for operation in chunk}
+        if complexity.get("query") and len(kinds) == 1:
+            # THE API REPORTS THE COMPLEXITY OF THE WHOLE REQUEST: IT ONLY GIVES THE COST OF A KIND WHEN THE CHUNK HAS A SINGLE KIND
+            self.estimated_complexity[kinds.pop()] = complexity["query"] // len(chunk)
+
+        results = []
+        for alias, operation in zip(aliases, chunk):
+            if data.get(alias) is not None:
+                results.append(BatchResult(operation, True, data=data[alias]))
+            else:
+                error = "; ".join(errors_by_alias.get(alias, []) or global_errors) or "No result returned"
+                results.append(BatchResult(operation, False, error=error))
+        return results
+
+    def execute(self):
+        """
+        Sends all the queued operations and clears the queue.
+        Operations that could not be prepared are reported as failed without being sent.
+        :return: List of results in the order the operations were queued: List of BatchResult
+        """
+        operations = self.operations
+        self.operations = []
+        self.claimed_values = {}
+
+        results_by_operation = {}
+        sendable = []
+        for operation in operations:
+            if operation.error:
+                results_by_operation[id(operation)] = BatchResult(operation, False, error=operation.error)
+            else:
+                sendable.append(operation)
+
+        request_count = 0
+        for chunk in self._chunk_operations(sendable):
+            request_count += 1
+            for result in self._send_chunk(chunk):
+                results_by_operation[id(result.operation)] = result
+
+        results = [results_by_operation[id(operation)] for operation in operations]
+        failed = [result for result in results if not result.success]
+        logger.info("Batch of %s operations sent in %s requests. %s failed.", len(operations), request_count, len(failed))
+
+        self._apply_results_to_caches(results)
+        return results
+
+    def _apply_results_to_caches(self, results):
+        # NEW ITEMS ARE ADDED TO THE ITEM CACHE AND TO THE BOARD SNAPSHOT (IF ANY) SO NAME LOOKUPS FIND THEM
+        for result in results:
+            if result.success and result.operation.kind == "create_item":
+                board_id = result.operation.arguments["board_id"]
+                record = ItemRecord(result.data["id"], result.data["name"], board_id, (result.data.get("group") or {}).get("id"))
+                self.wrapper._add_cached_item(board_id, record)
+                for snapshot in self.wrapper.board_snapshots.values():
+                    if int(snapshot.board.id) == int(board_id):
+                        snapshot.add_item(record)
+                if self.wrapper.persistent_cache is not None:
+                    self.wrapper.persistent_cache.add_item_id(result.operation.board_name, record.name, record.id)
+                self.wrapper._update_indexes(result.operation.board_name, record.id, result.operation.column_values or {}, item_name=record.name)
+            elif result.success and result.operation.kind == "archive_item":
+                # ARCHIVED ITEMS ARE NO LONGER ON THE BOARD
+                item_id = result.operation.arguments["item_id"]
+                for snapshot in self.wrapper.board_snapshots.values():
+                    snapshot.remove_item(item_id)
+                self.wrapper._remove_from_indexes(result.operation.board_name, item_id)
+                self.wrapper._forget_item(result.operation.board_name, result.operation.item_name)
+            elif result.success and result.operation.kind == "create_column":
+                self.wrapper._add_cached_column(result.operation.board_name, result.data)
+            elif result.success and result.operation.kind == "create_group":
+                group_ids = self.wrapper.group_ids_cache.get(result.operation.board_name)
+                if group_ids is not None:
+                    group_ids.setdefault(result.data["title"], result.data["id"])
+            elif result.success and result.operation.kind == "move_item_to_group":
+                group_id = json.loads(result.operation.arguments["group_id"])
+                self.wrapper._apply_item_move(result.operation.board_name, result.operation.arguments["item_id"], result.operation.item_name, group_id)
+            elif result.success and result.operation.kind == "change_multiple_column_values":
+                self.wrapper._update_indexes(result.operation.board_name, result.operation.arguments["item_id"], result.operation.column_values or {}, item_name=result.operation.item_name)
+                if "Name" in (result.operation.column_values or {}):
+                    # THE CACHED RECORDS OF A RENAMED ITEM HOLD ITS FORMER NAME
+                    self.wrapper._invalidate_cached_item(result.operation.item_name, board_id=result.operation.arguments.get("board_id"))
+            elif not result.success and result.operation.error is None and result.operation.kind in ("change_multiple_column_values", "move_item_to_group", "archive_item"):
+                # THE WRITE WAS SENT WITH AN ITEM ID THAT MAY NO LONGER BE VALID
+                self.wrapper._forget_item(result.operation.board_name, result.operation.item_name)
+
+
+class FanOutResult:
+    """
+    Outcome of an operation run on one board by MondayWrapper.fan_out().
+    """
+
+    def __init__(self, board_name, success, value=None, error=None):
+        self.board_name = board_name
+        self.success = success
+        self.value = value
+        self.error = error
+
+    def __repr__(self):
+        status = "OK" if self.success else f"FAILED ({self.error})"
+        return f"<FanOutResult {self.board_name}: {status}>"
+
+
+class WriteBehindBuffer:
+    """
+    Collects cell changes and writes them later, so that repeated changes of the same cell cost a single write
+    and callers do not wait for the API.
+    Pending changes are kept per (board, item, column), the last value written to a cell wins. They are flushed when
+    max_pending cells are pending, max_delay seconds after the first pending change (from a background timer),
+    or when flush() is called. A flush sends one change_multiple_column_values per item through a BatchWriter.
+    Reads do not see the pending changes: call flush() first when a read must reflect them.
+    When the buffer is used as a context manager, the writes that failed when it was closed are logged and kept
+    in last_failures.
+    """
+
+    def __init__(self, wrapper, max_pending=500, max_delay=2.0, max_operations=50, on_failure=None):
+        """
+        :param wrapper: MondayWrapper used to resolve names and send the writes
+        :param max_pending: Number of pending cells that triggers a flush: int
+        :param max_delay: Seconds after the first pending change at which a flush is triggered. None to only flush on size or flush(): float
+        :param max_operations: Maximum number of item writes sent in a single request: int
+        :param on_failure: Function called with the failed results of the flushes triggered by size or time.
+        Without it, these failures are returned by the next flush(): function
+        """
+        self.wrapper = wrapper
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.max_operations = max_operations
+        self.on_failure = on_failure
+
+        self.lock = threading.Lock()
+        # A SINGLE FLUSH AT A TIME, SO THAT WRITES TO A CELL REACH THE API IN THE ORDER THEY WERE MADE
+        self.flush_lock = threading.Lock()
+        # (BOARD NAME, ITEM NAME) -> {COLUMN TITLE: VALUE}, IN THE ORDER THE ITEMS WERE FIRST CHANGED
+        self.pending = {}
+        self.pending_cells = 0
+        self.coalesced = 0
+        self.failures = []
+        # FAILED RESULTS RETURNED BY THE LAST close()
+        self.last_failures = []
+        self.timer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        failures = self.close()
+        for result in failures:
+            logger.error("Buffered write lost: %s of board '%s' failed. ERROR DETAILS: %s", result.operation.description, result.operation.board_name, result.error)
+
+    def change_value(self, item_name, col_title, new_value, board_name=None, link_text=None):
+        """
+        Queues the change of one cell. A value already pending for the cell is replaced.
+        :param item_name: Name of item/ task: str
+        :param col_title: Name/ title of column: str
+        :param new_value: New value. None values are ignored: str
+        :param board_name: Name of board. Defaults to the board of the wrapper: str
+        :param link_text: Text displayed for link columns: str
+        """
+        if new_value is None:
+            return
+        if link_text is not None:
+            new_value = (new_value, link_text)
+        self.change_columns(item_name, {col_title: new_value}, board_name=board_name)
+
+    def change_columns(self, item_name, column_values, board_name=None):
+        """
+        Queues the change of several cells of one item. Values already pending for these cells are replaced.
+        :param item_name: Name of item/ task: str
+        :param column_values: Mapping of column title to new value. None values are ignored: dict
+        :param board_name: Name of board. Defaults to the board of the wrapper: str
+        """
+        key = (board_name or self.wrapper.board_name, item_name)
+        with self.lock:
+            item_values = self.pending.setdefault(key, {})
+            for col_title, new_value in column_values.items():
+                if new_value is None:
+                    continue
+                if col_title in item_values:
+                    self.coalesced += 1
+                else:
+                    self.pending_cells += 1
+                item_values[col_title] = new_value
+            if not item_values:
+                del self.pending[key]
+            flush_now = self.pending_cells >= self.max_pending
+            if not flush_now and self.pending and self.timer is None and self.max_delay is not None:
+                self.timer = threading.Timer(self.max_delay, self._auto_flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+        if flush_now:
+            self._auto_flush()
+
+    def _auto_flush(self):
+        failures = self._flush_pending()
+        if not failures:
+            return
+        if self.on_failure is not None:
+            self.on_failure(failures)
+        else:
+            with self.lock:
+                self.failures.extend(failures)
+
+    def _flush_pending(self):
+        with self.flush_lock:
+            with self.lock:
+                pending = self.pending
+                coalesced = self.coalesced
+                self.pending = {}
+                self.pending_cells = 0
+                self.coalesced = 0
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+            if not pending:
+                return []
+
+            logger.debug("Flushing %s pending item writes (%s repeated cell changes coalesced)", len(pending), coalesced)
+            writer = BatchWriter(self.wrapper, max_operations=self.max_operations)
+            for (board_name, item_name), column_values in pending.items():
+                writer.change_columns(item_name, column_values, board_name=board_name)
+            return [result for result in writer.execute() if not result.success]
+
+    def flush(self):
+        """
+        Sends all the pending changes now.
+        :return: Failed results of this flush and of the earlier size/ time flushes not reported yet. The item and the
+        values of a failed write are in result.operation.board_name, .item_name and .column_values: List of BatchResult
+        """
+        failures = self._flush_pending()
+        with self.lock:
+            failures = self.failures + failures
+            self.failures = []
+        return failures
+
+    def close(self):
+        """
+        Flushes the pending changes and stops the timer.
+        The failed results are also kept in last_failures.
+        :return: Failed results, see flush(): List of BatchResult
+        """
+        self.last_failures = self.flush()
+        return self.last_failures
+
+    def __len__(self):
+        with self.lock:
+            return self.pending_cells
 
-CLIENT = MondayClient(user_name=USER_NAME, api_key_v1=API_V1, api_key_v2=API_V2)
 
 class MondayWrapper:
     """
@@ -16,15 +2530,668 @@ class MondayWrapper:
     Requires a board name which will be the base/main board we are working with.
     """
 
-    def __init__(self, board_name):
+    def __init__(self, board_name, scheduler=None, metrics=None, persistent_cache=None, connection=None, client=None, cache_size=ITEM_CACHE_SIZE, cache_ttl=CACHE_TTL):
+        """
+        :param board_name: str
+        :param scheduler: RequestScheduler all API calls go through. Defaults to the scheduler of the connection
+        :param metrics: WrapperMetrics the cache hits/ misses are recorded in. Defaults to the metrics of the scheduler
+        :param persistent_cache: PersistentMetadataCache used to resolve board, column and item names across runs. Optional
+        :param connection: MondayConnection (credentials) used by the wrapper, or a MondayClientPool to take one from.
+        Defaults to DEFAULT_CONNECTION, whose scheduler is the SCHEDULER shared by the process
+        :param client: moncli MondayClient to use instead of a connection. Optional
+        :param cache_size: Maximum number of item names cached in memory: int
+        :param cache_ttl: Number of seconds the boards, columns and items cached in memory are valid, or None: int
+        """
+        if isinstance(connection, MondayClientPool):
+            connection = connection.get()
+        if connection is None:
+            connection = MondayConnection(client=client) if client is not None else DEFAULT_CONNECTION
         self.board_name = board_name
+        self.connection = connection
+        self.scheduler = scheduler or connection.scheduler
+        self.metrics = metrics or self.scheduler.metrics
+        self.persistent_cache = persistent_cache
         self.existing_boards_list = []
         self.all_items_list = []
         self.all_users_list = []
 
-        self.board_objects_cache = {}
-        self.item_objects_cache = {}
-        self.column_objects_cache = {}
+        # GUARDS THE CACHES BELOW, WHICH ARE SHARED BY THE THREADS OF fan_out()
+        self.cache_lock = threading.RLock()
+        # BOARD NAME -> Board
+        self.board_objects_cache = LRUCache("board", max_size=BOARD_CACHE_SIZE, ttl=cache_ttl)
+        # (BOARD ID, ITEM NAME) -> LIST OF ItemRecord. ONLY NAMES FOUND ON THE BOARD ARE CACHED
+        self.item_objects_cache = LRUCache("item", max_size=cache_size, ttl=cache_ttl)
+        # BOARD NAME -> LIST OF Column
+        self.column_objects_cache = LRUCache("column", max_size=BOARD_CACHE_SIZE, ttl=cache_ttl)
+        # BOARD NAME -> ColumnCodecRegistry, BUILT FROM THE COLUMN OBJECTS CACHE
+        self.column_codecs_cache = LRUCache("column_codec", max_size=BOARD_CACHE_SIZE, ttl=cache_ttl)
+        # BOARD NAME -> GROUP INDEX (GROUP TITLE -> GROUP ID)
+        self.group_ids_cache = LRUCache("group", max_size=BOARD_CACHE_SIZE, ttl=cache_ttl)
+
+        # BOARD NAME -> BoardSnapshot. ONLY BOARDS WITH SNAPSHOT MODE ENABLED ARE PRESENT
+        self.board_snapshots = {}
+
+        # WriteBehindBuffer THE COLUMN CHANGES GO THROUGH WHEN WRITE-BEHIND IS ENABLED
+        self.write_behind = None
+
+        # CONCURRENT CACHE MISSES FOR THE SAME BOARD, COLUMN LIST OR ITEM NAME SHARE ONE API REQUEST
+        self.single_flight = SingleFlight()
+
+        # USERS OF THE ACCOUNT BY ID, EMAIL AND NAME. LOADED ON FIRST USE
+        self.user_directory = UserDirectory(scheduler=self.scheduler, connection=self.connection)
+
+        # (BOARD NAME, COLUMN TITLE) -> ColumnIndex. ONLY COLUMNS INDEXED WITH create_index ARE PRESENT
+        self.column_indexes = {}
+
+    def enable_board_snapshot(self, board_name=None, ttl=300, page_size=100, incremental=False):
+        """
+        Turns on snapshot mode for a board. All the items of the board are loaded once into an in-memory index
+        and name based lookups (check_item_exists, get_item_id_by_name, get_specific_item_by_name, add_new_item_to_board ...)
+        are answered from it without querying the API. The snapshot is reloaded when it is older than ttl seconds.
+        In incremental mode, only the items changed since the last load or sync are fetched again (see sync_board_snapshot).
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :param ttl: Number of seconds before the snapshot is reloaded or synced: int
+        :param page_size: Number of items fetched per API request while loading: int
+        :param incremental: Sync the snapshot from the activity logs of the board instead of reloading it: bool
+        :return: The snapshot for the board: BoardSnapshot
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        board = self._get_board_object(board_name)
+        snapshot = BoardSnapshot(board, ttl=ttl, page_size=page_size, scheduler=self.scheduler, connection=self.connection,
+                                 incremental=incremental, on_sync=lambda changes: self._apply_snapshot_changes(board_name, changes))
+        snapshot.refresh()
+        with self.cache_lock:
+            self.board_snapshots[board_name] = snapshot
+        return snapshot
+
+    def disable_board_snapshot(self, board_name=None):
+        """
+        Turns off snapshot mode for a board. Lookups go back to querying the API.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        self.board_snapshots.pop(board_name, None)
+
+    def refresh_board_snapshot(self, board_name=None):
+        """
+        Reloads the snapshot of a board regardless of its ttl.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: Number of items loaded, or None if snapshot mode is not enabled for the board
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is None:
+            logger.warning("Snapshot mode is not enabled for board '%s'. Nothing to refresh.", board_name)
+            return None
+        return snapshot.refresh()
+
+    def sync_board_snapshot(self, board_name=None):
+        """
+        Brings the snapshot of a board up to date by fetching only the items created, changed or deleted since
+        its last load or sync, regardless of its ttl.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: Changes applied (see BoardSnapshot.sync), or None if snapshot mode is not enabled for the board: dict
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is None:
+            logger.warning("Snapshot mode is not enabled for board '%s'. Nothing to sync.", board_name)
+            return None
+        return snapshot.sync()
+
+    def _apply_snapshot_changes(self, board_name, changes):
+        """
+        Drops the cached ids of the items a snapshot sync found created, changed, renamed or deleted from the other caches.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :param changes: Changes returned by BoardSnapshot.sync: dict
+        """
+        item_names = {item_object.name for item_object in changes["changed"] + changes["deleted"] + changes["renamed"]}
+        for item_name in item_names:
+            self._forget_item(board_name, item_name)
+
+    def enable_write_behind(self, max_pending=500, max_delay=2.0, on_failure=None):
+        """
+        Turns on write-behind: change_value_of_column and update_item_columns queue their changes in a WriteBehindBuffer
+        and return at once. Repeated changes of a cell are merged (last write wins) and the changes are written
+        per item when max_pending cells are pending, max_delay seconds after the first pending change, or on flush_writes().
+        :param max_pending: Number of pending cells that triggers a flush: int
+        :param max_delay: Seconds after the first pending change at which a flush is triggered: float
+        :param on_failure: Function called with the failed results of the flushes triggered by size or time: function
+        :return: WriteBehindBuffer
+        """
+        if self.write_behind is None:
+            self.write_behind = WriteBehindBuffer(self, max_pending=max_pending, max_delay=max_delay, on_failure=on_failure)
+        return self.write_behind
+
+    def flush_writes(self):
+        """
+        Writes the changes pending in the write-behind buffer now.
+        :return: Failed writes (see WriteBehindBuffer.flush), or an empty list if write-behind is not enabled: List of BatchResult
+        """
+        if self.write_behind is None:
+            return []
+        return self.write_behind.flush()
+
+    def disable_write_behind(self):
+        """
+        Writes the pending changes and turns write-behind off. Column changes are written immediately again.
+        :return: Failed writes (see WriteBehindBuffer.flush): List of BatchResult
+        """
+        if self.write_behind is None:
+            return []
+        buffer, self.write_behind = self.write_behind, None
+        return buffer.close()
+
+    def batch_writer(self, board_name=None, max_operations=50):
+        """
+        Creates a BatchWriter that sends many item mutations in a few aliased GraphQL requests.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: Default board for the queued operations: str
+        :param max_operations: Maximum number of mutations sent per request: int
+        :return: BatchWriter
+        """
+        return BatchWriter(self, board_name=board_name, max_operations=max_operations)
+
+    def add_items(self, names_or_rows, group_name=None, column_values=None, board_name=None, page_size=500, max_operations=50):
+        """
+        Adds many new items or tasks to a board. Existence is checked against one bulk read of the board (or its snapshot)
+        instead of one lookup per item, the missing items are created with their initial column values in batched
+        requests, and their ids are taken from the responses.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param names_or_rows: Item names, or rows (dicts of column title -> value, the item name under "Name"):
+        list, pandas DataFrame, path of a CSV file or open CSV file (see read_rows)
+        :param group_name: Title of the group new items are created in. Defaults to the first group of the board: str
+        :param column_values: Initial column values of all the new items. Values of a row take precedence: dict
+        :param board_name: str
+        :param page_size: Number of items read per API request: int
+        :param max_operations: Maximum number of items created in a single request: int
+        :return: Item name -> item id, for the items that already existed and the items created: dict
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        rows = [{"Name": row} if isinstance(row, str) else row for row in read_rows(names_or_rows)]
+
+        # NAMES OF THE ITEMS ALREADY ON THE BOARD. THE FIRST ITEM WINS WHEN SEVERAL SHARE A NAME
+        item_ids = {}
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is not None:
+            snapshot.ensure_fresh()
+            existing_items = ((record.name, record.id) for record in snapshot.get_all_records())
+        else:
+            existing_items = ((item["name"], item["id"]) for item in self.iter_board_items(board_name, page_size=page_size))
+        for item_name, item_id in existing_items:
+            item_ids.setdefault(item_name, item_id)
+
+        writer = self.batch_writer(board_name=board_name, max_operations=max_operations)
+        row_names = []
+        for row in rows:
+            item_name = normalize_cell_value(row.get("Name"))
+            if not item_name:
+                logger.warning("Row without an item name skipped: %s", row)
+                continue
+            item_name = str(item_name)
+            row_names.append(item_name)
+            if item_name in item_ids:
+                continue
+            new_values = dict(column_values or {})
+            new_values.update((title, value) for title, value in row.items() if title != "Name" and value is not None)
+            writer.add_item(item_name, group_name=group_name, column_values=new_values or None, board_name=board_name)
+            # A NAME REPEATED IN THE ROWS IS CREATED ONCE
+            item_ids[item_name] = None
+
+        results = writer.execute()
+        for result in results:
+            if result.success:
+                item_ids[result.operation.item_name] = result.data["id"]
+            else:
+                item_ids.pop(result.operation.item_name, None)
+                logger.error("Could not add new item %s. ERROR DETAILS: %s", result.operation.item_name, result.error)
+
+        failed = sum(1 for result in results if not result.success)
+        logger.info("Added %s new items to board '%s' (%s failed)", len(results) - failed, board_name, failed)
+        return {item_name: item_ids[item_name] for item_name in row_names if item_name in item_ids}
+
+    def sync_rows(self, rows, key_column="Name", board_name=None, archive_missing=False, group_name=None, page_size=500, max_operations=50):
+        """
+        Makes a board match tabular data (e.g. a database table exported for automation) with as few writes as possible.
+        The current items of the board are read in bulk and compared with the rows: items missing from the board are
+        created, and only the cells whose value differs are written, in batched requests.
+        Rows are dicts of column title -> value. Cells whose value is None are left as they are.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param rows: Iterable of dicts, pandas DataFrame, path of a CSV file or open CSV file (see read_rows)
+        :param key_column: Title of the column identifying the item of a row. "Name" matches rows by item name.
+        Items of the board whose key is empty are never matched nor archived: str
+        :param board_name: str
+        :param archive_missing: Archive the items of the board whose key is in no row: bool
+        :param group_name: Title of the group new items are created in. Defaults to the first group of the board: str
+        :param page_size: Number of items read per API request: int
+        :param max_operations: Maximum number of writes sent in a single request: int
+        :return: Report with the counts of rows, created, updated, unchanged, archived, skipped and failed items,
+        cells_written, duration (seconds), rows_per_second and the failed results: dict
+        :raises ValueError: If the key column is neither "Name" nor a column of the board
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        start = time.perf_counter()
+        codecs = self.get_column_codecs(board_name=board_name)
+        if key_column != "Name" and codecs.get(key_column) is None:
+            # ROWS COULD NOT BE MATCHED TO ITEMS: EVERY ROW WOULD BE CREATED AGAIN ON EACH RUN
+            raise ValueError(f"Key column '{key_column}' is not a column of board '{board_name}'")
+
+        rows = list(read_rows(rows))
+        titles = []
+        for row in rows:
+            titles.extend(title for title in row if title not in titles)
+        unknown_titles = [title for title in titles if title != "Name" and codecs.get(title) is None]
+        if unknown_titles:
+            logger.warning("Columns %s are not in board '%s'. Their values are ignored.", unknown_titles, board_name)
+        value_titles = [title for title in titles if title != "Name" and title not in unknown_titles]
+        read_titles = value_titles if key_column in value_titles or key_column == "Name" else value_titles + [key_column]
+        people_titles = {title for title in value_titles if codecs.get(title).type == 'multiple-person'}
+
+        # CURRENT STATE OF THE BOARD, INDEXED BY KEY. ITEMS WITH AN EMPTY KEY CANNOT BE MATCHED TO A ROW
+        items_by_key = {}
+        duplicate_keys = set()
+        for item in self.iter_board_items(board_name, page_size=page_size, columns=read_titles):
+            current_values = dict(item.get("column_values", {}))
+            current_values["Name"] = item["name"]
+            key = normalize_cell_value(current_values.get(key_column))
+            if not key:
+                continue
+            if key in items_by_key:
+                logger.warning("Several items of board '%s' have the key '%s'. Only the first one is synced.", board_name, key)
+                duplicate_keys.add(key)
+                continue
+            items_by_key[key] = (item, current_values)
+
+        report = {"rows": len(rows), "created": 0, "updated": 0, "unchanged": 0, "archived": 0, "skipped": 0, "failed": 0, "cells_written": 0}
+        writer = self.batch_writer(board_name=board_name, max_operations=max_operations)
+        synced_keys = set()
+        for row in rows:
+            key = normalize_cell_value(row.get(key_column))
+            if not key or key in synced_keys:
+                logger.warning("Row with an empty or repeated key '%s' skipped.", key)
+                report["skipped"] += 1
+                continue
+            synced_keys.add(key)
+            row_values = {title: value for title, value in row.items() if (title == "Name" or title in value_titles) and value is not None}
+
+            if key not in items_by_key:
+                item_name = normalize_cell_value(row_values.pop("Name", None)) or key
+                writer.add_item(item_name, group_name=group_name, column_values=row_values or None)
+                report["created"] += 1
+                report["cells_written"] += len(row_values)
+                continue
+
+            item, current_values = items_by_key[key]
+            changed_values = {}
+            for title, value in row_values.items():
+                if title in people_titles:
+                    unchanged = self._people_values_equal(value, current_values.get(title))
+                else:
+                    unchanged = cell_values_equal(value, current_values.get(title))
+                if not unchanged:
+                    changed_values[title] = value
+            if not changed_values:
+                report["unchanged"] += 1
+                continue
+            writer.change_columns(item["name"], changed_values, board_name=board_name, item_id=item["id"])
+            report["updated"] += 1
+            report["cells_written"] += len(changed_values)
+
+        if archive_missing:
+            for key, (item, current_values) in items_by_key.items():
+                if key in synced_keys:
+                    continue
+                if key in duplicate_keys:
+                    # IT IS NOT KNOWN WHICH OF THE ITEMS SHARING THE KEY SHOULD GO
+                    logger.warning("Items of board '%s' with the repeated key '%s' are not archived.", board_name, key)
+                else:
+                    writer.archive_item(item["name"], board_name=board_name, item_id=item["id"])
+                    report["archived"] += 1
+
+        failures = [result for result in writer.execute() if not result.success]
+        report["failed"] = len(failures)
+        report["failures"] = failures
+        report["duration"] = time.perf_counter() - start
+        report["rows_per_second"] = len(rows) / report["duration"] if report["duration"] else 0.0
+        logger.info("Synced %s rows to board '%s' in %.1fs: %s created, %s updated (%s cells), %s unchanged, %s archived, %s failed",
+                    len(rows), board_name, report["duration"], report["created"], report["updated"], report["cells_written"],
+                    report["unchanged"], report["archived"], report["failed"])
+        return report
+
+    def _people_values_equal(self, new_value, current_value):
+        """
+        Checks if writing new_value (user ids, emails or names) to a people cell holding current_value (the user names
+        read from the board) would change it. Both are compared as user ids, resolved with the user directory.
+        This method is to be used only internally by the class.
+        :param new_value: str, int or List
+        :param current_value: Comma separated user names: str
+        :return: Boolean
+        """
+        new_user_ids = self._resolve_people(new_value)
+        if new_user_ids is None:
+            return False
+        current_names = [name.strip() for name in normalize_cell_value(current_value).split(",") if name.strip()]
+        current_user_ids = [self.user_directory.resolve_id(name) for name in current_names]
+        return None not in current_user_ids and set(new_user_ids) == set(current_user_ids)
+
+    def _get_cached_board_object(self, board_name):
+        """
+        Returns the moncli board object for the board name supplied from the board object cache, or rebuilt from the
+        board id in the persistent cache. No API request is made.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :return: Board object, or None if the board is not cached
+        """
+        board = self.board_objects_cache.get(board_name)
+        self.metrics.record_cache("board", board is not None)
+        if board is None and self.persistent_cache is not None:
+            board_id = self.persistent_cache.get_board_id(board_name)
+            self.metrics.record_cache("persistent_board", board_id is not None)
+            if board_id is not None:
+                with self.cache_lock:
+                    board = self.board_objects_cache.setdefault(board_name, Board(creds=self.connection.creds, id=board_id, name=board_name))
+        return board
+
+    def _cache_board_object(self, board_name, board):
+        """
+        Adds a board object to the board object cache and its id to the persistent cache.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :param board: Board object
+        """
+        with self.cache_lock:
+            self.board_objects_cache[board_name] = board
+        if self.persistent_cache is not None:
+            self.persistent_cache.set_board_id(board_name, board.id)
+
+    def _get_board_object(self, board_name):
+        """
+        Returns the moncli board object for the board name supplied, from the board object cache if available.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :return: Board object
+        """
+        board = self._get_cached_board_object(board_name)
+        if board is None:
+            board = self.single_flight.do(("board", board_name), self._fetch_board_object, board_name)
+        return board
+
+    def _fetch_board_object(self, board_name):
+        """
+        Gets the moncli board object for the board name supplied from the API and caches it.
+        It is cached before the single-flight key of the lookup is released, so that a lookup starting after the
+        request finds it in the cache instead of sending the request again.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :return: Board object
+        """
+        board = self.scheduler.call(self.connection.client.get_board, name=board_name, description=f"get board '{board_name}'")
+        self._cache_board_object(board_name, board)
+        return board
+
+    def _forget_item(self, board_name, item_name):
+        """
+        Drops the cached ids of an item, in memory and persistently, after a write to it failed: the item may have
+        been deleted or renamed since its id was cached. The next lookup queries the API again.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :param item_name: Item name: str
+        """
+        self._invalidate_cached_item(item_name)
+        if self.persistent_cache is not None:
+            self.persistent_cache.invalidate_item(board_name, item_name)
+
+    def _invalidate_cached_item(self, item_name, board_id=None):
+        """
+        Drops the item records cached in memory for an item name, on one board or on all boards.
+        This method is to be used only internally by the class.
+        :param item_name: Item name: str
+        :param board_id: Id of the board, or None for all boards: int
+        """
+        if board_id is not None:
+            self.item_objects_cache.pop((int(board_id), item_name), None)
+        else:
+            self.item_objects_cache.invalidate(lambda key: key[1] == item_name)
+
+    def _cache_item_objects(self, board_id, item_name, item_objects_list):
+        """
+        Caches in memory the records of the items of a board whose name is exactly the item name supplied.
+        Nothing is cached when there is no such item: a missing item may be created by another process at any time.
+        This method is to be used only internally by the class.
+        :param board_id: Id of the board: int
+        :param item_name: Item name: str
+        :param item_objects_list: Item objects or records returned by a lookup of the item name: List
+        """
+        records = [item if isinstance(item, ItemRecord) else ItemRecord.from_item(item, board_id) for item in item_objects_list if item.name == item_name]
+        if records:
+            self.item_objects_cache[(int(board_id), item_name)] = records
+
+    def _add_cached_item(self, board_id, item_object):
+        """
+        Adds a newly created item to the records cached in memory for its name.
+        This method is to be used only internally by the class.
+        :param board_id: Id of the board: int
+        :param item_object: Item object or ItemRecord
+        """
+        key = (int(board_id), item_object.name)
+        new_record = item_object if isinstance(item_object, ItemRecord) else ItemRecord.from_item(item_object, board_id)
+        with self.cache_lock:
+            records = [record for record in self.item_objects_cache.get(key, []) if record.id != new_record.id]
+            self.item_objects_cache[key] = records + [new_record]
+
+    def _invalidate_cached_item_id(self, board_id, item_id):
+        """
+        Drops the item records cached in memory for the name(s) an item id is cached under.
+        This method is to be used only internally by the class.
+        :param board_id: Id of the board: int
+        :param item_id: Id of the item: int
+        :return: Names the item was cached under: List
+        """
+        item_names = []
+        for key, records in self.item_objects_cache.items():
+            if key[0] == int(board_id) and any(record.id == int(item_id) for record in records):
+                self.item_objects_cache.pop(key)
+                item_names.append(key[1])
+        return item_names
+
+    def _board_indexes(self, board_name):
+        return [index for (index_board_name, col_title), index in list(self.column_indexes.items()) if index_board_name == board_name]
+
+    def _check_unique_indexes(self, board_name, item_id, column_values, claimed_values=None):
+        """
+        Raises ValueError if a value written would be held by two items of a unique column index.
+        This method is to be used only internally by the class.
+        :param board_name: str
+        :param item_id: Id of the item written, or None for a new item: int
+        :param column_values: Mapping of column title to new value: dict
+        :param claimed_values: Values already queued in the same batch: (board name, column title, value) -> item id.
+        The values checked are added to it: dict
+        """
+        for index in self._board_indexes(board_name):
+            if not index.unique or column_values.get(index.col_title) is None:
+                continue
+            value = column_values[index.col_title]
+            other_item_id = index.conflicting_item(item_id, value)
+            key = (board_name, index.col_title, index.normalize(value))
+            if other_item_id is not None:
+                raise ValueError(f"Value {value!r} of unique column '{index.col_title}' is already held by item {other_item_id}")
+            if claimed_values is not None and key in claimed_values and (item_id is None or claimed_values[key] != item_id):
+                raise ValueError(f"Value {value!r} of unique column '{index.col_title}' is already written to another item in the same batch")
+            if claimed_values is not None:
+                claimed_values[key] = item_id
+
+    def _update_indexes(self, board_name, item_id, column_values, item_name=None):
+        """
+        Applies values written to an item to the column indexes of the board.
+        This method is to be used only internally by the class.
+        :param board_name: str
+        :param item_id: int
+        :param column_values: Mapping of column title to new value: dict
+        :param item_name: Name of the item: str
+        """
+        item_name = column_values.get("Name", item_name)
+        for index in self._board_indexes(board_name):
+            if index.col_title in column_values:
+                index.update(item_id, column_values[index.col_title], item_name=item_name)
+            elif item_name is not None:
+                index.rename(item_id, item_name)
+
+    def _remove_from_indexes(self, board_name, item_id):
+        for index in self._board_indexes(board_name):
+            index.remove(item_id)
+
+    def _board_name_for_id(self, board_id):
+        """
+        Returns the name of a board from its id, as known by the board snapshots or the board object cache.
+        This method is to be used only internally by the class.
+        :param board_id: Id of the board: int
+        :return: Board name, or None if the board is not cached: str
+        """
+        for board_name, snapshot in list(self.board_snapshots.items()):
+            if int(snapshot.board.id) == int(board_id):
+                return board_name
+        for board_name, board in self.board_objects_cache.items():
+            if int(board.id) == int(board_id):
+                return board_name
+        return None
+
+    def apply_webhook_event(self, event):
+        """
+        Applies a monday.com webhook event to the board snapshot and the caches of the wrapper, so cached lookups
+        reflect changes made by other users and processes without polling (see MondayWebhookReceiver).
+        Items created, renamed, moved, archived or deleted are updated in the board snapshot and dropped from the
+        item caches. Values written to a column unknown to the cached column list drop the cached columns of the board.
+        :param event: The "event" object of the webhook payload: dict
+        :return: True if the event type is supported, False if it was ignored: bool
+        """
+        event_type = event.get("type")
+        board_id = int(event.get("boardId") or 0)
+        item_id = int(event.get("pulseId") or 0)
+        board_name = self._board_name_for_id(board_id)
+        snapshot = self.board_snapshots.get(board_name) if board_name else None
+        logger.debug("Applying webhook event %s of item %s on board %s", event_type, item_id, board_id)
+
+        if event_type == "create_pulse":
+            record = ItemRecord(item_id, event.get("pulseName"), board_id, event.get("groupId"))
+            if snapshot is not None:
+                snapshot.add_item(record)
+            # A NAME WHOSE ITEMS ARE NOT CACHED MAY HAVE OTHER ITEMS: ONLY CACHED NAMES ARE COMPLETED
+            if (board_id, record.name) in self.item_objects_cache:
+                self._add_cached_item(board_id, record)
+            if board_name and self.persistent_cache is not None:
+                self.persistent_cache.invalidate_item(board_name, record.name)
+
+        elif event_type in ("update_name", "move_pulse_into_group"):
+            if event_type == "update_name" and board_name:
+                self._update_indexes(board_name, item_id, {}, item_name=(event.get("value") or {}).get("name"))
+            previous = snapshot.remove_item(item_id) if snapshot is not None else None
+            item_names = self._invalidate_cached_item_id(board_id, item_id)
+            if event_type == "update_name":
+                item_name = (event.get("value") or {}).get("name")
+                group_id = previous.group_id if previous is not None else event.get("groupId")
+                item_names.extend(name for name in ((event.get("previousValue") or {}).get("name"), item_name) if name)
+            else:
+                item_name = previous.name if previous is not None else event.get("pulseName")
+                group_id = event.get("destGroupId")
+            if snapshot is not None and item_name:
+                snapshot.add_item(ItemRecord(item_id, item_name, board_id, group_id))
+            for name in set(item_names):
+                self._invalidate_cached_item(name, board_id=board_id)
+                if board_name and self.persistent_cache is not None:
+                    self.persistent_cache.invalidate_item(board_name, name)
+
+        elif event_type in ("archive_pulse", "delete_pulse"):
+            previous = snapshot.remove_item(item_id) if snapshot is not None else None
+            item_names = set(self._invalidate_cached_item_id(board_id, item_id))
+            item_names.update(name for name in (event.get("pulseName"), previous.name if previous is not None else None) if name)
+            for name in item_names:
+                self._invalidate_cached_item(name, board_id=board_id)
+                if board_name:
+                    self._forget_item(board_name, name)
+            if board_name:
+                self._remove_from_indexes(board_name, item_id)
+
+        elif event_type in ("update_column_value", "create_column"):
+            # THE ITEM CACHES HOLD NO COLUMN VALUES. A VALUE WRITTEN TO AN UNKNOWN COLUMN MEANS THE COLUMN LIST IS STALE
+            columns_list = self.column_objects_cache.get(board_name) if board_name else None
+            stale = event_type == "create_column" or (columns_list is not None and all(column.id != event.get("columnId") for column in columns_list))
+            if board_name and stale:
+                self.column_objects_cache.pop(board_name)
+                self.column_codecs_cache.pop(board_name)
+                if self.persistent_cache is not None:
+                    self.persistent_cache.invalidate_columns(board_name)
+            if board_name and event_type == "update_column_value":
+                for index in self._board_indexes(board_name):
+                    if index.column_id == event.get("columnId"):
+                        index.update(item_id, _webhook_column_value(event.get("value")), item_name=event.get("pulseName"))
+
+        else:
+            logger.debug("Ignoring webhook event of type %s", event_type)
+            return False
+        return True
+
+    def invalidate_caches(self, board_name=None):
+        """
+        Drops everything cached in memory about a board: the board object, its columns, column codecs, groups and items.
+        Use it after the board was changed by another process. Board snapshots and the persistent cache are not affected.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        board = self.board_objects_cache.pop(board_name)
+        self.column_objects_cache.pop(board_name)
+        self.column_codecs_cache.pop(board_name)
+        self.group_ids_cache.pop(board_name)
+        if board is not None:
+            self.item_objects_cache.invalidate(lambda key: key[0] == int(board.id))
+
+    def cache_stats(self):
+        """
+        Returns the statistics of the in-memory caches of the wrapper.
+        :return: Cache name -> size, limits and hit/ miss/ eviction/ expiration/ invalidation counters (see LRUCache.stats),
+        and "single_flight" -> counters of the coalesced reads (see SingleFlight.stats): dict
+        """
+        stats = {cache.name: cache.stats() for cache in (self.board_objects_cache, self.item_objects_cache, self.column_objects_cache, self.column_codecs_cache, self.group_ids_cache)}
+        stats["single_flight"] = self.single_flight.stats()
+        return stats
+
+    def get_column_codecs(self, board_name=None):
+        """
+        Returns the column codec registry of a board (column title -> id, type, parsed settings, encoder/ decoder).
+        It is built once from the column list of the board and reused, so encoding values needs no API request.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :return: ColumnCodecRegistry
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        registry = self.column_codecs_cache.get(board_name)
+        self.metrics.record_cache("column_codec", registry is not None)
+        if registry is None:
+            registry = ColumnCodecRegistry(self.get_columns_in_single_board(board_name=board_name))
+            with self.cache_lock:
+                registry = self.column_codecs_cache.setdefault(board_name, registry)
+        return registry
 
     def new_board(self, board_name=None):
         """
@@ -40,16 +3207,19 @@ class MondayWrapper:
         board_exists = self.check_board_exists(board_name)
 
         if board_exists is False:
-            board_object = CLIENT.create_board(board_name, board_kind=BoardKind.public)
-            print(f"LOG INFO: New board created with id {board_object.id}")
-            # ADD TO CACHE: BOARD OBJECT
-            self.board_objects_cache[board_name] = board_object
-            return board_object.id
+            return self._create_board(board_name).id
         else:
             existing_board_id = self.get_board_id(board_name)
-            print(f"LOG INFO: See above message. Not making board for '{board_name}'. Will return id of existing board with same name. Id: {existing_board_id}")
+            logger.info("See above message. Not making board for '%s'. Will return id of existing board with same name. Id: %s", board_name, existing_board_id)
             return existing_board_id
 
+    def _create_board(self, board_name):
+        board_object = self.scheduler.call(self.connection.client.create_board, board_name, board_kind=BoardKind.public, description=f"create board '{board_name}'", idempotent=False)
+        logger.info("New board created with id %s", board_object.id)
+        # ADD TO CACHE: BOARD OBJECT
+        self._cache_board_object(board_name, board_object)
+        return board_object
+
     def get_board_id(self, board_name=None):
         """
         Get's the board id of the board name passed.
@@ -60,7 +3230,7 @@ class MondayWrapper:
         if not board_name:
             board_name = self.board_name
 
-        retrieved_board = CLIENT.get_board_by_name(board_name)
+        retrieved_board = self._get_board_object(board_name)
         board_id = retrieved_board.id
         return board_id
 
@@ -74,13 +3244,112 @@ class MondayWrapper:
         """
         if not board_name:
             board_name = self.board_name
-        print(f"LOG INFO: Adding column {column_title} to board {board_name}")
-        retrieved_board = CLIENT.get_board_by_name(board_name)
-        retrieved_board.add_column(title=column_title, column_type=ColumnType.long_text)
+        logger.info("Adding column %s to board %s", column_title, board_name)
+        retrieved_board = self._get_board_object(board_name)
+        column = self.scheduler.call(retrieved_board.add_column, title=column_title, column_type=ColumnType.long_text, description=f"add column '{column_title}'", idempotent=False)
+
+        # THE MUTATION RETURNS THE NEW COLUMN: IT IS ADDED TO THE CACHED COLUMN LIST WITHOUT READING THE COLUMNS AGAIN
+        self._add_cached_column(board_name, {"id": column.id, "title": column.title, "type": column.type, "settings_str": "{}"})
+
+        return column.id
+
+    def _add_cached_column(self, board_name, column_data):
+        # A COLUMN CREATED BY THE WRAPPER IS APPENDED TO THE CACHED COLUMN LIST OF THE BOARD INSTEAD OF READING THE LIST AGAIN
+        with self.cache_lock:
+            columns_list = self.column_objects_cache.get(board_name)
+            if columns_list is not None:
+                columns_list = columns_list + [Column(**column_data)]
+                self.column_objects_cache[board_name] = columns_list
+            self.column_codecs_cache.pop(board_name)
+        if self.persistent_cache is not None:
+            if columns_list is not None:
+                self.persistent_cache.set_columns(board_name, columns_list)
+            else:
+                self.persistent_cache.invalidate_columns(board_name)
+
+    def ensure_schema(self, columns=None, groups=None, board_name=None, max_operations=50):
+        """
+        Makes a board match a declared schema: the board, its columns and its groups are created if missing.
+        The board is read once (columns and groups in a single request), and all the missing columns (of any type,
+        status columns with their labels) and groups are created in batched mutations (see BatchWriter).
+        Existing columns and groups are never changed: columns whose type differs from the schema, or status columns
+        missing some labels, are reported as mismatched. The column and group caches of the board are filled from
+        the responses, so the board can be written to right after without more lookups.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param columns: List of (title, column type) or (title, column type, settings) tuples. Column types are the API types
+        (color, text, numeric, long-text, date, link ...) or ColumnType names (status, numbers, long_text ...).
+        Settings of status columns are their labels, as a list or a mapping of index to label: List
+        :param groups: Titles of the groups: List
+        :param board_name: str
+        :param max_operations: Maximum number of columns and groups created in a single request: int
+        :return: Report: {"board_id", "board_created", "columns_created", "groups_created", "mismatched", "failed"}.
+        mismatched maps column titles to the difference found, failed maps operation descriptions to errors: dict
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        board_created = False
+        if not self.check_board_exists(board_name):
+            self._create_board(board_name)
+            board_created = True
+        board = self._get_board_object(board_name)
+
+        # ONE REQUEST FOR THE CURRENT COLUMNS AND GROUPS OF THE BOARD
+        query = f"query {{ complexity {{ query after reset_in_x_seconds }} boards (ids: [{int(board.id)}]) {{ columns {{ id title type settings_str }} groups {{ id title }} }} }}"
+        data = self.scheduler.call(self.connection.execute_graphql, query, raise_errors=True, description=f"get schema of board '{board_name}'", operation="schema")["data"]
+        self.scheduler.report_complexity(data)
+        board_data = data["boards"][0]
+
+        columns_list = [Column(**column_data) for column_data in board_data["columns"]]
+        group_ids = {}
+        for group in board_data["groups"]:
+            group_ids.setdefault(group["title"], group["id"])
+        with self.cache_lock:
+            self.column_objects_cache[board_name] = columns_list
+            self.column_codecs_cache.pop(board_name)
+            self.group_ids_cache[board_name] = group_ids
+        if self.persistent_cache is not None:
+            self.persistent_cache.set_columns(board_name, columns_list)
 
-        col_id = self.get_column_id_by_name(col_name=column_title, board_name=board_name)
+        # QUEUE WHAT IS MISSING
+        report = {"board_id": board.id, "board_created": board_created, "columns_created": [], "groups_created": [], "mismatched": {}, "failed": {}}
+        existing_columns = {column_data["title"]: column_data for column_data in board_data["columns"]}
+        writer = self.batch_writer(board_name=board_name, max_operations=max_operations)
+        queued_columns = set()
+        for column in columns or []:
+            col_title, column_type, settings = (tuple(column) + (None,))[:3]
+            api_type = column_type_names(column_type)[0]
+            existing = existing_columns.get(col_title)
+            if existing is None:
+                if col_title not in queued_columns:
+                    writer.add_column(col_title, column_type, settings=settings, board_name=board_name)
+                    queued_columns.add(col_title)
+            elif existing["type"] != api_type:
+                report["mismatched"][col_title] = f"type is {existing['type']}, not {api_type}"
+            elif api_type == "color" and settings:
+                existing_labels = set(json.loads(existing["settings_str"] or "{}").get("labels", {}).values())
+                missing_labels = [label for label in column_defaults(settings).get("labels", {}).values() if label not in existing_labels]
+                if missing_labels:
+                    report["mismatched"][col_title] = f"labels {missing_labels} are missing"
+        queued_groups = set()
+        for group_name in groups or []:
+            if group_name not in group_ids and group_name not in queued_groups:
+                writer.add_group(group_name, board_name=board_name)
+                queued_groups.add(group_name)
 
-        return col_id
+        for col_title, difference in report["mismatched"].items():
+            logger.warning("Column '%s' of board '%s' does not match the schema: %s. It is not changed.", col_title, board_name, difference)
+
+        # CREATE IT IN BATCHED MUTATIONS. THE RESULTS ARE ADDED TO THE COLUMN AND GROUP CACHES BY THE WRITER
+        for result in writer.execute():
+            if not result.success:
+                report["failed"][result.operation.description] = result.error
+            elif result.operation.kind == "create_column":
+                report["columns_created"].append(result.data["title"])
+            else:
+                report["groups_created"].append(result.data["title"])
+        logger.info("Schema of board '%s' ensured: %s columns and %s groups created", board_name, len(report["columns_created"]), len(report["groups_created"]))
+        return report
 
     def add_new_item_to_board(self, item_name, board_name=None):
         """
@@ -96,34 +3365,28 @@ class MondayWrapper:
         new_item_object = None
         item_exists = self.check_item_exists(item_name=item_name, board_name=board_name)
         if item_exists:
-            print(f"LOG INFO: Item with name '{item_name}' already exists within board '{board_name}'. Getting item id for existing item")
+            logger.info("Item with name '%s' already exists within board '%s'. Getting item id for existing item", item_name, board_name)
         else:
-            print(f"LOG INFO: Adding new item {item_name} to board {board_name}")
-            retrieved_board = CLIENT.get_board_by_name(board_name)
+            logger.info("Adding new item %s to board %s", item_name, board_name)
             try:
-                new_item_object = retrieved_board.add_item(item_name=item_name)
-                print(f"LOG INFO: New item '{new_item_object.name}' added with item ID {new_item_object.id}")
+                retrieved_board = self._get_board_object(board_name)
+                new_item_object = self.scheduler.call(retrieved_board.add_item, item_name=item_name, description=f"add item '{item_name}'", idempotent=False)
+                logger.info("New item '%s' added with item ID %s", new_item_object.name, new_item_object.id)
             except Exception as e:
-                print(f"LOG ERROR: Could not add new item. Max complexity issue. Error details {e}. Will pause and try again")
-                complexityError = True
-                counter = 1
-                while complexityError and counter < 30:
-                    print(f"\nTrying Mpnday.com API. Try #{counter} from (add_new_item_to_board - getting new_item_object)")
-                    time.sleep(2)
-                    try:
-                        new_item_object = retrieved_board.add_item(item_name=item_name)
-                        print(f"LOG INFO: New item '{new_item_object.name}' added with item ID {new_item_object.id}")
-                        complexityError = False
-                    except Exception as e:
-                        print(f"LOG ERROR: Could not add new item. Max complexity issue. Error details {e}. Will pause and try again")
-                        counter = counter + 1
+                logger.error("Could not add new item %s. ERROR DETAILS: %s", item_name, e)
 
             if new_item_object:
                 # ADD TO CACHE: ITEM OBJECT
-                print(f"LOG INFO: Adding item object for item \"{item_name}\" to cache for item objects.")
-                self.item_objects_cache[new_item_object.name] = new_item_object
+                logger.debug('Adding item object for item "%s" to cache for item objects.', item_name)
+                self._add_cached_item(retrieved_board.id, new_item_object)
+                snapshot = self.board_snapshots.get(board_name)
+                if snapshot is not None:
+                    snapshot.add_item(new_item_object)
+                if self.persistent_cache is not None:
+                    self.persistent_cache.add_item_id(board_name, new_item_object.name, new_item_object.id)
+                # THE NEW ITEM OBJECT ALREADY HOLDS THE ID: NO NEED TO LOOK IT UP BY NAME
+                return new_item_object.id
             else:
-                print(f"LOG ERROR: Could not add new item {item_name} after multiple tries")
                 return None
 
         item_id = self.get_item_id_by_name(item_name=item_name, board_name=board_name)
@@ -143,10 +3406,10 @@ class MondayWrapper:
         item_objects_list = self._get_item_objects_list(item_name=item_name, board_name=board_name)
         for item_obj in item_objects_list:
             if item_obj.name == item_name:
-                print(f"LOG INFO: Found existing item with name {item_name}")
+                logger.debug("Found existing item with name %s", item_name)
                 return True
 
-        print(f"LOG ERROR: No existing item found with name {item_name}")
+        logger.info("No existing item found with name %s", item_name)
         return False
 
     def get_specific_item_by_name(self, item_name, board_name=None):
@@ -163,14 +3426,11 @@ class MondayWrapper:
         item_objects_list = self._get_item_objects_list(item_name=item_name, board_name=board_name)
 
         for item_object in item_objects_list:
-            # ADD TO CACHE: ITEM OBJECT
-            print(f"LOG INFO: Adding item object for item '{item_name}' to cache for item objects.")
-            self.item_objects_cache[item_object.name] = item_object
             if item_name == item_object.name:
-                print(f"LOG INFO: Found item object with name '{item_name}' in in board '{board_name}'")
+                logger.debug("Found item object with name '%s' in in board '%s'", item_name, board_name)
                 return item_object
 
-        print(f"LOG INFO: No item/task found with name '{item_name}' in '{board_name}' using cache or API query")
+        logger.info("No item/task found with name '%s' in '%s' using cache or API query", item_name, board_name)
         return None
 
     def get_items_in_single_board(self, board_name=None):
@@ -183,20 +3443,59 @@ class MondayWrapper:
         if not board_name:
             board_name = self.board_name
 
-        board_items_list = []
-        print(f"LOG INFO: Getting items for board {board_name}")
-        retrieved_board = CLIENT.get_board_by_name(board_name)
-        board_items = retrieved_board.get_items()
-        for board_item in board_items:
-            item_info = {"item_id": board_item.id,
-                         "item_name": board_item.name
-                         }
-            # print(f"LOG INFO: ITEM DETAILS: {item_info}")
-            board_items_list.append(board_item)
-        # print(f"LOG INFO: List of items in board {board_name}:\n\t{board_items_list}")
-        print(f"LOG INFO: {len(board_items_list)} found.")
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is not None:
+            snapshot.ensure_fresh()
+            logger.debug("Getting items for board %s from snapshot", board_name)
+            return snapshot.get_all_items()
+
+        logger.info("Getting items for board %s", board_name)
+        board_items_list = [self._item_object(item) for item in self.iter_board_items(board_name)]
+        logger.info("%s found.", len(board_items_list))
         return board_items_list
 
+    def iter_board_items(self, board_name=None, page_size=500, columns=None, prefetch=False):
+        """
+        Generator of all the items of a board, read page by page with cursor pagination so that memory use
+        stays bounded whatever the size of the board.
+        Items are plain dicts: {"id", "name", "board_id", "group_id"} and, when column titles are passed,
+        "column_values": {column title: decoded value}.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :param page_size: Number of items fetched per API request (at most 500): int
+        :param columns: Titles of the columns to read with each item: List
+        :param prefetch: Fetch the next page in a background thread while the current page is processed: bool
+        :return: Generator of item dicts
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        board = self._get_board_object(board_name)
+        codecs = self._get_codecs_for_columns(board_name, columns)
+        reader = ItemPageReader(board.id, page_size=page_size, codecs=codecs, prefetch=prefetch, scheduler=self.scheduler, connection=self.connection)
+        yield from reader
+
+    def _get_codecs_for_columns(self, board_name, columns, registry=None):
+        if not columns:
+            return []
+        if registry is None:
+            registry = self.get_column_codecs(board_name=board_name)
+        codecs = []
+        for col_title in columns:
+            codec = registry.get(col_title)
+            if codec is None:
+                logger.warning("No column with title '%s' in board '%s'. It is not read.", col_title, board_name)
+            else:
+                codecs.append(codec)
+        return codecs
+
+    def _item_object(self, item):
+        # LIGHTWEIGHT ITEM DICT (SEE ItemPageReader) -> MONCLI ITEM OBJECT
+        item_data = {"id": item["id"], "name": item["name"], "board": {"id": item["board_id"]}}
+        if item["group_id"]:
+            item_data["group"] = {"id": item["group_id"]}
+        return Item(creds=self.connection.creds, **item_data)
+
     def check_board_exists(self, board_name=None):
         """
         Checks if board with board name passed exists.
@@ -208,39 +3507,89 @@ class MondayWrapper:
             board_name = self.board_name
 
         # CHECK IN CACHE FOR BOARD OBJECT
-        print(f"LOG INFO: Checking in board object cache for board name '{board_name}'.")
-        board = self.board_objects_cache.get(board_name)
+        logger.debug("Checking in board object cache for board name '%s'.", board_name)
+        board = self._get_cached_board_object(board_name)
 
         if board is None:
             try:
-                board = CLIENT.get_board(name=board_name)
-                print(f"LOG INFO: Board name {board.name} exists!")
-                self.board_objects_cache[board_name] = board
+                board = self.single_flight.do(("board", board_name), self._fetch_board_object, board_name)
+                logger.debug("Board name %s exists!", board.name)
                 return True
             except Exception as e:
-                print(f"LOG WARN: No board found with name: {board_name}. ERROR DETAILS: {e}")
+                logger.warning("No board found with name: %s. ERROR DETAILS: %s", board_name, e)
                 return False
         else:
-            print(f"LOG INFO: Found board object for board in cache. Board name {board.name} exists!")
+            logger.debug("Found board object for board in cache. Board name %s exists!", board.name)
             return True
 
     def get_list_of_existing_boards(self):
         """
         Gets a list of board (objects) in all workspaces.
+        The board objects are also cached, so later operations on these boards do not look them up by name.
         :return: List of board objects: List
         """
-        boards = CLIENT.get_boards()
+        boards = []
+        page = 1
+        while True:
+            # THE API RETURNS A LIMITED NUMBER OF BOARDS PER REQUEST
+            boards_page = self.scheduler.call(self.connection.client.get_boards, limit=BOARDS_PAGE_SIZE, page=page, description=f"get page {page} of boards")
+            boards.extend(boards_page)
+            if len(boards_page) < BOARDS_PAGE_SIZE:
+                break
+            page += 1
 
-        for board in boards:
-            board_info = {
-                "board_id": board.id,
-                "board_name": board.name
-            }
-            # print(f"LOG INFO: {board_info} ")
-            self.existing_boards_list.append(board)
-        # print(f"LOG INFO: Existing boards list:\n\t{self.existing_boards_list}")
+        with self.cache_lock:
+            for board in boards:
+                self.board_objects_cache.setdefault(board.name, board)
+        self.existing_boards_list = boards
+        logger.info("%s boards found.", len(boards))
         return self.existing_boards_list
 
+    def fan_out(self, func, board_names=None, max_workers=8):
+        """
+        Runs an operation for many boards concurrently on a bounded pool of threads, e.g. to read the items or the
+        columns of every board. The threads share the caches of the wrapper and its scheduler, so the complexity
+        budget and the retries apply to all of them together.
+        :param func: Function called with each board name. Its return value is the value of the result: function
+        :param board_names: Names of the boards. Defaults to all the boards (see get_list_of_existing_boards): List
+        :param max_workers: Maximum number of boards processed at the same time: int
+        :return: One result per board, in the order of the board names: List of FanOutResult
+        """
+        if board_names is None:
+            board_names = [board.name for board in self.get_list_of_existing_boards()]
+
+        def run(board_name):
+            try:
+                return FanOutResult(board_name, True, value=func(board_name))
+            except Exception as e:
+                logger.error("Operation on board '%s' failed. ERROR DETAILS: %s", board_name, e)
+                return FanOutResult(board_name, False, error=e)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="monday-fan-out") as executor:
+            results = list(executor.map(run, board_names))
+        logger.info("Operation run on %s boards in %.1fs. %s failed.", len(results), time.perf_counter() - start,
+                    sum(1 for result in results if not result.success))
+        return results
+
+    def get_items_in_boards(self, board_names=None, max_workers=8):
+        """
+        Gets the items of many boards concurrently (see fan_out and get_items_in_single_board).
+        :param board_names: Names of the boards. Defaults to all the boards: List
+        :param max_workers: Maximum number of boards read at the same time: int
+        :return: One result per board, whose value is the list of item objects of the board: List of FanOutResult
+        """
+        return self.fan_out(lambda board_name: self.get_items_in_single_board(board_name), board_names=board_names, max_workers=max_workers)
+
+    def get_columns_in_boards(self, board_names=None, max_workers=8):
+        """
+        Gets the columns of many boards concurrently (see fan_out and get_columns_in_single_board).
+        :param board_names: Names of the boards. Defaults to all the boards: List
+        :param max_workers: Maximum number of boards read at the same time: int
+        :return: One result per board, whose value is the list of column objects of the board: List of FanOutResult
+        """
+        return self.fan_out(lambda board_name: self.get_columns_in_single_board(board_name), board_names=board_names, max_workers=max_workers)
+
     def get_columns_in_single_board(self, board_name=None):
         """
         Gets a list of all columns in the board with the name passed.
@@ -251,30 +3600,43 @@ class MondayWrapper:
         if not board_name:
             board_name = self.board_name
 
-        print(f"LOG INFO: Getting columns for board {board_name}")
+        logger.debug("Getting columns for board %s", board_name)
 
         # CHECK IN CACHE FOR COLUMNS OBJECT LIST
-        print(f"LOG INFO: Checking in column objects list for board name {board_name} in cache.")
-        if board_name in self.column_objects_cache:
-            print(f"LOG SUCCESS: Found column object list for board name '{board_name}' in column object list cache")
-            return self.column_objects_cache.get(board_name)
+        logger.debug("Checking in column objects list for board name %s in cache.", board_name)
+        columns_list = self.column_objects_cache.get(board_name)
+        self.metrics.record_cache("column", columns_list is not None)
+        if columns_list is not None:
+            logger.debug("Found column object list for board name '%s' in column object list cache", board_name)
+            return columns_list
         else:
-            print(f"LOG WARN: No column object list was found for the board \"{board_name}\".")
+            logger.debug('No column object list was found for the board "%s".', board_name)
+
+        # CHECK IN THE PERSISTENT CACHE: COLUMN OBJECTS ARE REBUILT FROM THE STORED COLUMN DICTS
+        if self.persistent_cache is not None:
+            columns_data = self.persistent_cache.get_columns(board_name)
+            self.metrics.record_cache("persistent_column", columns_data is not None)
+            if columns_data is not None:
+                columns_list = [Column(**column_data) for column_data in columns_data]
+                with self.cache_lock:
+                    self.column_objects_cache[board_name] = columns_list
+                return columns_list
 
         # IF COLUMNS LIST FOR BOARD NOT IN CACHE, RETRIEVE AND ADD TO CACHE
-        retrieved_board = CLIENT.get_board_by_name(board_name)
-        columns_list = retrieved_board.get_columns()
-        # ADD TO CACHE: COLUMN OBJECT
-        self.column_objects_cache[board_name] = columns_list
+        retrieved_board = self._get_board_object(board_name)
 
-        for column in columns_list:
-            # COLUMN ID IS NOT A NUMBER. IT IS A STRING.
-            column_info = {"column_id": column.id,
-                           "column_title": column.title,
-                           "column type": column.type
-                           }
-            # print(f"LOG INFO: COLUMN DETAILS {column_info}")
-        # print(f"LOG INFO: List of columns in board {board_name}:\n\t{board_colunms_list}")
+        def fetch_columns():
+            columns_list = self.scheduler.call(retrieved_board.get_columns, description=f"get columns of board '{board_name}'")
+            # ADD TO CACHE: COLUMN OBJECT. BEFORE THE SINGLE-FLIGHT KEY IS RELEASED, SO LATER LOOKUPS FIND IT
+            with self.cache_lock:
+                self.column_objects_cache[board_name] = columns_list
+            if self.persistent_cache is not None:
+                self.persistent_cache.set_columns(board_name, columns_list)
+            return columns_list
+
+        columns_list = self.single_flight.do(("columns", board_name), fetch_columns)
+
+        logger.debug("%s columns found in board '%s'", len(columns_list), board_name)
         return columns_list
 
     def get_column_settings_string_for_board(self, board_name=None, col_title="Status"):
@@ -288,53 +3650,94 @@ class MondayWrapper:
         if not board_name:
             board_name = self.board_name
 
-        print(f"LOG INFO: Getting columns for board {board_name}")
-        retrieved_board = CLIENT.get_board_by_name(board_name)
-        columns = retrieved_board.get_columns()
-
-        for column in columns:
-            if column.title == col_title:
-                label_setting_str = column.settings_str
-                return label_setting_str
-
-        return None
+        codec = self.get_column_codecs(board_name=board_name).get(col_title)
+        if codec is None:
+            return None
+        return codec.settings_str
 
     def get_all_items_in_all_boards(self):
         """
         Gets a list of all items in all boards.
+        All the items are held in memory as moncli objects: for large accounts use iter_all_items() instead.
         :return: List of item objects: List
         """
-
-        items = CLIENT.get_items(limit=50, newest_first=True)
-        for item in items:
-            item_info = {"item_id": item.id,
-                         "item_name": item.name
-                         }
-            # print(f"LOG INFO: ITEM DETAILS {item_info}")
-            self.all_items_list.append(item)
-        # print(f"LOG INFO: List of all items from all boards:\n\t{self.all_items_list}")
+        self.all_items_list = [self._item_object(item) for item in self.iter_all_items()]
+        logger.info("%s items found in all boards.", len(self.all_items_list))
         return self.all_items_list
 
+    def iter_all_items(self, page_size=500, columns=None, prefetch=False, boards_page_size=BOARDS_PAGE_SIZE):
+        """
+        Generator of all the items of all boards, board by board. The boards are listed page by page and the items
+        of each board are read with cursor pagination (see iter_board_items), so memory use stays bounded.
+        :param page_size: Number of items fetched per API request (at most 500): int
+        :param columns: Titles of the columns to read with each item. Boards without a column are read without it: List
+        :param prefetch: Fetch the next page of items in a background thread while the current page is processed: bool
+        :param boards_page_size: Number of boards listed per API request: int
+        :return: Generator of item dicts
+        """
+        # THE COLUMNS OF EACH BOARD ARE LISTED WITH THE BOARD: BOARDS ARE NOT LOOKED UP AGAIN BY NAME FOR THEIR CODECS
+        board_fields = ['id', 'name']
+        if columns:
+            board_fields += ['columns.id', 'columns.title', 'columns.type', 'columns.settings_str']
+        page = 1
+        while True:
+            boards_data = self.scheduler.call(api_v2.get_boards, self.connection.api_key_v2, *board_fields, limit=boards_page_size, page=page,
+                                              description=f"get page {page} of boards")
+            for board_data in boards_data:
+                registry = ColumnCodecRegistry(board_data['columns']) if columns else None
+                codecs = self._get_codecs_for_columns(board_data['name'], columns, registry=registry)
+                reader = ItemPageReader(board_data['id'], page_size=page_size, codecs=codecs, prefetch=prefetch, scheduler=self.scheduler, connection=self.connection)
+                yield from reader
+            if len(boards_data) < boards_page_size:
+                return
+            page += 1
+
     def get_list_of_users(self):
         """
-        Gets a list of users for the workspace
+        Gets a list of users for the workspace, from the user directory of the wrapper (see UserDirectory).
         :return: List of user objects : List
         """
-        users = CLIENT.get_users(kind=UserKind.all)
-        for user in users:
-            if user.is_guest:
-                user_type = "Guest"
-            else:
-                user_type = "Team Member"
-            user_info = {"User_id": user.id,
-                         "Name": user.name,
-                         "Email": user.email,
-                         "User_type": user_type
-                         }
-            # print(f"LOG INFO: USER INFO DETAILS: {user_info}")
-            self.all_users_list.append(user)
+        self.user_directory.ensure_fresh()
+        self.all_users_list = list(self.user_directory.users)
         return self.all_users_list
 
+    def get_user_by_email(self, email):
+        """
+        Gets a user from its email, from the user directory of the wrapper. No API request is made once the
+        directory is loaded.
+        :param email: str
+        :return: User object, or None if no user has that email
+        """
+        return self.user_directory.get_by_email(email)
+
+    def get_user_by_name(self, name):
+        """
+        Gets a user from its name, from the user directory of the wrapper.
+        :param name: str
+        :return: User object, or None if no user has that name
+        """
+        return self.user_directory.get_by_name(name)
+
+    def _resolve_people(self, new_value):
+        """
+        Resolves the value of a people column, given as user ids, emails or names (a list, or a comma separated
+        string), to user ids with the user directory.
+        This method is to be used only internally by the class.
+        :param new_value: str, int or List
+        :return: List of user ids, or None if a user is not found: List
+        """
+        users = new_value if isinstance(new_value, (list, tuple, set)) else str(new_value).split(",")
+        user_ids = []
+        for user in users:
+            if isinstance(user, str) and not user.strip():
+                continue
+            user_id = self.user_directory.resolve_id(user)
+            if user_id is None:
+                logger.warning("No user found with id, email or name '%s'", user)
+                return None
+            user_ids.append(user_id)
+        return user_ids
+
     def get_columns_for_item_from_board(self, item_name, board_name=None):
         """
         Gets a list of columns for an item. A board name can be passed to narrow down the search.
@@ -352,50 +3755,182 @@ class MondayWrapper:
         if item_object:
             # MEANS ITEM WITH NAME WAS FOUND IN THE BOARD WITH GIVEN NAME
             columns_list = self.get_columns_in_single_board(board_name)
-            print(f"LOG INFO: Found columns for item {item_name}, located in board {board_name}")
+            logger.debug("Found columns for item %s, located in board %s", item_name, board_name)
             return columns_list
         else:
             return []
 
+    def _read_column_value(self, item_name, col_title, board_name):
+        """
+        Reads one cell with a single request selecting only its column, and decodes it with the column codec of the board.
+        This method is to be used only internally by the class.
+        :param item_name: Item name: str
+        :param col_title: Column title: str
+        :param board_name: Board name: str
+        :return: Decoded value, or None if the item, the column or the value is missing
+        """
+        codec = self.get_column_codecs(board_name=board_name).get(col_title)
+        if codec is None:
+            logger.error("No column with title '%s' in board '%s'", col_title, board_name)
+            return None
+        item_id = self.get_item_id_by_name(item_name=item_name, board_name=board_name)
+        if item_id is None:
+            logger.info("No item/task found with name '%s' in '%s'", item_name, board_name)
+            return None
+
+        query = (f"query {{ complexity {{ query after reset_in_x_seconds }} items (ids: [{int(item_id)}]) "
+                 f"{{ column_values (ids: [{graphql_string(codec.id)}]) {{ id text value }} }} }}")
+        data = self.scheduler.call(self.connection.execute_graphql, query, raise_errors=True, description=f"get column values of item '{item_name}'", operation="column_values")["data"]
+        self.scheduler.report_complexity(data)
+        items = data.get("items") or []
+        column_values = (items[0].get("column_values") or []) if items else []
+        if not column_values:
+            return None
+        logger.debug("Column information: %s", column_values[0])
+        return codec.decode(column_values[0].get("value"), column_values[0].get("text"))
+
     def get_value_of_column_for_item(self, item_name, col_title, board_name=None):
         """
         Get the value of a particular cell with the item name passed , column title passed and board name passed.
+        The value is decoded with the column codecs, as in get_column_values: status columns to their label,
+        numbers to float, links to their url, other columns to their text.
         If no board name is passed to this method, the name passed in the __init__ method is used.
 
         :param item_name: str
         :param col_title: str
         :param board_name: str
-        :return: value of particular cell cast as a string: str
+        :return: decoded value of the cell, or None if the item or the column does not exist
         """
-        value_index = 2  # THE VALUE OF AN ITEM FROM A PARTICULAR COLUMN IS THE THIRD ITEM IN THE COLUMN OBJECT
         if not board_name:
             board_name = self.board_name
 
-        # GET THE ITEM OBJECT FOR THE ITEM PARAMETERS SUPPLIED
-        item_obj = self.get_specific_item_by_name(item_name=item_name, board_name=board_name)
+        return self._read_column_value(item_name, col_title, board_name)
 
-        # GET COLUMN ID
-        col_id = self.get_column_id_by_name(col_name=col_title, board_name=board_name)
+    def get_column_values(self, col_titles, item_names=None, board_name=None, page_size=500):
+        """
+        Gets the values of some columns for all the items of a board, or for the items whose names are passed.
+        The board is read with paginated queries that select only the requested columns, instead of one query per
+        item fetching all its column values. Values are decoded with the column codecs: status columns to their label,
+        numbers to float, links to their url, other columns to their text.
+        When several items share a name, the first one in board order is returned.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param col_titles: Title of the column, or list of titles of the columns to read: str or List
+        :param item_names: Names of the items to read. All the items of the board are read if None: List
+        :param board_name: str
+        :param page_size: Number of items fetched per API request (at most 500): int
+        :return: Item name -> {column title: decoded value}. Items not found are not in the dict: dict
+        """
+        if not board_name:
+            board_name = self.board_name
+        if isinstance(col_titles, str):
+            col_titles = [col_titles]
 
-        # GET THE COLUMN VALUE OBJECT FROM THE ITEM OBJECT
-        print(f"LOG INFO: Getting column value object from item object (item name: \"{item_name}\")")
-        try:
-            col_val_object = item_obj.get_column_value(title=col_title)
-        except Exception as e:
-            print(f"LOG ERROR: Error getting column value object for item \"{item_name}\"  at column \"{col_title}\" using column name. ERROR DETAILS: {e}. Will use Id")
-            col_val_object = item_obj.get_column_value(id=col_id)
-            if col_val_object:
-                print(f"LOG INFO: Column value object found for item \"{item_name}\" and column \"{col_title}\" using column id.")
+        wanted = set(item_names) if item_names is not None else None
+        values = {}
+        for item in self.iter_board_items(board_name, page_size=page_size, columns=col_titles):
+            if item["name"] in values or (wanted is not None and item["name"] not in wanted):
+                continue
+            values[item["name"]] = item["column_values"]
+            # STOP READING PAGES ONCE ALL THE ITEMS ASKED FOR ARE FOUND
+            if wanted is not None and len(values) == len(wanted):
+                break
 
-        # THIRD KEY OF THE DICT FORM OF COL_VAL_OBJECT IS THE VALUE
-        col_val_dict = col_val_object.__dict__
-        print(f"LOG INFO: COLUMN INFORMATION : {col_val_dict}")
-        keys = list(col_val_dict.keys())
+        if wanted is not None and len(values) < len(wanted):
+            logger.info("%s of %s items not found in board '%s'", len(wanted) - len(values), len(wanted), board_name)
+        return values
 
-        col_val_key = keys[value_index]
-        value = col_val_dict[col_val_key]
+    def create_index(self, col_title, board_name=None, unique=False, page_size=500):
+        """
+        Builds an in-memory index of the values of a column (e.g. an external key such as an email or an order number),
+        so find_items and find_items_in_range need no API request. The index is kept current by the writes made through
+        the wrapper (column changes, batch writes, new and archived items) and by webhook events (see apply_webhook_event).
+        Writes that would give a value of a unique index to a second item are rejected.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param col_title: Name/ title of column: str
+        :param board_name: str
+        :param unique: Reject values already held by another item: bool
+        :param page_size: Number of items fetched per API request: int
+        :return: The index, or None if the board has no column with the title passed: ColumnIndex
+        """
+        if not board_name:
+            board_name = self.board_name
 
-        return value
+        codec = self.get_column_codecs(board_name=board_name).get(col_title)
+        if codec is None:
+            logger.error("No column with title '%s' in board '%s'. It will not be indexed.", col_title, board_name)
+            return None
+
+        index = ColumnIndex(board_name, col_title, codec.id, codec.type, unique=unique)
+        items = self.iter_board_items(board_name=board_name, page_size=page_size, columns=[col_title])
+        indexed_items = index.build((item["id"], item["name"], item["column_values"].get(col_title)) for item in items)
+        with self.cache_lock:
+            self.column_indexes[(board_name, col_title)] = index
+        logger.info("Indexed %s values of column '%s' in board '%s'", indexed_items, col_title, board_name)
+        return index
+
+    def drop_index(self, col_title, board_name=None):
+        """
+        Drops the index of a column built by create_index.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param col_title: Name/ title of column: str
+        :param board_name: str
+        :return: True if the column was indexed: bool
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        with self.cache_lock:
+            return self.column_indexes.pop((board_name, col_title), None) is not None
+
+    def _get_column_index(self, col_title, board_name):
+        index = self.column_indexes.get((board_name, col_title))
+        self.metrics.record_cache("column_index", index is not None)
+        if index is None:
+            index = self.create_index(col_title, board_name=board_name)
+        return index
+
+    def _index_item_objects(self, index, item_ids_and_names):
+        board = self._get_board_object(index.board_name)
+        return [ItemRecord(item_id, item_name, board.id).to_item(self.connection.creds) for item_id, item_name in item_ids_and_names]
+
+    def find_items(self, col_title, value, board_name=None):
+        """
+        Returns the items whose column holds the value passed, looked up in the index of the column.
+        The column is indexed on first use if create_index was not called for it.
+        Values are compared as read from the board: status label, number, date as YYYY-MM-DD, link url, text.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param col_title: Name/ title of column: str
+        :param value: Value looked up
+        :param board_name: str
+        :return: List of item objects, in id order
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        index = self._get_column_index(col_title, board_name)
+        if index is None:
+            return []
+        return self._index_item_objects(index, index.find(value))
+
+    def find_items_in_range(self, col_title, low=None, high=None, board_name=None):
+        """
+        Returns the items whose column value is between low and high (both included), looked up in the sorted index
+        of the column, e.g. numbers or dates (YYYY-MM-DD) in a range. Without bounds, all the items with a value are returned.
+        The column is indexed on first use if create_index was not called for it.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param col_title: Name/ title of column: str
+        :param low: Lowest value, or None for no lower bound
+        :param high: Highest value, or None for no upper bound
+        :param board_name: str
+        :return: List of item objects, in value order
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        index = self._get_column_index(col_title, board_name)
+        if index is None:
+            return []
+        return self._index_item_objects(index, [(item_id, item_name) for item_id, item_name, value in index.find_range(low, high)])
 
     def get_item_id_by_name(self, item_name, board_name=None):
         """
@@ -413,7 +3948,7 @@ class MondayWrapper:
         for item_obj in item_objects_list:
             if item_obj.name == item_name:
                 item_id = item_obj.id
-                print(f"LOG INFO: RESULT: Id found for item {item_name}, in board {board_name}, Item Id: {item_id}")
+                logger.debug("RESULT: Id found for item %s, in board %s, Item Id: %s", item_name, board_name, item_id)
                 return item_id
         return None
 
@@ -428,60 +3963,66 @@ class MondayWrapper:
         """
         item_objects_list = []
 
-        # CHECK IN CACHE FOR BOARD OBJECT
-        print(f"LOG INFO: Checking in board object cache for board object with name '{board_name}'.")
-        board = self.board_objects_cache.get(board_name)
-        if board is None:
-            # IF NOT IN CACHE, QUERY MONDAY API FOR BOARD OBJECT
-            try:
-                board = CLIENT.get_board(name=board_name)
-                self.board_objects_cache[board_name] = board
-            except Exception as e:
-                print(f"LOG ERROR: Board with name '{board_name}' not returned from API query. ERROR DETAILS: {e}. Will pause and try again")
-                complexityError = True
-                counter = 1
-                while complexityError and counter < 30:
-                    print(f"\nTrying Mpnday.com API. Try #{counter} from _get_item_objects_list - getting board object")
-                    time.sleep(2)
-                    try:
-                        board = CLIENT.get_board(name=board_name)
-                        self.board_objects_cache[board_name] = board
-                        complexityError = False
-                    except Exception as e:
-                        print(f"LOG ERROR: Board object with name '{board_name}' not returned from API query. Item objects list cannot be queried . ERROR DETAILS: {e}")
-                        counter = counter + 1
-
-                if complexityError:
-                    return item_objects_list
+        # ANSWER FROM THE BOARD SNAPSHOT IF SNAPSHOT MODE IS ENABLED FOR THIS BOARD
+        # LOOKUPS ANSWERED FROM A SNAPSHOT ARE ITEM CACHE HITS, LOOKUPS SENT TO THE API ARE MISSES
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is not None:
+            self.metrics.record_cache("item", True)
+            snapshot.ensure_fresh()
+            item_objects_list = snapshot.get_items_by_name(item_name)
+            logger.debug("Found %s item objects with name '%s' in snapshot of board '%s'", len(item_objects_list), item_name, board_name)
+            return item_objects_list
 
-        else:
-            print(f"LOG SUCCESS: Found board object in cache for board name {board_name}. Will use to check if item exists.")
+        # GET BOARD OBJECT FROM CACHE, OR QUERY MONDAY API FOR IT
+        try:
+            board = self._get_board_object(board_name)
+        except Exception as e:
+            logger.error("Board object with name '%s' not returned from API query. Item objects list cannot be queried. ERROR DETAILS: %s", board_name, e)
+            return item_objects_list
+
+        # CHECK IN THE ITEM CACHE: ITEM OBJECTS ARE REBUILT FROM THE CACHED RECORDS
+        records = self.item_objects_cache.get((int(board.id), item_name))
+        self.metrics.record_cache("item", records is not None)
+        if records is not None:
+            logger.debug("Found %s item records with name '%s' in item cache", len(records), item_name)
+            creds = self.connection.creds
+            return [record.to_item(creds) for record in records]
+
+        # CHECK IN THE PERSISTENT CACHE: ITEM OBJECTS ARE REBUILT FROM THE STORED ITEM IDS
+        if self.persistent_cache is not None:
+            item_ids = self.persistent_cache.get_item_ids(board_name, item_name)
+            self.metrics.record_cache("persistent_item", bool(item_ids))
+            if item_ids:
+                creds = self.connection.creds
+                item_objects_list = [Item(creds=creds, id=item_id, name=item_name, board={'id': board.id}) for item_id in item_ids]
+                self._cache_item_objects(board.id, item_name, item_objects_list)
+                return item_objects_list
 
         # GET ITEMS IN CURRENT BOARD FIRST WITH ATTRIBUTES MATCHING ITEM NAME SUPPLIED
+        # THE GROUP OF EACH ITEM IS READ WITH IT, SO THE CACHED RECORDS ARE COMPLETE
+        def fetch_records():
+            items_data = self.scheduler.call(api_v2.get_items_by_column_values, self.connection.api_key_v2, board.id, 'name', str(item_name),
+                                             'id', 'name', 'board.id', 'group.id', description=f"get items with name '{item_name}'")
+            fetched_records = [ItemRecord.from_data(item_data) for item_data in items_data]
+            # CACHED BEFORE THE SINGLE-FLIGHT KEY IS RELEASED, SO LATER LOOKUPS FIND THEM
+            if fetched_records:
+                self._cache_item_objects(board.id, item_name, fetched_records)
+                # ONLY ITEMS THAT EXIST ARE PERSISTED: A MISSING ITEM MAY BE CREATED BY ANOTHER PROCESS AT ANY TIME
+                if self.persistent_cache is not None:
+                    self.persistent_cache.set_item_ids(board_name, item_name, [str(record.id) for record in fetched_records if record.name == item_name])
+            return fetched_records
+
         try:
-            status_value = create_column_value(id='name', column_type=ColumnType.name, value=str(item_name))
-            item_objects_list = board.get_items_by_column_values(column_value=status_value)
-            print(f"LOG SUCCESS: Found item object list from API using item name {item_name}")
+            records = self.single_flight.do(("items", int(board.id), item_name), fetch_records)
+            logger.debug("Found item object list from API using item name %s", item_name)
         except Exception as e:
-            print(f"LOG ERROR: Error getting item objects list matching item name {item_name} from Monday API. ERROR DETAILS: {e}")
-            print(f"LOG INFO: No item objects returned from the search for item objects for item name \"{item_name}\" due to API error. WIll pause and re-query Monday API")
-            complexityError = True
-            counter = 1
-            while complexityError and counter < 30:
-                print(f"\nTrying Mpnday.com API. Try #{counter} from (_get_item_objects_list - getting status value )")
-                time.sleep(2)
-                try:
-                    status_value = create_column_value(id='name', column_type=ColumnType.name, value=str(item_name))
-                    item_objects_list = board.get_items_by_column_values(column_value=status_value)
-                    complexityError = False
-                except Exception as e:
-                    print(f"LOG ERROR: Error getting board objects list  matching item name {item_name} from Monday API on try # {counter}. ERROR DETAILS: {e}")
-                    counter = counter + 1
-            if complexityError:
-                item_objects_list = []
-
-        if item_objects_list:
-            print(f"LOG SUCCESS: Item objects list returned for the search for item name \"{item_name}\"")
+            logger.error("Error getting item objects list matching item name %s from Monday API. ERROR DETAILS: %s", item_name, e)
+            records = []
+
+        creds = self.connection.creds
+        item_objects_list = [record.to_item(creds) for record in records]
+        if records:
+            logger.debug('Item objects list returned for the search for item name "%s"', item_name)
         return item_objects_list
 
     def get_column_id_by_name(self, col_name, board_name=None):
@@ -495,15 +4036,12 @@ class MondayWrapper:
         if not board_name:
             board_name = self.board_name
 
-        # GET COLUMNS IN CURRENT BOARD AND FILTER OUT BOARD WITH COLUMN NAME/ TITLE SUPPLIED
-        col_obj_list = self.get_columns_in_single_board(board_name=board_name)
-        for col_obj in col_obj_list:
-            if col_obj.title == col_name:
-                col_id = col_obj.id
-                print(f'LOG INFO: RESULT: Id found. Column name {col_obj.title}, Column Id: {col_id}')
-                return col_id
-
-        return None
+        # LOOK UP THE COLUMN WITH COLUMN NAME/ TITLE SUPPLIED IN THE CODECS OF THE BOARD
+        codec = self.get_column_codecs(board_name=board_name).get(col_name)
+        if codec is None:
+            return None
+        logger.debug("RESULT: Id found. Column name %s, Column Id: %s", codec.title, codec.id)
+        return codec.id
 
     def get_column_type_by_name(self, col_title, board_name=None):
         """
@@ -516,15 +4054,12 @@ class MondayWrapper:
         if not board_name:
             board_name = self.board_name
 
-        # GET COLUMNS IN CURRENT BOARD AND FILTER OUT BOARD WITH COLUMN NAME/ TITLE SUPPLIED
-        col_obj_list = self.get_columns_in_single_board(board_name=board_name)
-        for col_obj in col_obj_list:
-            if col_obj.title == col_title:
-                col_type = col_obj.type
-                print(f"LOG INFO: RESULT: Found type for column '{col_title}' located in board '{board_name}'. Column Type: {col_type}")
-                return col_type
-
-        return None
+        # LOOK UP THE COLUMN WITH COLUMN NAME/ TITLE SUPPLIED IN THE CODECS OF THE BOARD
+        codec = self.get_column_codecs(board_name=board_name).get(col_title)
+        if codec is None:
+            return None
+        logger.debug("RESULT: Found type for column '%s' located in board '%s'. Column Type: %s", col_title, board_name, codec.type)
+        return codec.type
 
     def get_status_of_item(self, item_name, col_title="Status", board_name=None):
         """
@@ -534,43 +4069,113 @@ class MondayWrapper:
         :param item_name: str
         :param col_title: str
         :param board_name: str
-        :return: status of item: str
+        :return: status label of item, or None if the item or the column does not exist: str
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        return self._read_column_value(item_name, col_title, board_name)
+
+    def _compose_column_value(self, col_title, new_value, board_name, link_text=None):
+        """
+        Composes the moncli column value object used to write new_value into the column with the title passed.
+        The value is built by the codec of the column, according to the column type.
+        This method is to be used only internally by the class.
+        :param col_title: Name/ title of column: str
+        :param new_value: New value: Date values should be entered in the format. YYYY-MM-DD: str
+        :param board_name: Name of board: str
+        :param link_text: Text displayed for link columns: str
+        :return: Column value object, or None if the column type is not supported
+        """
+        # ENCODE WITH THE PRE-BUILT CODEC OF THE COLUMN: NO API REQUEST ONCE THE CODECS OF THE BOARD ARE BUILT
+        codecs = self.get_column_codecs(board_name=board_name)
+        codec = codecs.get(col_title)
+        if codec is not None and codec.type == 'multiple-person':
+            # PEOPLE ARE RESOLVED FROM THE USER DIRECTORY: NO API REQUEST ONCE IT IS LOADED
+            new_value = self._resolve_people(new_value)
+            if new_value is None:
+                return None
+        return codecs.encode(col_title, new_value, link_text=link_text)
+
+    def update_item_columns(self, item_name, column_values, board_name=None):
+        """
+        Changes the values of several columns of one item in a single API request (change_multiple_column_values).
+        Values are composed with the same per column type logic as change_value_of_column.
+        Values that are None are skipped. For link columns, the value can be a tuple of (url, link text).
+        When write-behind is enabled (see enable_write_behind), the changes are queued and written later.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param item_name: Name of item/ task: str
+        :param column_values: Mapping of column title to new value: dict
+        :param board_name: Name of board: str
+        :return: Mapping of column title to the new value for the columns changed, or None if nothing was changed: dict
         """
-        value_index = 2  # THE VALUE OF AN ITEM FROM A PARTICULAR COLUMN IS THE THIRD ITEM IN THE COLUMN OBJECT
         if not board_name:
             board_name = self.board_name
 
+        if self.write_behind is not None:
+            changed_values = {col_title: new_value for col_title, new_value in column_values.items() if new_value is not None}
+            if not changed_values:
+                return None
+            self.write_behind.change_columns(item_name, changed_values, board_name=board_name)
+            return changed_values
+
         # GET THE ITEM OBJECT FOR THE ITEM PARAMETERS SUPPLIED
         item_obj = self.get_specific_item_by_name(item_name=item_name, board_name=board_name)
+        if item_obj is None:
+            logger.warning('Item object for item name "%s" is "None". Column values will not be changed!', item_name)
+            return None
 
-        # GET THE COLUMN VALUE OBJECT FROM THE ITEM OBJECT
-        col_val_object = item_obj.get_column_value(title=col_title)
+        try:
+            self._check_unique_indexes(board_name, item_obj.id, column_values)
+        except ValueError as e:
+            logger.error("Column values of item %s will not be changed: %s", item_name, e)
+            return None
 
-        # THIRD KEY OF THE DICT FORM OF COL_VAL_OBJECT IS THE VALUE
-        col_val_dict = col_val_object.__dict__
-        print(f"LOG INFO: Column Information : {col_val_dict}")
-        keys = list(col_val_dict.keys())
+        # COMPOSE A COLUMN VALUE FOR EACH COLUMN
+        composed_values = []
+        changed_values = {}
+        for col_title, new_value in column_values.items():
+            if new_value is None:
+                # SAME AS change_value_of_column: NONE VALUES (E.G. FROM THE DATABASE) ARE NOT WRITTEN
+                continue
 
-        col_val_key = keys[value_index]
-        value = col_val_dict[col_val_key]
+            link_text = None
+            if isinstance(new_value, tuple):
+                new_value, link_text = new_value
 
-        col_type = self.get_column_type_by_name(col_title=col_title, board_name=board_name)
-        if col_type == 'color':
-            value_dict = value.__dict__
-            status_index = col_val_dict.get('index')
+            column_value = self._compose_column_value(col_title=col_title, new_value=new_value, board_name=board_name, link_text=link_text)
+            if column_value is None:
+                logger.warning('Could not compose value for column "%s" of item "%s". Column will be skipped.', col_title, item_name)
+                continue
 
-            status = value_dict['labels'][str(status_index)]
-            return status
+            composed_values.append(column_value)
+            changed_values[col_title] = new_value
 
-        return value
+        if not composed_values:
+            logger.warning('No column values to change for item "%s"', item_name)
+            return None
+
+        # SEND ALL COLUMN VALUES IN ONE MUTATION
+        try:
+            self.scheduler.call(item_obj.change_multiple_column_values, composed_values, description=f"change column values of item '{item_name}'")
+            logger.info("Changed %s column values for item %s", len(composed_values), item_name)
+            self._update_indexes(board_name, item_obj.id, changed_values, item_name=item_name)
+            return changed_values
+        except Exception as e:
+            logger.error("Changing column values for item %s failed: DETAILS: %s", item_name, e)
+            self._forget_item(board_name, item_name)
+
+        return None
 
     def change_value_of_column(self, item_name, col_title, new_value, board_name=None, link_text=None):
         """
         Changes the value of a column. Column type needs to be checked first
+        When write-behind is enabled (see enable_write_behind), the change is queued and written later.
         If no board name is passed to this method, the name passed in the __init__ method is used.
         :param item_name: Name of item/ task: str
         :param col_title: Name/ title of column: str
-        :param new_value: New value: Date values should be entered in the format. YYYY-MM-DD: str
+        :param new_value: New value: Date values should be entered in the format. YYYY-MM-DD.
+        People columns take user emails, names or ids, as a list or a comma separated string: str
         :param board_name: Name of board: str
         :return: The new value: str
         """
@@ -579,96 +4184,38 @@ class MondayWrapper:
             # IF NEW VALUE IS OF NONE TYPE, RETURN NONE. THIS MAY HAPPEN WHEN VALUES FROM THE DATABASE ARE NONE (FOR AUTOMATION)
             return None
 
-        column_value = None
         if not board_name:
             board_name = self.board_name
 
+        if self.write_behind is not None:
+            self.write_behind.change_value(item_name, col_title, new_value, board_name=board_name, link_text=link_text)
+            return new_value
+
         # GET THE ITEM OBJECT FOR THE ITEM PARAMETERS SUPPLIED
         item_obj = self.get_specific_item_by_name(item_name=item_name, board_name=board_name)
         if item_obj is None:
-            print(f"LOG WARN: Item object is for item name \"{item_name}\" \"None\".")
-            print(f"\nLOG WARN:****Max query complexity for API might have been reached trying to get item object for {item_name}. Cooling off  before retrying.")
-            complexityError = True
-            counter = 1
-            while complexityError and counter < 30:
-                print(f"\nTrying Mpnday.com API. Try #{counter} from (change_value_of_column -  get item object)")
-                time.sleep(2)
-                item_obj = self.get_specific_item_by_name(item_name=item_name, board_name=board_name)
-                if item_obj:
-                    print(f"LOG SUCCESS: Item object for item name \"{item_name}\" was found on try #{counter}.")
-                    complexityError = False
-                else:
-                    print(f"LOG ERROR: Cannot get item object to use to change column value.")
-                    counter = counter + 1
-
-            if item_obj is None:
-                print(f"LOG WARN: Item object for item name \"{item_name}\" is \"None\" after {counter} tries. Column value will not be changed!")
-
-        # GET THE ID OF THE SPECIFIED COLUMN
-        col_id = self.get_column_id_by_name(col_name=col_title)
-
-        # GET COLUMN TYPE AND COMPOSE COLUMN VALUE
-        # ==================================================================================================
-        col_type = self.get_column_type_by_name(col_title=col_title, board_name=board_name)
-        if col_type == 'long-text':
-            column_type = ColumnType.long_text
-            column_value = create_column_value(id=col_id, column_type=column_type, text=str(new_value))
-
-        elif col_type == 'numeric':
-            column_type = ColumnType.numbers
-            column_value = create_column_value(id=col_id, column_type=column_type, value=float(new_value))
-
-        elif col_type == 'text':
-            column_type = ColumnType.text
-            column_value = create_column_value(id=col_id, column_type=column_type, value=str(new_value))
-
-        elif col_type == 'name':
-            column_type = ColumnType.name
-            column_value = create_column_value(id=col_id, column_type=column_type, value=str(new_value))
-
-        elif col_type == 'color':
-            column_type = ColumnType.status
-            labels_string = self.get_column_settings_string_for_board(board_name=board_name, col_title=col_title)
-
-            labels = json.loads(labels_string)
-
-            settings = StatusSettings(**labels)
-            column_value = create_column_value(id=col_id, column_type=column_type, label=str(new_value), settings=settings)
-            column_value.change_status_by_label(new_value)
+            # TRANSIENT API ERRORS WERE ALREADY RETRIED BY THE SCHEDULER: THE ITEM DOES NOT EXIST
+            logger.warning('Item object for item name "%s" is "None". Column value will not be changed!', item_name)
+            return None
 
-        elif col_type == 'date':
-            column_type = ColumnType.date
-            column_value = create_column_value(id=col_id, column_type=column_type, date=str(new_value))
+        try:
+            self._check_unique_indexes(board_name, item_obj.id, {col_title: new_value})
+        except ValueError as e:
+            logger.error("Column value of item %s will not be changed: %s", item_name, e)
+            return None
 
-        elif col_type == 'link':
-            column_type = ColumnType.link
-            if link_text:
-                column_value = create_column_value(id=col_id, column_type=column_type, url=str(new_value), text=str(link_text))
-            else:
-                column_value = create_column_value(id=col_id, column_type=column_type, url=str(new_value))
-        # ===================================================================================================
+        # GET THE ID AND TYPE OF THE SPECIFIED COLUMN AND COMPOSE COLUMN VALUE
+        column_value = self._compose_column_value(col_title=col_title, new_value=new_value, board_name=board_name, link_text=link_text)
 
         # FINALLY, USE COMPOSED COLUMN VALUE TO UPDATE COLUMN
         if column_value:
             try:
-                item_obj.change_column_value(column_value=column_value)
+                self.scheduler.call(item_obj.change_column_value, column_value=column_value, description=f"change column '{col_title}' of item '{item_name}'")
+                self._update_indexes(board_name, item_obj.id, {col_title: new_value}, item_name=item_name)
                 return new_value
             except Exception as e:
-                print(f"LOG ERROR: Changing column value for item {item_name}, column {col_title} failed: DETAILS: {e}")
-                print(f"LOG INFO: Will pause and retry for item {item_name}")
-                complexityError = True
-                counter = 1
-                while complexityError and counter < 30:
-                    print(f"\nTrying Mpnday.com API. Try #{counter} from (change_value_of_column -  changing value of column)")
-                    time.sleep(2)
-                    try:
-                        item_obj.change_column_value(column_value=column_value)
-                        complexityError = False
-                        print(f"LOG SUCCESS: Value of column changed to {column_value}")
-                        return new_value
-                    except Exception as e:
-                        print(f"LOG ERROR: Changing column value for item {item_name}, column {col_title} failed on {counter} try: DETAILS: {e}")
-                        counter = counter + 1
+                logger.error("Changing column value for item %s, column %s failed: DETAILS: %s", item_name, col_title, e)
+                self._forget_item(board_name, item_name)
 
         return None
 
@@ -686,65 +4233,156 @@ class MondayWrapper:
         # GET THE ITEM OBJECT FOR THE ITEM PARAMETERS SUPPLIED
         item_obj = self.get_specific_item_by_name(item_name=item_name, board_name=board_name)
 
-        # CHECK IN CACHE FOR BOARD OBJECT
-        print(f"LOG INFO: Checking in board object cache for board name '{board_name}'.")
-        board = self.board_objects_cache.get(board_name)
+        if item_obj is None:
+            logger.warning("No item found with name %s. Cannot move item to group %s", item_name, group_name)
+            return None
 
-        if board is None:
-            try:
-                board = CLIENT.get_board(name=board_name)
-                print(f"LOG INFO: Board object for board with name {board.name} exists!")
-                self.board_objects_cache[board_name] = board
-            except Exception as e:
-                print(f"LOG WARN: No board found with name: {board_name}. ERROR DETAILS: {e}")
-                print(f"LOG WARN: Cannot move item to group {group_name}")
-                return
-        else:
-            print(f"LOG INFO: Found board object for board in cache. Board name {board.name} exists!")
+        # GET BOARD OBJECT FROM CACHE, OR QUERY MONDAY API FOR IT
+        try:
+            board = self._get_board_object(board_name)
+        except Exception as e:
+            logger.warning("No board found with name: %s. ERROR DETAILS: %s", board_name, e)
+            logger.warning("Cannot move item to group %s", group_name)
+            return None
 
-        group_object = None
         try:
-            group_object = board.get_group(title=group_name)
+            group_id = self.get_group_id(group_name, board_name=board_name)
         except Exception as e:
-            print(f"LOG ERROR: Could not find group with name {group_name}: ERROR DETAILS: {e}")
-            complexityError = True
-            counter = 1
-            while complexityError and counter < 30:
-                print(f"\nTrying Mpnday.com API. Try #{counter} (from move_item_to_group - get group object)")
-                time.sleep(2)
-                print(f"LOG INFO: Trying to query API again.")
-                try:
-                    group_object = board.get_group(title=group_name)
-                    complexityError = False
-                except Exception as e:
-                    print(f"LOG ERROR: ERROR DETAILS: {e}.")
-                    counter = counter + 1
-
-            if complexityError:
-                print(f"LOG ERROR: Could not find group with name {group_name}: ")
-                return None
+            logger.error("Could not get groups of board %s: ERROR DETAILS: %s", board_name, e)
+            return None
+        if group_id is None:
+            logger.error("Could not find group with name %s in board %s", group_name, board_name)
+            return None
 
-        group_id = group_object.id
-        moved_item = None
         try:
-            moved_item = item_obj.move_to_group(group_id=group_id)
+            moved_item = self.scheduler.call(item_obj.move_to_group, group_id=group_id, description=f"move item '{item_name}' to group '{group_name}'")
         except Exception as e:
-            print(f"LOG ERROR: Moving item to group failed! Item Name: {item_name}. ERROR DETAILS: {e}. WIll pause and query API again")
-            complexityError = True
-            counter = 1
-            while complexityError and counter < 30:
-                print(f"\nTrying Mpnday.com API. Try #{counter} (from move_item_to_group -  move item to group)")
-                time.sleep(2)
-                try:
-                    moved_item = item_obj.move_to_group(group_id=group_id)
-                    complexityError = False
-                except Exception as e:
-                    print(f"LOG ERROR: Moving item to group failed on {counter} try. Item Name: {item_name}. ERROR DETAILS: {e}. ")
-                    counter = counter + 1
-
-            if complexityError:
-                print(f"LOG ERROR: Could not move item {item_name} to group {group_name} after multiple tries")
-                return None
+            logger.error("Could not move item %s to group %s. ERROR DETAILS: %s", item_name, group_name, e)
+            self._forget_item(board_name, item_name)
+            return None
 
-        print(f"LOG SUCCESS: Item {item_name} successfully moved to group {group_name}")
+        self._apply_item_move(board_name, item_obj.id, item_name, group_id)
+        logger.info("Item %s successfully moved to group %s", item_name, group_name)
         return moved_item
+
+    def _apply_item_move(self, board_name, item_id, item_name, group_id):
+        """
+        Updates the board snapshot and drops the cached records of an item moved to another group.
+        This method is to be used only internally by the class.
+        :param board_name: Board name: str
+        :param item_id: Id of the item: int
+        :param item_name: Item name: str
+        :param group_id: Id of the group the item was moved to: str
+        """
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is not None:
+            record = snapshot.remove_item(item_id)
+            if record is not None:
+                snapshot.add_item(ItemRecord(record.id, record.name, record.board_id, group_id))
+        # THE CACHED RECORDS OF THE ITEM HOLD ITS FORMER GROUP
+        board = self._get_cached_board_object(board_name)
+        self._invalidate_cached_item(item_name, board_id=board.id if board is not None else None)
+
+    def get_group_ids(self, board_name=None, refresh=False):
+        """
+        Returns the group index of a board: group title -> group id. It is read with a single request listing only
+        the ids and titles of the groups, cached, and read again when refresh is True or the cache entry expired.
+        When several groups share a title, the first one is indexed.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param board_name: str
+        :param refresh: Read the groups again even if the index is cached: bool
+        :return: Group title -> group id: dict
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        group_ids = None if refresh else self.group_ids_cache.get(board_name)
+        self.metrics.record_cache("group", group_ids is not None)
+        if group_ids is None:
+            board = self._get_board_object(board_name)
+            query = f"query {{ complexity {{ query after reset_in_x_seconds }} boards (ids: [{int(board.id)}]) {{ groups {{ id title }} }} }}"
+
+            def fetch_group_ids():
+                data = self.scheduler.call(self.connection.execute_graphql, query, raise_errors=True, description=f"get groups of board '{board_name}'", operation="groups")["data"]
+                self.scheduler.report_complexity(data)
+                fetched_group_ids = {}
+                for group in data["boards"][0]["groups"]:
+                    fetched_group_ids.setdefault(group["title"], group["id"])
+                # CACHED BEFORE THE SINGLE-FLIGHT KEY IS RELEASED, SO LATER LOOKUPS FIND IT
+                self.group_ids_cache[board_name] = fetched_group_ids
+                return fetched_group_ids
+
+            group_ids = self.single_flight.do(("groups", board_name, refresh), fetch_group_ids)
+        return group_ids
+
+    def get_group_id(self, group_name, board_name=None):
+        """
+        Gets the id of a group from its title, using the group index of the board (see get_group_ids).
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param group_name: Title of the group: str
+        :param board_name: str
+        :return: Id of the group, or None if the board has no group with that title: str
+        """
+        group_ids = self.get_group_ids(board_name)
+        if group_name not in group_ids:
+            # THE GROUP MAY HAVE BEEN CREATED SINCE THE INDEX WAS BUILT
+            group_ids = self.get_group_ids(board_name, refresh=True)
+        return group_ids.get(group_name)
+
+    def move_items_to_groups(self, moves, board_name=None, page_size=500, max_operations=50):
+        """
+        Moves many items to other groups. The current groups of the items are read with one bulk read of the board
+        (or its snapshot) and the group titles are resolved with the group index of the board. Items already in their
+        target group are skipped and the other moves are sent in batched requests.
+        When several items share a name, the first one in board order is moved.
+        If no board name is passed to this method, the name passed in the __init__ method is used.
+        :param moves: Item name -> title of the group to move the item to: dict
+        :param board_name: str
+        :param page_size: Number of items read per API request: int
+        :param max_operations: Maximum number of moves sent in a single request: int
+        :return: Report with the counts of moves, moved, unchanged, missing (items not found) and failed items
+        (including moves to groups not found), and the failed results: dict
+        """
+        if not board_name:
+            board_name = self.board_name
+
+        # CURRENT (ITEM ID, GROUP ID) OF THE ITEMS TO MOVE
+        current_items = {}
+        snapshot = self.board_snapshots.get(board_name)
+        if snapshot is not None:
+            snapshot.ensure_fresh()
+            existing_items = ((record.name, record.id, record.group_id) for record in snapshot.get_all_records())
+        else:
+            existing_items = ((item["name"], item["id"], item["group_id"]) for item in self.iter_board_items(board_name, page_size=page_size))
+        for item_name, item_id, group_id in existing_items:
+            if item_name in moves:
+                current_items.setdefault(item_name, (item_id, group_id))
+
+        target_group_ids = {group_name: self.get_group_id(group_name, board_name=board_name) for group_name in set(moves.values())}
+        for group_name, group_id in target_group_ids.items():
+            if group_id is None:
+                logger.error("Could not find group with name %s in board %s. Items are not moved to it", group_name, board_name)
+
+        report = {"moves": len(moves), "moved": 0, "unchanged": 0, "missing": 0, "failed": 0}
+        writer = self.batch_writer(board_name=board_name, max_operations=max_operations)
+        for item_name, group_name in moves.items():
+            if item_name not in current_items:
+                logger.warning("No item found with name %s in board %s. Cannot move item to group %s", item_name, board_name, group_name)
+                report["missing"] += 1
+                continue
+            item_id, current_group_id = current_items[item_name]
+            if target_group_ids[group_name] is None:
+                report["failed"] += 1
+            elif current_group_id == target_group_ids[group_name]:
+                report["unchanged"] += 1
+            else:
+                writer.move_item(item_name, group_name, board_name=board_name, item_id=item_id)
+
+        results = writer.execute()
+        failures = [result for result in results if not result.success]
+        report["moved"] = len(results) - len(failures)
+        report["failed"] += len(failures)
+        report["failures"] = failures
+        logger.info("Moved %s items to other groups in board '%s': %s already in their group, %s not found, %s failed",
+                    report["moved"], board_name, report["unchanged"], report["missing"], report["failed"])
+        return report
@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import MondayWrapper
+from FakeMondayServer import FakeMonday
+
+# THE FAKE API NEVER THROTTLES THE TESTS
+UNLIMITED_COMPLEXITY_BUDGET = 10 ** 13
+
+
+@pytest.fixture
+def fake():
+    fake = FakeMonday(me_email=MondayWrapper.USER_NAME, complexity_budget=UNLIMITED_COMPLEXITY_BUDGET)
+    fake.install()
+    yield fake
+    fake.uninstall()
+
+
+@pytest.fixture
+def new_wrapper(fake):
+    """
+    :return: Function building a MondayWrapper with empty caches for a board, talking to the fake API
+    """
+    connections = []
+
+    def build(board_name, **kwargs):
+        scheduler = MondayWrapper.RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, backoff_base=0.01)
+        connection = MondayWrapper.MondayConnection(scheduler=scheduler)
+        connections.append(connection)
+        return MondayWrapper.MondayWrapper(board_name, scheduler=scheduler, connection=connection, **kwargs)
+
+    yield build
+    for connection in connections:
+        connection.close()
+
+
+def item_ids_by_name(fake, board_id):
+    """
+    :return: Item name -> list of ids of the active items of a board of the fake API: dict
+    """
+    ids_by_name = {}
+    for item_id in fake.boards[board_id]["item_ids"]:
+        item = fake.items[item_id]
+        if item["state"] == "active":
+            ids_by_name.setdefault(item["name"], []).append(item_id)
+    return ids_by_name
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from moncli.api_v2 import MondayApiError
+
+from AsyncMondayWrapper import AsyncMondayWrapper, AsyncSingleFlight
+from MondayWrapper import RequestScheduler
+
+from conftest import UNLIMITED_COMPLEXITY_BUDGET, item_ids_by_name
+
+
+@pytest.fixture
+def endpoint(fake):
+    url = fake.serve()
+    yield url
+    fake.shutdown()
+
+
+@pytest.fixture
+def board(fake):
+    board = fake.add_board("Async", columns=[("Status", "color"), ("Text", "text")], groups=["Inbox", "Done"])
+    for index in range(10):
+        fake.add_item(board, f"item {index}")
+    return board
+
+
+def run(board_name, endpoint, coroutine_function, max_retries=8):
+    async def main():
+        scheduler = RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, max_retries=max_retries, backoff_base=0.01)
+        async with AsyncMondayWrapper(board_name, endpoint=endpoint, max_concurrency=4, scheduler=scheduler) as mon:
+            return await coroutine_function(mon)
+    return asyncio.run(main())
+
+
+def test_concurrent_writes_are_all_applied(fake, board, endpoint):
+    async def write(mon):
+        return await asyncio.gather(*[mon.change_value_of_column(f"item {index}", "Text", f"text {index}") for index in range(10)])
+
+    assert run("Async", endpoint, write) == [f"text {index}" for index in range(10)]
+    ids = item_ids_by_name(fake, board)
+    assert [fake.get_item_values(ids[f"item {index}"][0])["Text"] for index in range(10)] == [f"text {index}" for index in range(10)]
+
+
+def test_reads_items_columns_and_statuses(fake, board, endpoint):
+    ids = item_ids_by_name(fake, board)
+
+    async def read(mon):
+        await mon.update_item_columns("item 1", {"Status": "Done", "Text": "x"})
+        return (await mon.get_items_in_single_board(page_size=3), await mon.get_status_of_item("item 1"),
+                await mon.get_value_of_column_for_item("item 1", "Text"), await mon.get_item_id_by_name("item 2"),
+                await mon.check_item_exists("missing"))
+
+    items, status, text, item_id, exists = run("Async", endpoint, read)
+
+    assert sorted(int(item["id"]) for item in items) == sorted(item_id for item_ids in ids.values() for item_id in item_ids)
+    assert (status, text, item_id, exists) == ("Done", "x", ids["item 2"][0], False)
+
+
+def test_new_items_and_moves(fake, board, endpoint):
+    async def write(mon):
+        new_id = await mon.add_new_item_to_board("new")
+        existing_id = await mon.add_new_item_to_board("item 0")
+        moved_id = await mon.move_item_to_group("item 0", "Done")
+        return new_id, existing_id, moved_id
+
+    new_id, existing_id, moved_id = run("Async", endpoint, write)
+
+    ids = item_ids_by_name(fake, board)
+    assert new_id == ids["new"][0]
+    assert existing_id == moved_id == ids["item 0"][0]
+    assert fake.items[moved_id]["group_id"] == fake.boards[board]["groups"][1]["id"]
+    assert len(ids) == 11
+
+
+def test_server_errors_are_retried(fake, board, endpoint):
+    fake.inject_server_errors(2, status_code=502)
+
+    assert run("Async", endpoint, lambda mon: mon.get_board_id()) == board
+
+
+def test_gateway_error_pages_are_retried(fake, board, endpoint):
+    fake.inject_gateway_errors(2, status_code=504)
+
+    assert run("Async", endpoint, lambda mon: mon.get_board_id()) == board
+
+
+def test_creation_whose_response_is_lost_is_not_sent_again(fake, board, endpoint):
+    async def create(mon):
+        await mon.get_board_id()
+
+        async def not_found(item_name, board_name=None):
+            # THE RESPONSE OF THE NEXT REQUEST, THE CREATION, IS LOST AFTER THE ITEM WAS CREATED
+            fake.inject_lost_responses(1)
+            return None
+
+        mon.get_item_id_by_name = not_found
+        fake.stats.reset()
+        return await mon.add_new_item_to_board("new")
+
+    assert run("Async", endpoint, create) is None
+    assert fake.stats.operations == {"create_item": 1}
+    assert len(item_ids_by_name(fake, board)["new"]) == 1
+
+
+def test_request_errors_fail_fast(fake, board, endpoint):
+    async def bad_query(mon):
+        await mon.execute("query { no_such_field { id } }")
+
+    fake.stats.reset()
+    with pytest.raises(MondayApiError):
+        run("Async", endpoint, bad_query)
+    assert fake.stats.round_trips == 1
+
+
+def test_async_single_flight_shares_one_task_and_survives_cancelled_callers():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def read():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"id": 1}
+
+    async def main():
+        cancelled = asyncio.ensure_future(single_flight.do("board", read))
+        await asyncio.sleep(0)
+        results = asyncio.gather(*[single_flight.do("board", read) for _ in range(4)])
+        cancelled.cancel()
+        return await results
+
+    assert asyncio.run(main()) == [{"id": 1}] * 4
+    assert len(calls) == 1
+    assert single_flight.stats() == {"in_flight": 0, "calls": 1, "shared": 4}
+
+
+def test_concurrent_lookups_of_one_item_share_requests(fake, board, endpoint):
+    async def look_up(mon):
+        fake.stats.reset()
+        return await asyncio.gather(*[mon.get_item_id_by_name("item 3") for _ in range(8)])
+
+    assert run("Async", endpoint, look_up) == [item_ids_by_name(fake, board)["item 3"][0]] * 8
+    assert fake.stats.operations == {"boards": 1, "items_page_by_column_values": 1}
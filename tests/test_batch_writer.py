@@ -0,0 +1,145 @@
+from conftest import item_ids_by_name
+
+
+def seed_board(fake):
+    board = fake.add_board("Batch", columns=[("Status", "color"), ("Text", "text")], groups=["Inbox", "Done"])
+    for name in ("a", "b", "c"):
+        fake.add_item(board, name)
+    return board
+
+
+def test_results_are_mapped_back_to_their_operations(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Batch")
+    writer = wrapper.batch_writer(max_operations=2)
+
+    writer.change_columns("a", {"Status": "Done", "Text": "x"})
+    writer.change_columns("b", {"Status": "Not a label"})
+    writer.move_item("c", "Done")
+    writer.change_columns("missing", {"Text": "lost"})
+    writer.add_item("new", group_name="Done", column_values={"Text": "created"})
+    results = writer.execute()
+
+    assert [result.success for result in results] == [True, False, True, False, True]
+    assert "label" in results[1].error
+    assert "missing" in results[3].error
+    ids = item_ids_by_name(fake, board)
+    done = fake.boards[board]["groups"][1]["id"]
+    assert fake.get_item_values(ids["a"][0])["Status"] == "Done"
+    assert fake.get_item_values(ids["b"][0])["Status"] == ""
+    assert fake.items[ids["c"][0]]["group_id"] == done
+    assert fake.items[ids["new"][0]]["group_id"] == done
+    assert fake.get_item_values(ids["new"][0])["Text"] == "created"
+    assert results[4].data["id"] == str(ids["new"][0])
+    assert writer.operations == []
+
+
+def test_operations_are_sent_in_chunks(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Batch")
+    writer = wrapper.batch_writer(max_operations=2)
+    for index in range(5):
+        writer.add_item(f"new {index}")
+    fake.stats.reset()
+
+    results = writer.execute()
+
+    assert all(result.success for result in results)
+    assert fake.stats.operations["create_item"] == 5
+    assert fake.stats.round_trips == 3
+    assert sorted(item_ids_by_name(fake, board)) == ["a", "b", "c", "new 0", "new 1", "new 2", "new 3", "new 4"]
+    assert wrapper.get_item_id_by_name("new 3") == str(item_ids_by_name(fake, board)["new 3"][0])
+
+
+def test_chunk_rejected_for_complexity_budget_is_sent_again(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Batch")
+    writer = wrapper.batch_writer()
+    writer.add_item("new")
+    writer.change_columns("a", {"Text": "x"})
+    fake.inject_complexity_errors(1, reset_in=0)
+
+    results = writer.execute()
+
+    assert all(result.success for result in results)
+    ids = item_ids_by_name(fake, board)
+    assert len(ids["new"]) == 1
+    assert fake.get_item_values(ids["a"][0])["Text"] == "x"
+
+
+def test_chunk_of_creations_whose_response_is_lost_is_not_sent_again(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Batch")
+    writer = wrapper.batch_writer()
+    writer.add_item("new")
+    writer.change_columns("a", {"Text": "x"})
+    wrapper.get_item_id_by_name("a")
+    fake.stats.reset()
+    fake.inject_lost_responses(1)
+
+    results = writer.execute()
+
+    # THE API APPLIED THE REQUEST: REPLAYING IT WOULD CREATE THE ITEM TWICE
+    assert fake.stats.round_trips == 1
+    assert len(item_ids_by_name(fake, board)["new"]) == 1
+    assert [result.success for result in results] == [False, False]
+    assert all("may have been applied" in result.error for result in results)
+    # THE NEXT BULK CREATION FINDS THE ITEM INSTEAD OF CREATING IT AGAIN
+    assert wrapper.add_items(["new"]) == {"new": str(item_ids_by_name(fake, board)["new"][0])}
+    assert len(item_ids_by_name(fake, board)["new"]) == 1
+
+
+def test_chunk_of_creations_is_not_sent_again_after_a_server_error(fake, new_wrapper):
+    board = seed_board(fake)
+    writer = new_wrapper("Batch").batch_writer()
+    writer.add_item("new")
+    fake.inject_server_errors(1, status_code=502)
+
+    assert writer.execute()[0].success is False
+    assert "new" not in item_ids_by_name(fake, board)
+
+
+def test_chunk_of_idempotent_writes_is_sent_again_after_a_lost_response(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Batch")
+    writer = wrapper.batch_writer()
+    writer.change_columns("a", {"Text": "x"})
+    writer.move_item("b", "Done")
+    fake.inject_lost_responses(1)
+
+    results = writer.execute()
+
+    assert all(result.success for result in results)
+    ids = item_ids_by_name(fake, board)
+    assert fake.get_item_values(ids["a"][0])["Text"] == "x"
+    assert fake.items[ids["b"][0]]["group_id"] == fake.boards[board]["groups"][1]["id"]
+
+
+def test_single_item_creation_is_not_sent_again_after_a_lost_response(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Batch")
+    # THE SNAPSHOT ANSWERS THE EXISTENCE CHECK: THE CREATION IS THE ONLY REQUEST
+    wrapper.enable_board_snapshot()
+    fake.stats.reset()
+    fake.inject_lost_responses(1)
+
+    wrapper.add_new_item_to_board("new")
+
+    assert fake.stats.operations == {"create_item": 1}
+    assert len(item_ids_by_name(fake, board)["new"]) == 1
+
+
+def test_reported_complexity_refines_the_estimate_of_single_kind_chunks_only(fake, new_wrapper):
+    seed_board(fake)
+    writer = new_wrapper("Batch").batch_writer()
+    writer.estimated_complexity.update({"create_item": 1000, "change_multiple_column_values": 2000})
+
+    writer.add_item("new 1")
+    writer.change_columns("a", {"Text": "x"})
+    writer.execute()
+    assert (writer.estimated_complexity["create_item"], writer.estimated_complexity["change_multiple_column_values"]) == (1000, 2000)
+
+    writer.add_item("new 2")
+    writer.add_item("new 3")
+    writer.execute()
+    assert (writer.estimated_complexity["create_item"], writer.estimated_complexity["change_multiple_column_values"]) == (30000, 2000)
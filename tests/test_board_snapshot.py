@@ -0,0 +1,151 @@
+import threading
+
+from conftest import item_ids_by_name
+
+
+def test_snapshot_answers_name_lookups_without_api_requests(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")])
+    for name in ("a", "b", "twin", "twin"):
+        fake.add_item(board, name)
+    wrapper = new_wrapper("Snap")
+    snapshot = wrapper.enable_board_snapshot(page_size=2)
+    ids = item_ids_by_name(fake, board)
+    fake.stats.reset()
+
+    assert wrapper.get_item_id_by_name("b") == str(ids["b"][0])
+    assert wrapper.check_item_exists("a") is True
+    assert wrapper.check_item_exists("missing") is False
+    assert sorted(int(item.id) for item in snapshot.get_items_by_name("twin")) == ids["twin"]
+    assert snapshot.get_item_by_id(ids["a"][0]).name == "a"
+    assert fake.stats.round_trips == 0
+
+
+def test_snapshot_is_reloaded_on_refresh_and_when_stale(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")])
+    fake.add_item(board, "a")
+    wrapper = new_wrapper("Snap")
+    snapshot = wrapper.enable_board_snapshot(ttl=3600)
+    fake.add_item(board, "b")
+
+    assert wrapper.check_item_exists("b") is False
+    assert wrapper.refresh_board_snapshot() == 2
+    assert wrapper.check_item_exists("b") is True
+
+    fake.add_item(board, "c")
+    snapshot.ttl = 0
+    assert snapshot.is_stale() is True
+    assert wrapper.check_item_exists("c") is True
+
+
+def test_items_added_through_the_wrapper_are_indexed(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")])
+    fake.add_item(board, "a")
+    wrapper = new_wrapper("Snap")
+    snapshot = wrapper.enable_board_snapshot()
+
+    item_id = wrapper.add_new_item_to_board("new")
+
+    assert item_id == str(item_ids_by_name(fake, board)["new"][0])
+    assert [item.id for item in snapshot.get_items_by_name("new")] == [item_id]
+    # AN EXISTING ITEM IS NOT CREATED AGAIN
+    assert wrapper.add_new_item_to_board("a") == str(item_ids_by_name(fake, board)["a"][0])
+    assert len(item_ids_by_name(fake, board)) == 2
+
+
+def test_snapshot_sync_applies_changes_made_by_another_process(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")], groups=["G1", "G2"])
+    for name in ("keep", "rename me", "archive me", "move me"):
+        fake.add_item(board, name)
+    wrapper = new_wrapper("Snap")
+    snapshot = wrapper.enable_board_snapshot(incremental=True)
+    ids = item_ids_by_name(fake, board)
+
+    other = new_wrapper("Snap")
+    other.add_new_item_to_board("new")
+    other.update_item_columns("rename me", {"Name": "renamed"})
+    other.connection.execute_graphql(f"mutation {{ archive_item (item_id: {ids['archive me'][0]}) {{ id }} }}")
+    other.move_item_to_group("move me", "G2")
+
+    changes = wrapper.sync_board_snapshot()
+
+    # ITEMS CREATED JUST BEFORE THE SNAPSHOT WAS LOADED ARE WITHIN THE SYNC OVERLAP AND MAY BE FETCHED AGAIN
+    assert {"move me", "new", "renamed"} <= {record.name for record in changes["changed"]}
+    assert [record.name for record in changes["deleted"]] == ["archive me"]
+    assert [record.name for record in changes["renamed"]] == ["rename me"]
+    assert sorted(record.name for record in snapshot.get_all_records()) == ["keep", "move me", "new", "renamed"]
+    # LOOKUPS OF THE WRAPPER ARE ANSWERED FROM THE SYNCED SNAPSHOT
+    assert wrapper.get_item_id_by_name("new") == str(item_ids_by_name(fake, board)["new"][0])
+    assert wrapper.check_item_exists("archive me") is False
+    assert wrapper.check_item_exists("rename me") is False
+
+
+def test_snapshot_sync_applies_each_activity_log_once(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")])
+    fake.add_item(board, "a")
+    snapshot = new_wrapper("Snap").enable_board_snapshot(incremental=True)
+    snapshot.sync()
+    reported = []
+    snapshot.scheduler.report_budget = lambda remaining=None, reset_in=None: reported.append(remaining)
+
+    changes = snapshot.sync()
+
+    assert changes == {"changed": [], "deleted": [], "renamed": []}
+    assert [record.name for record in snapshot.get_records_by_name("a")] == ["a"]
+    # THE ACTIVITY LOGS REQUEST REPORTS THE REMAINING BUDGET TO THE SCHEDULER
+    assert reported == [fake.budget_remaining]
+
+
+def test_stale_incremental_snapshot_is_synced_instead_of_reloaded(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")])
+    for index in range(20):
+        fake.add_item(board, f"item {index}")
+    # THE ITEMS WERE CREATED LONG BEFORE THE SNAPSHOT, OUTSIDE OF THE SYNC OVERLAP
+    fake.boards[board]["activity_logs"].clear()
+    wrapper = new_wrapper("Snap")
+    snapshot = wrapper.enable_board_snapshot(incremental=True, page_size=5)
+    first_record = snapshot.get_records_by_name("item 0")[0]
+    new_wrapper("Snap").add_new_item_to_board("late")
+    snapshot.ttl = 0
+
+    assert wrapper.check_item_exists("late") is True
+    assert len(snapshot.get_all_records()) == 21
+    # UNCHANGED ITEMS ARE KEPT AS THEY ARE: THE BOARD WAS NOT LOADED AGAIN
+    assert snapshot.get_records_by_name("item 0")[0] is first_record
+
+
+def test_refresh_swaps_the_indexes_under_the_snapshot_lock(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")])
+    fake.add_item(board, "a")
+    snapshot = new_wrapper("Snap").enable_board_snapshot()
+    fake.add_item(board, "b")
+
+    with snapshot.lock:
+        refresh = threading.Thread(target=snapshot.refresh)
+        refresh.start()
+        refresh.join(0.2)
+        # THE ITEMS ARE LOADED, BUT THE INDEXES ARE NOT REPLACED WHILE A LOOKUP HOLDS THE LOCK
+        assert refresh.is_alive()
+        assert sorted(snapshot.items_by_name) == ["a"]
+    refresh.join(5)
+
+    assert sorted(snapshot.items_by_name) == ["a", "b"]
+    assert sorted(record.name for record in snapshot.get_all_records()) == ["a", "b"]
+
+
+def test_snapshot_is_loaded_with_cursor_pages(fake, new_wrapper):
+    board = fake.add_board("Snap", columns=[("Status", "color")], groups=["G1", "G2"])
+    first, second = (group["id"] for group in fake.boards[board]["groups"])
+    for index in range(7):
+        fake.add_item(board, f"item {index}", group_id=first if index % 2 else second)
+    archived = fake.add_item(board, "archived")
+    fake.items[archived]["state"] = "archived"
+    wrapper = new_wrapper("Snap")
+    wrapper.get_board_id()
+    fake.stats.reset()
+
+    snapshot = wrapper.enable_board_snapshot(page_size=3)
+
+    assert fake.stats.operations == {"complexity": 3, "boards": 1, "next_items_page": 2}
+    assert sorted(record.name for record in snapshot.get_all_records()) == [f"item {index}" for index in range(7)]
+    assert snapshot.get_records_by_name("item 3")[0].group_id == first
+    assert snapshot.get_records_by_name("item 4")[0].group_id == second
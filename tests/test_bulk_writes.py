@@ -0,0 +1,77 @@
+from conftest import item_ids_by_name
+
+
+def group_ids_of_items(fake, board):
+    return {fake.items[item_id]["name"]: fake.items[item_id]["group_id"] for item_id in fake.boards[board]["item_ids"]}
+
+
+def test_add_items_creates_missing_items_with_values(fake, new_wrapper):
+    board = fake.add_board("Bulk", columns=[("Status", "color"), ("Text", "text")], groups=["Inbox", "Later"])
+    existing_id = fake.add_item(board, "existing")
+    wrapper = new_wrapper("Bulk")
+
+    ids = wrapper.add_items([{"Name": "existing", "Text": "ignored"}, {"Name": "new 1", "Text": "one"}, {"Name": "new 2", "Status": "Stuck"}],
+                            group_name="Later", column_values={"Status": "Done"})
+
+    fake_ids = item_ids_by_name(fake, board)
+    assert ids == {"existing": str(existing_id), "new 1": str(fake_ids["new 1"][0]), "new 2": str(fake_ids["new 2"][0])}
+    assert len(fake_ids["existing"]) == 1
+    assert fake.get_item_values(fake_ids["new 1"][0]) == {"Name": "new 1", "Status": "Done", "Text": "one"}
+    assert fake.get_item_values(fake_ids["new 2"][0])["Status"] == "Stuck"
+    assert group_ids_of_items(fake, board)["new 1"] == wrapper.get_group_id("Later")
+    # THE NEW ITEMS ARE FOUND BY NAME, AND A SECOND CALL CREATES NOTHING
+    assert wrapper.get_item_id_by_name("new 2") == str(fake_ids["new 2"][0])
+    assert wrapper.add_items(["new 1", "new 2"]) == {"new 1": ids["new 1"], "new 2": ids["new 2"]}
+    assert len(item_ids_by_name(fake, board)) == 3
+
+
+def test_add_items_batches_creates_and_reports_failures(fake, new_wrapper):
+    board = fake.add_board("Bulk", columns=[("Status", "color")])
+    wrapper = new_wrapper("Bulk")
+    wrapper.get_column_codecs()
+    fake.stats.reset()
+
+    ids = wrapper.add_items([f"item {index}" for index in range(5)] + ["item 0", {"Name": "bad", "Status": "Not a label"}], max_operations=3)
+
+    # THE REPEATED NAME IS CREATED ONCE AND THE FAILED CREATION HAS NO ID
+    assert list(ids) == [f"item {index}" for index in range(5)]
+    assert fake.stats.operations["create_item"] == 6
+    # ONE READ OF THE BOARD AND TWO BATCHES OF CREATIONS
+    assert fake.stats.round_trips == 3
+
+
+def test_move_items_to_groups_reports_each_outcome(fake, new_wrapper):
+    board = fake.add_board("Bulk", columns=[("Status", "color")], groups=["Inbox", "Doing", "Done"])
+    for name in ("a", "b", "c"):
+        fake.add_item(board, name)
+    wrapper = new_wrapper("Bulk")
+    doing, done = wrapper.get_group_id("Doing"), wrapper.get_group_id("Done")
+
+    report = wrapper.move_items_to_groups({"a": "Doing", "b": "Inbox", "c": "No such group", "missing": "Done"})
+
+    assert (report["moves"], report["moved"], report["unchanged"], report["missing"], report["failed"]) == (4, 1, 1, 1, 1)
+    assert group_ids_of_items(fake, board)["a"] == doing
+
+    report = wrapper.move_items_to_groups({"a": "Done", "b": "Done"})
+    assert report["moved"] == 2
+    assert group_ids_of_items(fake, board) == {"a": done, "b": done, "c": group_ids_of_items(fake, board)["c"]}
+
+
+def test_group_index_is_read_once_and_refreshed_for_new_titles(fake, new_wrapper):
+    board = fake.add_board("Bulk", columns=[("Status", "color")], groups=["Inbox", "Done"])
+    fake.add_item(board, "a")
+    wrapper = new_wrapper("Bulk")
+    snapshot = wrapper.enable_board_snapshot()
+    group_ids = {group["title"]: group["id"] for group in fake.boards[board]["groups"]}
+    fake.stats.reset()
+
+    assert wrapper.get_group_ids() == group_ids
+    assert wrapper.get_group_id("Done") == group_ids["Done"]
+    assert fake.stats.round_trips == 1
+
+    later = fake.add_group(board, "Later")
+    assert wrapper.get_group_id("Later") == later
+    assert wrapper.get_group_id("Missing") is None
+
+    wrapper.move_item_to_group("a", "Later")
+    assert snapshot.get_records_by_name("a")[0].group_id == later
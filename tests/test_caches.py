@@ -0,0 +1,169 @@
+import threading
+import time
+
+import pytest
+
+from MondayWrapper import LRUCache, SingleFlight
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache("test", max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache("test", max_size=10, ttl=0.05)
+    cache["a"] = 1
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_cache_length_does_not_count_expired_entries():
+    cache = LRUCache("test", max_size=10, ttl=0.05)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert len(cache) == 2
+    time.sleep(0.1)
+    cache["c"] = 3
+
+    assert len(cache) == 1
+    assert cache.stats()["expirations"] == 2
+
+
+def test_lru_cache_invalidate_and_pop():
+    cache = LRUCache("test")
+    for board_id, name in [(1, "x"), (1, "y"), (2, "x")]:
+        cache[(board_id, name)] = name
+
+    assert cache.invalidate(lambda key: key[0] == 1) == 2
+    assert (1, "x") not in cache and (1, "y") not in cache
+    assert cache[(2, "x")] == "x"
+    assert cache.pop((2, "x")) == "x"
+    assert cache.pop((2, "x"), "missing") == "missing"
+    with pytest.raises(KeyError):
+        cache[(2, "x")]
+
+
+def test_lru_cache_setdefault_keeps_first_value():
+    cache = LRUCache("test")
+    assert cache.setdefault("a", 1) == 1
+    assert cache.setdefault("a", 2) == 1
+    assert cache["a"] == 1
+
+
+def test_item_cache_is_bounded_and_invalidated_on_moves(fake, new_wrapper):
+    board = fake.add_board("Cached", columns=[("Status", "color")], groups=["G1", "G2"])
+    for name in ("a", "b", "c"):
+        fake.add_item(board, name)
+    wrapper = new_wrapper("Cached", cache_size=2)
+
+    for name in ("a", "b", "c"):
+        wrapper.get_item_id_by_name(name)
+    assert wrapper.cache_stats()["item"]["evictions"] == 1
+
+    wrapper.move_item_to_group("c", "G2")
+    assert (int(wrapper.get_board_id()), "c") not in wrapper.item_objects_cache
+
+    fake.stats.reset()
+    wrapper.invalidate_caches()
+    wrapper.get_item_id_by_name("b")
+    # THE BOARD OBJECT AND THE ITEM WERE READ AGAIN
+    assert fake.stats.round_trips >= 2
+
+
+def test_single_flight_shares_one_call_between_threads():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def read():
+        calls.append(1)
+        release.wait(5)
+        return {"id": 1}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(single_flight.do("board", read))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    # WAIT UNTIL THE OTHER THREADS ARE WAITING FOR THE IN-FLIGHT CALL
+    deadline = time.time() + 5
+    while single_flight.stats()["shared"] < 4 and time.time() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"id": 1}] * 5
+    assert results[0] is results[1]
+    assert single_flight.stats() == {"in_flight": 0, "calls": 1, "shared": 4}
+
+
+def test_single_flight_shares_errors_and_forgets_keys():
+    single_flight = SingleFlight()
+
+    def fail():
+        raise ValueError("no board")
+
+    with pytest.raises(ValueError):
+        single_flight.do("board", fail)
+    # THE KEY IS RELEASED: THE NEXT CALL IS MADE AGAIN
+    assert single_flight.do("board", lambda: 42) == 42
+    assert single_flight.stats()["calls"] == 2
+
+
+def test_concurrent_lookups_of_one_item_send_one_request_per_read(fake, new_wrapper):
+    board = fake.add_board("Shared", columns=[("Status", "color")])
+    fake.add_item(board, "a")
+    # EACH REQUEST TAKES LONG ENOUGH FOR ALL THE THREADS TO ASK FOR THE SAME READ WHILE IT IS IN FLIGHT
+    fake.latency = 0.05
+    wrapper = new_wrapper("Shared")
+    barrier = threading.Barrier(16)
+    results = []
+
+    def look_up():
+        barrier.wait()
+        results.append(wrapper.get_item_id_by_name("a"))
+
+    threads = [threading.Thread(target=look_up) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == 1 and len(results) == 16
+    # THE SAME REQUESTS AS FOR A SINGLE LOOKUP
+    assert fake.stats.operations == {"me": 1, "boards": 2, "items_by_column_values": 1}
+
+
+def test_lookup_right_after_a_read_completes_does_not_send_it_again(fake, new_wrapper):
+    fake.add_board("Shared", columns=[("Status", "color")])
+    wrapper = new_wrapper("Shared")
+    single_flight_do = wrapper.single_flight.do
+    followers = []
+
+    def do(key, func, *args, **kwargs):
+        result = single_flight_do(key, func, *args, **kwargs)
+        if not followers:
+            # ANOTHER THREAD LOOKING THE BOARD UP JUST AFTER THE SINGLE-FLIGHT KEY WAS RELEASED
+            followers.append(None)
+            followers[0] = wrapper.check_board_exists()
+        return result
+
+    wrapper.single_flight.do = do
+    assert wrapper.check_board_exists() is True
+
+    assert followers == [True]
+    assert fake.stats.operations == {"me": 1, "boards": 2}
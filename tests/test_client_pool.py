@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from MondayWrapper import MondayClientPool, MondayConnection, MondayWrapper, RequestScheduler
+
+from conftest import UNLIMITED_COMPLEXITY_BUDGET
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_sends_no_request():
+    code = ("import requests\n"
+            "def refuse(*args, **kwargs):\n"
+            "    raise AssertionError('request sent on import')\n"
+            "requests.Session.request = refuse\n"
+            "import MondayWrapper\n")
+
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_connection_creates_its_client_on_first_use(fake):
+    connection = MondayConnection(scheduler=RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET))
+    assert fake.stats.round_trips == 0
+
+    client = connection.client
+
+    assert connection.client is client
+    assert fake.stats.operations == {"me": 1}
+
+
+def test_connection_session_sends_its_own_api_key(fake):
+    connection = MondayConnection(api_key_v2="tenant key")
+
+    session = connection.session
+    assert session.headers["Authorization"] == "tenant key"
+    assert connection.execute_graphql("query { me { id } }")["data"]["me"]["id"] == str(fake.me_id)
+    # A CLOSED CONNECTION OPENS A NEW SESSION WHEN IT IS USED AGAIN
+    connection.close()
+    assert connection.session is not session
+
+
+def test_pool_hands_out_connections_by_name_or_most_budget():
+    busy = MondayConnection(api_key_v2="busy", scheduler=RequestScheduler(complexity_budget=1000))
+    idle = MondayConnection(api_key_v2="idle", scheduler=RequestScheduler(complexity_budget=1000))
+    pool = MondayClientPool({"tenant a": busy, "tenant b": idle})
+    busy.scheduler.reserve(900)
+
+    assert pool.get("tenant a") is busy
+    assert pool.get() is idle
+    assert len(pool) == 2
+    with pytest.raises(ValueError):
+        MondayClientPool().get()
+
+
+def test_pool_from_api_keys_and_wrappers_taking_a_pool(fake):
+    fake.add_board("Pooled", columns=[("Text", "text")])
+    pool = MondayClientPool.from_api_keys(["key 1", "key 2"])
+
+    assert [connection.api_key_v2 for connection in pool.connections.values()] == ["key 1", "key 2"]
+    pool.get(0).scheduler.reserve(10 ** 6)
+    wrapper = MondayWrapper("Pooled", connection=pool)
+
+    assert wrapper.connection is pool.get(1)
+    assert wrapper.scheduler is pool.get(1).scheduler
+    assert wrapper.check_board_exists() is True
+    pool.close()
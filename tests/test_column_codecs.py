@@ -0,0 +1,57 @@
+import json
+
+from MondayWrapper import ColumnCodec, ColumnCodecRegistry
+
+STATUS_SETTINGS = json.dumps({"labels": {"0": "Working on it", "1": "Done", "2": "Stuck"}})
+
+
+def test_status_codec_maps_labels_and_indexes():
+    codec = ColumnCodec("status", "Status", "color", STATUS_SETTINGS)
+
+    assert codec.labels == {"0": "Working on it", "1": "Done", "2": "Stuck"}
+    assert codec.encode("Stuck").format() == {"label": "Stuck"}
+    assert codec.decode('{"index": 1}', "Done") == "Done"
+    assert codec.decode('{"index": 9}', "stale text") == "stale text"
+    assert codec.decode(None, "") is None
+
+
+def test_codecs_decode_values_by_column_type():
+    assert ColumnCodec("numbers", "Amount", "numeric").decode('"12.5"', "12.5") == 12.5
+    assert ColumnCodec("numbers", "Amount", "numeric").decode('"abc"', "abc") is None
+    assert ColumnCodec("date", "Due", "date").decode('{"date": "2024-01-31"}', "2024-01-31") == "2024-01-31"
+    assert ColumnCodec("link", "Link", "link").decode('{"url": "https://x.com", "text": "X"}', "X - https://x.com") == "https://x.com"
+    assert ColumnCodec("long_text", "Notes", "long-text").decode('{"text": "line"}', "line") == "line"
+    assert ColumnCodec("text", "Text", "text").decode('"hello"', "hello") == "hello"
+    assert ColumnCodec("text", "Text", "text").decode("not json", "raw") == "raw"
+
+
+def test_registry_indexes_codecs_by_title_and_id():
+    registry = ColumnCodecRegistry([
+        {"id": "status", "title": "Status", "type": "color", "settings_str": STATUS_SETTINGS},
+        {"id": "text", "title": "Text", "type": "text", "settings_str": "{}"},
+        {"id": "text1", "title": "Text", "type": "text", "settings_str": "{}"},
+    ])
+
+    assert registry.get("Status").id == "status"
+    assert registry.get_by_id("text1").title == "Text"
+    # THE FIRST COLUMN WINS WHEN TWO COLUMNS SHARE A TITLE
+    assert registry.get("Text").id == "text"
+    assert registry.get("Missing") is None
+    assert registry.encode("Missing", "x") is None
+    assert registry.encode("Status", "Done").format() == {"label": "Done"}
+
+
+def test_wrapper_builds_the_codecs_of_a_board_once(fake, new_wrapper):
+    board = fake.add_board("Codecs", columns=[("Status", "color", {"0": "New", "5": "Closed"}), ("Text", "text")])
+    item_id = fake.add_item(board, "a")
+    wrapper = new_wrapper("Codecs")
+
+    registry = wrapper.get_column_codecs()
+    fake.stats.reset()
+
+    assert wrapper.get_column_codecs() is registry
+    assert wrapper.get_column_id_by_name("Text") == "text"
+    assert wrapper.get_column_type_by_name("Status") == "color"
+    assert fake.stats.round_trips == 0
+    assert wrapper.change_value_of_column("a", "Status", "Closed") == "Closed"
+    assert fake.get_item_values(item_id)["Status"] == "Closed"
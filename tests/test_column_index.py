@@ -0,0 +1,71 @@
+import pytest
+
+from MondayWrapper import ColumnIndex
+
+from conftest import item_ids_by_name
+
+
+@pytest.fixture
+def board(fake):
+    board = fake.add_board("Indexed", columns=[("Email", "text"), ("Amount", "numeric")])
+    for index in range(5):
+        fake.add_item(board, f"item {index}", column_values={"Email": f"u{index}@x.com", "Amount": str(index * 10)})
+    fake.add_item(board, "no email")
+    return board
+
+
+def test_unique_index_build_rejects_duplicate_values():
+    index = ColumnIndex("Board", "Email", "text", "text", unique=True)
+
+    with pytest.raises(ValueError):
+        index.build([(1, "a", "x@x.com"), (2, "b", "x@x.com"), (3, "c", None)])
+    assert index.build([(1, "a", "x@x.com"), (2, "b", ""), (3, "c", None)]) == 1
+    assert index.conflicting_item(2, "x@x.com") == 1
+    assert index.conflicting_item(1, "x@x.com") is None
+
+
+def test_find_items_and_ranges(fake, board, new_wrapper):
+    wrapper = new_wrapper("Indexed")
+    wrapper.create_index("Email", unique=True)
+
+    assert [item.name for item in wrapper.find_items("Email", "u3@x.com")] == ["item 3"]
+    assert wrapper.find_items("Email", "nobody@x.com") == []
+    # THE AMOUNT COLUMN IS INDEXED ON FIRST USE. NUMBERS ARE COMPARED AS NUMBERS
+    assert [item.name for item in wrapper.find_items_in_range("Amount", 10, 30)] == ["item 1", "item 2", "item 3"]
+    assert [item.name for item in wrapper.find_items_in_range("Amount", low=35)] == ["item 4"]
+
+
+def test_unique_index_rejects_conflicting_writes(fake, board, new_wrapper):
+    wrapper = new_wrapper("Indexed")
+    wrapper.create_index("Email", unique=True)
+    ids = item_ids_by_name(fake, board)
+
+    assert wrapper.change_value_of_column("item 1", "Email", "u2@x.com") is None
+    assert wrapper.update_item_columns("item 1", {"Email": "u2@x.com", "Amount": 1}) is None
+    assert fake.get_item_values(ids["item 1"][0])["Email"] == "u1@x.com"
+
+    writer = wrapper.batch_writer()
+    writer.add_item("new 1", column_values={"Email": "new@x.com"})
+    writer.add_item("new 2", column_values={"Email": "new@x.com"})
+    writer.change_columns("item 4", {"Email": "u0@x.com"})
+    results = writer.execute()
+
+    assert [result.success for result in results] == [True, False, False]
+    assert "new 2" not in item_ids_by_name(fake, board)
+    assert [item.name for item in wrapper.find_items("Email", "new@x.com")] == ["new 1"]
+
+
+def test_index_follows_wrapper_writes(fake, board, new_wrapper):
+    wrapper = new_wrapper("Indexed")
+    wrapper.create_index("Email", unique=True)
+
+    assert wrapper.change_value_of_column("item 1", "Email", "changed@x.com") == "changed@x.com"
+    assert wrapper.find_items("Email", "u1@x.com") == []
+    assert [item.name for item in wrapper.find_items("Email", "changed@x.com")] == ["item 1"]
+
+    writer = wrapper.batch_writer()
+    writer.archive_item("item 1")
+    writer.execute()
+    assert wrapper.find_items("Email", "changed@x.com") == []
+    # THE VALUE OF THE ARCHIVED ITEM CAN BE GIVEN TO ANOTHER ITEM
+    assert wrapper.change_value_of_column("item 2", "Email", "changed@x.com") == "changed@x.com"
@@ -0,0 +1,63 @@
+def seed_board(fake, item_count):
+    board = fake.add_board("Values", columns=[("Status", "color"), ("Amount", "numeric"), ("Site", "link"), ("Notes", "text")])
+    for index in range(item_count):
+        fake.add_item(board, f"item {index}", column_values={"Status": "Done" if index % 2 else "Stuck", "Amount": index,
+                                                             "Site": f"https://example.com/{index} site", "Notes": f"note {index}"})
+    return board
+
+
+def test_values_of_all_items_are_decoded(fake, new_wrapper):
+    seed_board(fake, 7)
+    wrapper = new_wrapper("Values")
+
+    values = wrapper.get_column_values(["Status", "Amount", "Site", "Notes"], page_size=3)
+
+    assert list(values) == [f"item {index}" for index in range(7)]
+    assert values["item 3"] == {"Status": "Done", "Amount": 3.0, "Site": "https://example.com/3", "Notes": "note 3"}
+    assert values["item 4"]["Status"] == "Stuck"
+
+
+def test_only_requested_columns_are_selected(fake, new_wrapper):
+    seed_board(fake, 2)
+    wrapper = new_wrapper("Values")
+
+    values = wrapper.get_column_values("Amount")
+
+    assert values == {"item 0": {"Amount": 0.0}, "item 1": {"Amount": 1.0}}
+
+
+def test_paging_stops_once_the_items_asked_for_are_found(fake, new_wrapper):
+    seed_board(fake, 30)
+    wrapper = new_wrapper("Values")
+    wrapper.get_column_codecs()
+    fake.stats.reset()
+
+    values = wrapper.get_column_values(["Status"], item_names=["item 1", "item 4", "missing"], page_size=5)
+    assert values == {"item 1": {"Status": "Done"}, "item 4": {"Status": "Stuck"}}
+    # THE MISSING ITEM MAKES THE WHOLE BOARD BE READ
+    assert fake.stats.round_trips == 6
+
+    fake.stats.reset()
+    values = wrapper.get_column_values(["Status"], item_names=["item 1", "item 4"], page_size=5)
+    assert list(values) == ["item 1", "item 4"]
+    assert fake.stats.round_trips == 1
+
+
+def test_single_cells_are_decoded_with_the_column_codecs(fake, new_wrapper):
+    seed_board(fake, 3)
+    wrapper = new_wrapper("Values")
+
+    assert wrapper.get_status_of_item("item 1") == "Done"
+    assert wrapper.get_status_of_item("item 2", col_title="Status") == "Stuck"
+    assert wrapper.get_value_of_column_for_item("item 2", "Amount") == 2.0
+    assert wrapper.get_value_of_column_for_item("item 2", "Site") == "https://example.com/2"
+    assert wrapper.get_value_of_column_for_item("item 2", "Notes") == "note 2"
+
+
+def test_single_cells_of_missing_items_or_columns_are_none(fake, new_wrapper):
+    seed_board(fake, 1)
+    wrapper = new_wrapper("Values")
+
+    assert wrapper.get_status_of_item("missing") is None
+    assert wrapper.get_value_of_column_for_item("missing", "Notes") is None
+    assert wrapper.get_value_of_column_for_item("item 0", "No such column") is None
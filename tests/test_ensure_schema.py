@@ -0,0 +1,60 @@
+import json
+
+from conftest import item_ids_by_name
+
+SCHEMA = [("Stage", "color", ["New", "Open", "Closed"]), ("Amount", "numeric"), ("Notes", "long_text"), ("Due", "date"), ("Owner", "people")]
+
+
+def columns_by_title(fake, board):
+    return {column["title"]: column for column in fake.boards[board]["columns"]}
+
+
+def group_titles(fake, board):
+    return [group["title"] for group in fake.boards[board]["groups"]]
+
+
+def board_id_by_name(fake, name):
+    return next(board_id for board_id, board in fake.boards.items() if board["name"] == name)
+
+
+def test_ensure_schema_creates_board_columns_and_groups(fake, new_wrapper):
+    wrapper = new_wrapper("Customer")
+
+    report = wrapper.ensure_schema(SCHEMA, groups=["Inbox", "Archive"])
+
+    board = board_id_by_name(fake, "Customer")
+    columns = columns_by_title(fake, board)
+    assert report["board_created"] is True
+    assert report["columns_created"] == ["Stage", "Amount", "Notes", "Due", "Owner"]
+    assert report["groups_created"] == ["Inbox", "Archive"]
+    assert report["failed"] == {}
+    assert [columns[title]["type"] for title, *_ in SCHEMA] == ["color", "numeric", "long-text", "date", "multiple-person"]
+    assert list(json.loads(columns["Stage"]["settings_str"])["labels"].values()) == ["New", "Open", "Closed"]
+    assert {"Inbox", "Archive"} <= set(group_titles(fake, board))
+
+    # THE CACHES ARE FILLED: THE BOARD CAN BE WRITTEN TO WITH THE NEW LABELS AND GROUPS
+    ids = wrapper.add_items([{"Name": "first", "Stage": "Open", "Amount": 5}], group_name="Archive")
+    item_id = int(ids["first"])
+    assert fake.get_item_values(item_id)["Stage"] == "Open"
+    assert fake.items[item_id]["group_id"] == wrapper.get_group_id("Archive")
+
+
+def test_ensure_schema_is_idempotent_and_reports_mismatches(fake, new_wrapper):
+    board = fake.add_board("Existing", columns=[("Stage", "color"), ("Amount", "text")], groups=["Inbox"])
+    wrapper = new_wrapper("Existing")
+
+    report = wrapper.ensure_schema(SCHEMA, groups=["Inbox", "Archive"])
+
+    assert report["board_created"] is False
+    assert report["columns_created"] == ["Notes", "Due", "Owner"]
+    assert report["groups_created"] == ["Archive"]
+    assert set(report["mismatched"]) == {"Stage", "Amount"}
+    # EXISTING COLUMNS ARE NEVER CHANGED
+    assert columns_by_title(fake, board)["Amount"]["type"] == "text"
+
+    column_count = len(fake.boards[board]["columns"])
+    report = wrapper.ensure_schema(SCHEMA, groups=["Inbox", "Archive"])
+    assert (report["columns_created"], report["groups_created"]) == ([], [])
+    assert len(fake.boards[board]["columns"]) == column_count
+    assert group_titles(fake, board).count("Archive") == 1
+    assert item_ids_by_name(fake, board) == {}
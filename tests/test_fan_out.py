@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+def test_results_follow_the_board_order_and_failures_stay_per_board(fake, new_wrapper):
+    wrapper = new_wrapper("Board 0")
+
+    def operation(board_name):
+        if board_name == "Board 2":
+            raise ValueError("broken board")
+        return board_name.upper()
+
+    results = wrapper.fan_out(operation, board_names=[f"Board {index}" for index in range(5)], max_workers=3)
+
+    assert [result.board_name for result in results] == [f"Board {index}" for index in range(5)]
+    assert [result.value for result in results] == ["BOARD 0", "BOARD 1", None, "BOARD 3", "BOARD 4"]
+    assert [result.success for result in results] == [True, True, False, True, True]
+    assert str(results[2].error) == "broken board"
+
+
+def test_at_most_max_workers_boards_run_at_the_same_time(fake, new_wrapper):
+    wrapper = new_wrapper("Board 0")
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def operation(board_name):
+        with lock:
+            running.append(board_name)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(board_name)
+
+    wrapper.fan_out(operation, board_names=[f"Board {index}" for index in range(12)], max_workers=4)
+
+    assert 1 < max(peak) <= 4
+
+
+def test_items_and_columns_of_every_board(fake, new_wrapper):
+    for index in range(6):
+        board = fake.add_board(f"Board {index}", columns=[("Status", "color")] + [(f"Text {column}", "text") for column in range(index)])
+        for item in range(index):
+            fake.add_item(board, f"item {index}.{item}")
+    wrapper = new_wrapper("Board 0")
+
+    items = wrapper.get_items_in_boards(max_workers=3)
+    columns = wrapper.get_columns_in_boards(board_names=["Board 5", "Board 1", "No such board"])
+
+    assert sorted((result.board_name, len(result.value)) for result in items) == [(f"Board {index}", index) for index in range(6)]
+    assert [len(result.value) for result in columns[:2]] == [7, 3]
+    assert columns[2].success is False
+    assert columns[2].value is None
+    assert "No such board" in str(columns[2].error)
+
+
+def test_columns_of_a_board_are_read_once(fake, new_wrapper):
+    fake.add_board("Columns", columns=[("Status", "color"), ("Text", "text")])
+    wrapper = new_wrapper("Columns")
+
+    columns = wrapper.get_columns_in_single_board()
+    fake.stats.reset()
+
+    assert [(column.title, column.type) for column in columns] == [("Name", "name"), ("Status", "color"), ("Text", "text")]
+    assert wrapper.get_columns_in_single_board() is columns
+    assert fake.stats.round_trips == 0
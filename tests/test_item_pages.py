@@ -0,0 +1,93 @@
+import time
+
+import pytest
+from moncli.api_v2 import MondayApiError
+
+from MondayWrapper import ColumnCodec, ItemPageReader, RequestScheduler
+
+from conftest import UNLIMITED_COMPLEXITY_BUDGET
+
+
+@pytest.fixture
+def board(fake):
+    board = fake.add_board("Paged", columns=[("Status", "color"), ("Amount", "numeric")], groups=["Inbox", "Done"])
+    for index in range(7):
+        fake.add_item(board, f"item {index}", column_values={"Status": "Done", "Amount": str(index)})
+    return board
+
+
+def new_reader(board, **kwargs):
+    scheduler = RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, max_retries=0)
+    return ItemPageReader(board, scheduler=scheduler, **kwargs)
+
+
+def test_pages_follow_the_cursor_in_board_order(fake, board):
+    pages = list(new_reader(board, page_size=3).pages())
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [item["name"] for page in pages for item in page] == [f"item {index}" for index in range(7)]
+    assert pages[0][0] == {"id": str(fake.boards[board]["item_ids"][0]), "name": "item 0", "board_id": str(board), "group_id": "topics"}
+
+
+def test_column_values_are_decoded_with_the_codecs(fake, board):
+    columns = {column["title"]: column for column in fake.boards[board]["columns"]}
+    codecs = [ColumnCodec.from_column(columns["Status"]), ColumnCodec.from_column(columns["Amount"])]
+
+    items = list(new_reader(board, page_size=5, codecs=codecs))
+
+    assert [item["column_values"] for item in items[:2]] == [{"Status": "Done", "Amount": 0.0}, {"Status": "Done", "Amount": 1.0}]
+
+
+def test_prefetched_pages_are_the_same_pages(fake, board):
+    assert list(new_reader(board, page_size=2, prefetch=True).pages()) == list(new_reader(board, page_size=2).pages())
+
+
+def test_prefetch_stays_one_page_ahead_and_stops_with_the_caller(fake, board):
+    for index in range(7, 40):
+        fake.add_item(board, f"item {index}")
+    pages = new_reader(board, page_size=2, prefetch=True).pages()
+
+    assert len(next(pages)) == 2
+    time.sleep(0.3)
+    # THE PAGE BEING PROCESSED, ONE PAGE IN THE QUEUE AND ONE WAITING FOR ROOM IN IT
+    assert fake.stats.round_trips <= 3
+    pages.close()
+    time.sleep(0.3)
+    assert fake.stats.round_trips <= 3
+
+
+def test_prefetch_errors_are_raised_to_the_caller(fake, board):
+    fake.inject_server_errors(1, status_code=400)
+
+    with pytest.raises(MondayApiError):
+        list(new_reader(board, prefetch=True))
+
+
+def test_wrapper_iterates_every_item_of_every_board(fake, board, new_wrapper):
+    other = fake.add_board("Other", columns=[("Status", "color")])
+    for index in range(60):
+        fake.add_item(other, f"other {index}")
+    wrapper = new_wrapper("Paged")
+
+    items = list(wrapper.iter_board_items(page_size=4, columns=["Amount", "No such column"]))
+    assert [item["column_values"] for item in items[-2:]] == [{"Amount": 5.0}, {"Amount": 6.0}]
+
+    all_items = list(wrapper.iter_all_items(page_size=25, boards_page_size=1, prefetch=True))
+    assert sorted(item["name"] for item in all_items) == sorted([f"item {index}" for index in range(7)] + [f"other {index}" for index in range(60)])
+    assert len(wrapper.get_all_items_in_all_boards()) == 67
+    assert sorted(item.name for item in wrapper.get_items_in_single_board("Other")) == sorted(f"other {index}" for index in range(60))
+
+
+def test_all_items_are_decoded_with_the_columns_of_their_own_board(fake, new_wrapper):
+    first = fake.add_board("Twin", columns=[("Status", "color", {"0": "Open", "1": "Closed"})])
+    second = fake.add_board("Twin", columns=[("Status", "color", {"0": "Red", "1": "Green"})])
+    fake.add_item(first, "first", column_values={"Status": "Closed"})
+    fake.add_item(second, "second", column_values={"Status": "Green"})
+    wrapper = new_wrapper("Twin")
+    fake.stats.reset()
+
+    items = list(wrapper.iter_all_items(columns=["Status"], boards_page_size=1))
+
+    assert sorted((item["name"], item["column_values"]["Status"]) for item in items) == [("first", "Closed"), ("second", "Green")]
+    # THREE PAGES OF THE BOARDS LIST (THE LAST ONE EMPTY) AND ONE ITEMS PAGE PER BOARD: NO LOOKUP OF A BOARD BY NAME
+    assert fake.stats.operations["boards"] == 5
@@ -0,0 +1,61 @@
+import sys
+
+from conftest import item_ids_by_name
+from MondayWrapper import ItemRecord
+
+
+def test_record_round_trips_through_moncli_item_objects(fake, new_wrapper):
+    record = ItemRecord.from_data({"id": "12", "name": "a", "board": {"id": "3"}, "group": {"id": "topics"}})
+    item_object = record.to_item(new_wrapper("Any").connection.creds)
+
+    assert (item_object.id, item_object.name) == ("12", "a")
+    copy = ItemRecord.from_item(item_object, 3, "topics")
+    assert (copy.id, copy.name, copy.board_id, copy.group_id) == (12, "a", 3, "topics")
+    assert not hasattr(copy, "__dict__")
+
+
+def test_group_ids_are_interned_and_optional():
+    group_id = "".join(["new", "_group"])
+    first = ItemRecord(1, "a", 3, group_id)
+    second = ItemRecord(2, "b", 3, "".join(["new", "_group"]))
+
+    assert first.group_id is second.group_id is sys.intern("new_group")
+    assert ItemRecord(3, "c", 3).group_id is None
+    assert ItemRecord.from_data({"id": "4", "name": "d", "board": {"id": "3"}}).group_id is None
+
+
+def test_snapshot_and_item_cache_hold_records(fake, new_wrapper):
+    board = fake.add_board("Records", columns=[("Status", "color")])
+    for name in ("a", "b"):
+        fake.add_item(board, name)
+    wrapper = new_wrapper("Records")
+    ids = item_ids_by_name(fake, board)
+    snapshot = wrapper.enable_board_snapshot()
+
+    assert all(isinstance(record, ItemRecord) for record in snapshot.get_all_records())
+    assert [record.id for record in snapshot.get_records_by_name("b")] == ids["b"]
+    # PUBLIC LOOKUPS STILL RETURN MONCLI ITEM OBJECTS
+    assert snapshot.get_items_by_name("b")[0].id == str(ids["b"][0])
+
+    wrapper.disable_board_snapshot()
+    wrapper.add_new_item_to_board("c")
+    records = wrapper.item_objects_cache[(int(wrapper.get_board_id()), "c")]
+    assert [type(record) for record in records] == [ItemRecord]
+
+
+def test_records_carry_the_group_of_looked_up_and_created_items(fake, new_wrapper):
+    board = fake.add_board("Records", columns=[("Status", "color")], groups=["Inbox", "Later"])
+    inbox, later = (group["id"] for group in fake.boards[board]["groups"])
+    fake.add_item(board, "a", group_id=later)
+    wrapper = new_wrapper("Records")
+    board_id = int(wrapper.get_board_id())
+
+    wrapper.get_item_id_by_name("a")
+    writer = wrapper.batch_writer()
+    writer.add_item("b", group_name="Later")
+    writer.add_item("c")
+    writer.execute()
+
+    assert [record.group_id for record in wrapper.item_objects_cache[(board_id, "a")]] == [later]
+    assert [record.group_id for record in wrapper.item_objects_cache[(board_id, "b")]] == [later]
+    assert [record.group_id for record in wrapper.item_objects_cache[(board_id, "c")]] == [inbox]
@@ -0,0 +1,74 @@
+import pytest
+import requests
+
+from MondayWrapper import MondayWrapper, RequestScheduler, WrapperMetrics
+
+from conftest import UNLIMITED_COMPLEXITY_BUDGET
+
+
+def test_calls_errors_and_latency_buckets_are_recorded():
+    metrics = WrapperMetrics()
+
+    metrics.record_call("get_boards", 0.01)
+    metrics.record_call("get_boards", 0.3)
+    metrics.record_call("get_boards", 60.0, success=False)
+    metrics.record_retry("get_boards", 0.5)
+
+    operation = metrics.snapshot()["operations"]["get_boards"]
+    assert (operation["calls"], operation["errors"], operation["retries"]) == (3, 1, 1)
+    assert operation["total_time"] == pytest.approx(60.31)
+    # ONE BUCKET PER BOUND (0.05, 0.1, 0.25, 0.5 ...) AND A LAST ONE FOR THE SLOWER CALLS
+    assert operation["latency_buckets"] == [1, 0, 0, 1, 0, 0, 0, 0, 0, 1]
+
+
+def test_cache_hit_ratio_and_listeners():
+    metrics = WrapperMetrics()
+    events = []
+    metrics.add_listener(lambda event, data: events.append((event, data)))
+    metrics.add_listener(lambda event, data: 1 / 0)
+
+    assert metrics.cache_hit_ratio("board") is None
+    for hit in (True, True, True, False):
+        metrics.record_cache("board", hit)
+    metrics.record_throttle("create_item", 1.5)
+
+    assert metrics.cache_hit_ratio("board") == 0.75
+    assert metrics.snapshot()["throttle_wait_time"] == 1.5
+    # A FAILING LISTENER DOES NOT STOP THE OTHERS
+    assert events[-1] == ("throttle", {"operation": "create_item", "wait": 1.5})
+    assert len(events) == 5
+
+    metrics.reset()
+    assert metrics.snapshot()["caches"] == {}
+    metrics.record_cache("item", False)
+    assert len(events) == 6
+
+
+def test_scheduler_records_retries_and_failures():
+    metrics = WrapperMetrics()
+    scheduler = RequestScheduler(max_retries=1, backoff_base=0.001, metrics=metrics)
+    attempts = []
+
+    def timeout():
+        attempts.append(1)
+        raise requests.Timeout("read timed out")
+
+    with pytest.raises(requests.Timeout):
+        scheduler.call(timeout, operation="get_items")
+
+    operation = metrics.snapshot()["operations"]["get_items"]
+    assert (operation["calls"], operation["errors"], operation["retries"]) == (2, 2, 1)
+
+
+def test_wrapper_records_api_calls_and_cache_lookups(fake):
+    fake.add_board("Metrics", columns=[("Status", "color")])
+    metrics = WrapperMetrics()
+    wrapper = MondayWrapper("Metrics", scheduler=RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, metrics=metrics))
+
+    wrapper.get_column_id_by_name("Status")
+    wrapper.get_column_id_by_name("Status")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["caches"]["column_codec"] == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+    assert sum(operation["calls"] for operation in snapshot["operations"].values()) >= 1
+    assert all(operation["errors"] == 0 for operation in snapshot["operations"].values())
@@ -0,0 +1,95 @@
+import sqlite3
+import time
+
+from MondayWrapper import MondayWrapper, PersistentMetadataCache, RequestScheduler
+
+from conftest import UNLIMITED_COMPLEXITY_BUDGET
+
+
+def test_entries_round_trip_and_expire(tmp_path):
+    cache = PersistentMetadataCache(str(tmp_path / "cache.db"), ttl=0.2)
+    cache.set_board_id("Board", 12)
+    cache.set_columns("Board", [{"id": "status", "title": "Status", "type": "color", "settings_str": '{"labels": {"1": "Done"}}'}])
+    cache.set_item_ids("Board", "a", [1, 2])
+    cache.add_item_id("Board", "a", 3)
+
+    assert cache.get_board_id("Board") == "12"
+    assert cache.get_columns("Board") == [{"id": "status", "title": "Status", "type": "color", "settings_str": '{"labels": {"1": "Done"}}'}]
+    assert sorted(cache.get_item_ids("Board", "a")) == ["1", "2", "3"]
+    cache.set_item_ids("Board", "a", [4])
+    assert cache.get_item_ids("Board", "a") == ["4"]
+
+    time.sleep(0.3)
+    assert cache.get_board_id("Board") is None
+    assert cache.get_columns("Board") is None
+    assert cache.get_item_ids("Board", "a") == []
+    cache.close()
+
+
+def test_entries_are_namespaced_by_api_key_and_invalidated(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = PersistentMetadataCache(path, api_key="key 1")
+    other_account = PersistentMetadataCache(path, api_key="key 2")
+    cache.set_board_id("Board", 12)
+    cache.set_item_ids("Board", "a", [1])
+    cache.set_board_id("Other", 13)
+
+    assert other_account.get_board_id("Board") is None
+    cache.invalidate_item("Board", "a")
+    assert cache.get_item_ids("Board", "a") == []
+    cache.invalidate_board("Board")
+    assert (cache.get_board_id("Board"), cache.get_board_id("Other")) == (None, "13")
+    cache.clear()
+    assert cache.get_board_id("Other") is None
+    cache.close()
+    other_account.close()
+
+
+def test_database_with_another_schema_version_is_rebuilt(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = PersistentMetadataCache(path)
+    cache.set_board_id("Board", 12)
+    cache.close()
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE metadata SET value = '0' WHERE key = 'schema_version'")
+
+    cache = PersistentMetadataCache(path)
+
+    assert cache.get_board_id("Board") is None
+    assert cache.connection.execute("SELECT value FROM metadata WHERE key = 'schema_version'").fetchone() == (str(PersistentMetadataCache.SCHEMA_VERSION),)
+    cache.close()
+
+
+def test_second_wrapper_resolves_names_from_the_cache(fake, tmp_path):
+    board = fake.add_board("Persisted", columns=[("Text", "text")])
+    item_id = fake.add_item(board, "a")
+    path = str(tmp_path / "cache.db")
+
+    def run():
+        cache = PersistentMetadataCache(path)
+        wrapper = MondayWrapper("Persisted", scheduler=RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET), persistent_cache=cache)
+        result = wrapper.change_value_of_column("a", "Text", "written")
+        cache.close()
+        return result
+
+    assert run() == "written"
+    fake.stats.reset()
+    assert run() == "written"
+
+    assert fake.get_item_values(item_id)["Text"] == "written"
+    # THE BOARD, COLUMN AND ITEM IDS COME FROM THE CACHE: ONLY THE WRITE IS SENT
+    assert fake.stats.round_trips == 1
+
+
+def test_failed_write_with_a_stale_cached_id_drops_the_entry(fake, tmp_path):
+    board = fake.add_board("Persisted", columns=[("Text", "text")])
+    item_id = fake.add_item(board, "a")
+    cache = PersistentMetadataCache(str(tmp_path / "cache.db"))
+    wrapper = MondayWrapper("Persisted", scheduler=RequestScheduler(complexity_budget=UNLIMITED_COMPLEXITY_BUDGET, max_retries=0), persistent_cache=cache)
+    cache.set_item_ids("Persisted", "a", [999999])
+
+    assert wrapper.change_value_of_column("a", "Text", "lost") is None
+    assert cache.get_item_ids("Persisted", "a") == []
+    assert wrapper.change_value_of_column("a", "Text", "written") == "written"
+    assert fake.get_item_values(item_id)["Text"] == "written"
+    cache.close()
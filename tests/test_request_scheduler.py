@@ -0,0 +1,141 @@
+import pytest
+import requests
+from moncli.api_v2 import MondayApiError
+
+from MondayWrapper import RequestScheduler
+
+BUDGET_ERROR = MondayApiError("query", 200, [{"message": "Complexity budget exhausted, query cost 30001 budget remaining 0 out of 1000000 reset in 7 seconds"}])
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (BUDGET_ERROR, True),
+    (requests.ConnectionError("connection reset"), True),
+    (requests.Timeout("read timed out"), True),
+    (MondayApiError("query", 429, ["Rate limit exceeded"]), True),
+    (MondayApiError("query", 502, ["Bad gateway"]), True),
+    (MondayApiError("query", 400, ["Item not found"]), False),
+    (MondayApiError("query", 200, [{"message": "Query has complexity of 6000000, which exceeds max complexity of 5000000"}]), False),
+    (MondayApiError("query", 200, [{"message": "Budget is over", "extensions": {"code": "ComplexityException"}}]), True),
+    (ValueError("bad value"), False),
+])
+def test_errors_are_classified(error, retryable):
+    assert RequestScheduler().is_retryable(error) is retryable
+
+
+def test_backoff_grows_exponentially_with_jitter_and_a_cap():
+    scheduler = RequestScheduler(backoff_base=1.0, backoff_max=10.0)
+
+    for attempt, full_delay in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (5, 10.0), (9, 10.0)]:
+        delays = [scheduler.backoff_delay(attempt) for _ in range(50)]
+        assert all(full_delay / 2 <= delay <= full_delay for delay in delays)
+
+
+def test_budget_error_waits_for_the_reported_reset():
+    scheduler = RequestScheduler(backoff_base=0.01)
+
+    assert scheduler.reset_in(BUDGET_ERROR) == 7
+    assert scheduler.backoff_delay(1, BUDGET_ERROR) >= 7
+    # THE BUDGET IS BLOCKED UNTIL THE RESET FOR EVERY OTHER CALLER TOO
+    assert scheduler.reserve(1) > 6
+
+
+def test_reserve_meters_the_budget():
+    scheduler = RequestScheduler(complexity_budget=1000, budget_window=10)
+
+    assert scheduler.reserve(600) == 0
+    assert scheduler.reserve(600) == pytest.approx(2.0, abs=0.05)
+    scheduler.report_budget(remaining=0)
+    assert scheduler.reserve(100) > 2.0
+
+
+def test_budget_is_corrected_from_the_complexity_field_of_a_response():
+    scheduler = RequestScheduler(complexity_budget=1000, budget_window=10)
+
+    assert scheduler.report_complexity({"items": []}) == {}
+    assert scheduler.tokens == 1000
+    complexity = scheduler.report_complexity({"complexity": {"query": 20, "after": 0, "reset_in_x_seconds": 5}})
+    assert complexity["query"] == 20
+    assert scheduler.reserve(1) > 4
+
+
+def test_wrapper_queries_report_the_remaining_budget(fake, new_wrapper):
+    fake.add_board("Reported", columns=[("Status", "color")], groups=["Open"])
+    wrapper = new_wrapper("Reported")
+    wrapper.check_board_exists()
+    reported = []
+    wrapper.scheduler.report_budget = lambda remaining=None, reset_in=None: reported.append(remaining)
+
+    wrapper.get_group_ids()
+    assert reported == [fake.budget_remaining]
+
+    reported.clear()
+    wrapper.ensure_schema([("Status", "color")])
+    assert reported == [fake.budget_remaining]
+
+
+def test_call_retries_transient_failures_and_fails_fast_on_others():
+    scheduler = RequestScheduler(max_retries=3, backoff_base=0.001)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise requests.ConnectionError("connection reset")
+        return "ok"
+
+    assert scheduler.call(flaky) == "ok"
+    assert len(attempts) == 3
+
+    def not_found():
+        attempts.append(1)
+        raise MondayApiError("query", 400, ["Item not found"])
+
+    attempts.clear()
+    with pytest.raises(MondayApiError):
+        scheduler.call(not_found)
+    assert len(attempts) == 1
+
+
+@pytest.mark.parametrize("error, attempts_made", [
+    (MondayApiError("query", 200, [{"message": "Complexity budget exhausted, query cost 30001 budget remaining 0 out of 1000000 reset in 0 seconds"}]), 2),
+    (MondayApiError("query", 429, ["Rate limit exceeded"]), 2),
+    (MondayApiError("query", 502, ["Bad gateway"]), 1),
+    (requests.Timeout("read timed out"), 1),
+    (requests.ConnectionError("connection reset"), 1),
+])
+def test_calls_that_are_not_idempotent_are_retried_only_when_rejected(error, attempts_made):
+    scheduler = RequestScheduler(max_retries=3, backoff_base=0.001)
+    attempts = []
+
+    def create():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise error
+        return "created"
+
+    if attempts_made == 1:
+        with pytest.raises(type(error)):
+            scheduler.call(create, idempotent=False)
+    else:
+        assert scheduler.call(create, idempotent=False) == "created"
+    assert len(attempts) == attempts_made
+
+
+def test_call_gives_up_after_max_retries():
+    scheduler = RequestScheduler(max_retries=2, backoff_base=0.001)
+    attempts = []
+
+    def always_down():
+        attempts.append(1)
+        raise requests.Timeout("read timed out")
+
+    with pytest.raises(requests.Timeout):
+        scheduler.call(always_down)
+    assert len(attempts) == 3
+
+
+def test_wrapper_calls_wait_out_budget_errors(fake, new_wrapper):
+    fake.add_board("Budget", columns=[("Status", "color")])
+    fake.inject_complexity_errors(2, reset_in=0)
+
+    assert new_wrapper("Budget").check_board_exists() is True
@@ -0,0 +1,102 @@
+import pytest
+
+from conftest import item_ids_by_name
+
+COLUMNS = [("Key", "text"), ("Owner", "multiple-person"), ("Status", "color"), ("Amount", "numeric")]
+
+
+@pytest.fixture
+def board(fake):
+    fake.add_user("Alice A", "alice@x.com")
+    fake.add_user("Bob B", "bob@x.com")
+    return fake.add_board("Sync", columns=COLUMNS)
+
+
+def test_sync_rows_creates_then_updates_only_changed_cells(fake, board, new_wrapper):
+    wrapper = new_wrapper("Sync")
+    rows = [{"Name": "a", "Status": "Done", "Amount": 1}, {"Name": "b", "Status": "Stuck", "Amount": 2}]
+
+    report = wrapper.sync_rows(rows)
+    assert (report["created"], report["updated"], report["failed"]) == (2, 0, 0)
+
+    rows[1]["Amount"] = 3
+    report = wrapper.sync_rows(rows)
+    assert (report["created"], report["updated"], report["unchanged"], report["cells_written"]) == (0, 1, 1, 1)
+
+    ids = item_ids_by_name(fake, board)
+    assert fake.get_item_values(ids["b"][0])["Amount"] == "3"
+    assert fake.get_item_values(ids["a"][0])["Status"] == "Done"
+
+
+def test_sync_rows_with_custom_key_is_idempotent(fake, board, new_wrapper):
+    wrapper = new_wrapper("Sync")
+    rows = [{"Key": "k1", "Name": "First", "Status": "Done"}]
+
+    for _ in range(2):
+        wrapper.sync_rows(rows, key_column="Key")
+    report = wrapper.sync_rows(rows, key_column="Key")
+
+    assert (report["created"], report["unchanged"]) == (0, 1)
+    ids = item_ids_by_name(fake, board)
+    assert list(ids) == ["First"] and len(ids["First"]) == 1
+
+
+def test_sync_rows_archives_missing_items_and_reports_failures(fake, board, new_wrapper):
+    for name in ("a", "b", "c"):
+        fake.add_item(board, name)
+    wrapper = new_wrapper("Sync")
+    rows = [{"Name": "a", "Status": "Done"}, {"Name": "c", "Status": "Not a label"}, {"Name": "e", "Amount": 4}]
+
+    report = wrapper.sync_rows(rows, archive_missing=True)
+
+    assert (report["rows"], report["created"], report["updated"], report["archived"], report["failed"]) == (3, 1, 2, 1, 1)
+    assert [result.operation.item_name for result in report["failures"]] == ["c"]
+    ids = item_ids_by_name(fake, board)
+    assert sorted(ids) == ["a", "c", "e"]
+    assert fake.get_item_values(ids["a"][0])["Status"] == "Done"
+    assert fake.get_item_values(ids["e"][0])["Amount"] == "4"
+
+
+def test_sync_rows_reads_csv_files(fake, board, new_wrapper, tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("Name,Status,Amount\na,Done,1\nb,Stuck,2\n")
+
+    report = new_wrapper("Sync").sync_rows(str(path))
+
+    assert report["created"] == 2
+    ids = item_ids_by_name(fake, board)
+    assert fake.get_item_values(ids["a"][0])["Status"] == "Done"
+    assert fake.get_item_values(ids["b"][0])["Amount"] == "2"
+
+
+def test_sync_rows_rejects_unknown_key_column(fake, board, new_wrapper):
+    wrapper = new_wrapper("Sync")
+
+    with pytest.raises(ValueError):
+        wrapper.sync_rows([{"Nope": "x", "Status": "Done"}], key_column="Nope")
+    assert item_ids_by_name(fake, board) == {}
+
+
+def test_sync_rows_does_not_rewrite_people_given_by_email(fake, board, new_wrapper):
+    wrapper = new_wrapper("Sync")
+    rows = [{"Name": "P", "Owner": "alice@x.com, bob@x.com"}]
+
+    assert wrapper.sync_rows(rows)["created"] == 1
+    assert fake.get_item_values(item_ids_by_name(fake, board)["P"][0])["Owner"] == "Alice A, Bob B"
+    report = wrapper.sync_rows(rows)
+
+    assert (report["updated"], report["unchanged"], report["cells_written"]) == (0, 1, 0)
+
+
+def test_sync_rows_archives_only_items_with_a_known_key(fake, board, new_wrapper):
+    fake.add_item(board, "no key")
+    fake.add_item(board, "dup 1", column_values={"Key": "dup"})
+    fake.add_item(board, "dup 2", column_values={"Key": "dup"})
+    fake.add_item(board, "gone", column_values={"Key": "gone"})
+    fake.add_item(board, "kept", column_values={"Key": "kept"})
+    wrapper = new_wrapper("Sync")
+
+    report = wrapper.sync_rows([{"Key": "kept", "Status": "Done"}], key_column="Key", archive_missing=True)
+
+    assert report["archived"] == 1
+    assert sorted(item_ids_by_name(fake, board)) == ["dup 1", "dup 2", "kept", "no key"]
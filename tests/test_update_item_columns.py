@@ -0,0 +1,30 @@
+from conftest import item_ids_by_name
+
+COLUMNS = [("Status", "color"), ("Text", "text"), ("Amount", "numeric"), ("Link", "link"), ("Due", "date")]
+
+
+def test_update_item_columns_writes_every_column_in_one_mutation(fake, new_wrapper):
+    board = fake.add_board("Cells", columns=COLUMNS)
+    item_id = fake.add_item(board, "a", column_values={"Text": "old"})
+    wrapper = new_wrapper("Cells")
+    fake.stats.reset()
+
+    changed = wrapper.update_item_columns("a", {"Status": "Done", "Amount": 5, "Link": ("https://x.com", "X"), "Due": "2024-01-31", "Text": None})
+
+    assert changed == {"Status": "Done", "Amount": 5, "Link": "https://x.com", "Due": "2024-01-31"}
+    assert fake.get_item_values(item_id) == {"Name": "a", "Status": "Done", "Text": "old", "Amount": "5", "Link": "X - https://x.com", "Due": "2024-01-31"}
+    assert [name for name in fake.stats.operations if name.startswith(("change", "create"))] == ["change_multiple_column_values"]
+    assert fake.stats.operations["change_multiple_column_values"] == 1
+
+
+def test_update_item_columns_skips_unknown_columns_and_items(fake, new_wrapper):
+    board = fake.add_board("Cells", columns=COLUMNS)
+    item_id = fake.add_item(board, "a")
+    wrapper = new_wrapper("Cells")
+
+    assert wrapper.update_item_columns("a", {"No such column": "x", "Text": "kept"}) == {"Text": "kept"}
+    assert fake.get_item_values(item_id)["Text"] == "kept"
+    assert wrapper.update_item_columns("missing", {"Text": "lost"}) is None
+    assert wrapper.update_item_columns("a", {"Text": None}) is None
+    assert list(item_ids_by_name(fake, board)) == ["a"]
+
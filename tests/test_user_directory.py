@@ -0,0 +1,57 @@
+import pytest
+
+from conftest import item_ids_by_name
+
+
+@pytest.fixture
+def board(fake):
+    fake.add_user("Alice A", "Alice@X.com")
+    fake.add_user("Bob B", "bob@x.com")
+    board = fake.add_board("People", columns=[("Owner", "multiple-person"), ("Status", "color")])
+    fake.add_item(board, "a")
+    return board
+
+
+def test_users_are_loaded_once_and_indexed(fake, board, new_wrapper):
+    wrapper = new_wrapper("People")
+    fake.stats.reset()
+
+    assert wrapper.get_user_by_email(" alice@x.COM ").name == "Alice A"
+    assert wrapper.get_user_by_name("Bob B").email == "bob@x.com"
+    assert wrapper.get_user_by_email("nobody@x.com") is None
+    assert len(wrapper.get_list_of_users()) == len(fake.users)
+    assert len(wrapper.get_list_of_users()) == len(fake.users)
+    assert fake.stats.operations["users"] == 1
+
+
+def test_directory_is_reloaded_when_stale(fake, board, new_wrapper):
+    wrapper = new_wrapper("People")
+    wrapper.get_list_of_users()
+    fake.add_user("Carol C", "carol@x.com")
+
+    assert wrapper.get_user_by_email("carol@x.com") is None
+    wrapper.user_directory.ttl = 0
+    assert wrapper.get_user_by_email("carol@x.com").name == "Carol C"
+
+
+def test_people_columns_are_written_by_email_name_or_id(fake, board, new_wrapper):
+    wrapper = new_wrapper("People")
+    bob_id = wrapper.get_user_by_name("Bob B").id
+    item_id = item_ids_by_name(fake, board)["a"][0]
+
+    wrapper.change_value_of_column("a", "Owner", "alice@x.com, Bob B")
+    assert fake.get_item_values(item_id)["Owner"] == "Alice A, Bob B"
+
+    wrapper.update_item_columns("a", {"Owner": [int(bob_id)]})
+    assert fake.get_item_values(item_id)["Owner"] == "Bob B"
+
+
+def test_unknown_users_are_not_written(fake, board, new_wrapper):
+    wrapper = new_wrapper("People")
+    item_id = item_ids_by_name(fake, board)["a"][0]
+    wrapper.change_value_of_column("a", "Owner", "alice@x.com")
+
+    wrapper.update_item_columns("a", {"Owner": "nobody@x.com", "Status": "Done"})
+
+    assert fake.get_item_values(item_id)["Owner"] == "Alice A"
+    assert fake.get_item_values(item_id)["Status"] == "Done"
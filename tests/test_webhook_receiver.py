@@ -0,0 +1,111 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+import urllib.request
+
+import pytest
+
+from MondayWebhookReceiver import MondayWebhookReceiver
+
+SECRET = "signing secret"
+
+
+def b64encode(value):
+    return base64.urlsafe_b64encode(value).rstrip(b"=").decode("ascii")
+
+
+def make_token(claims, secret=SECRET, alg="HS256"):
+    header = b64encode(json.dumps({"alg": alg, "typ": "JWT"}).encode("utf-8"))
+    payload = b64encode(json.dumps(claims).encode("utf-8"))
+    signature = hmac.new(secret.encode("utf-8"), f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest()
+    return f"{header}.{payload}.{b64encode(signature)}"
+
+
+@pytest.fixture
+def board(fake):
+    board = fake.add_board("Hooks", columns=[("Status", "color")], groups=["Inbox", "Done"])
+    fake.add_item(board, "a")
+    return board
+
+
+def test_challenge_is_echoed(fake, board, new_wrapper):
+    receiver = MondayWebhookReceiver(new_wrapper("Hooks"))
+
+    status_code, body = receiver.handle_http_body(b'{"challenge": "abc123"}')
+
+    assert (status_code, json.loads(body)) == (200, {"challenge": "abc123"})
+    assert receiver.events_received == 0
+
+
+@pytest.mark.parametrize("authorization", [
+    None,
+    "not a token",
+    make_token({"exp": time.time() + 60}, secret="other secret"),
+    make_token({"exp": time.time() - 60}),
+    make_token({"exp": time.time() + 60}, alg="none"),
+])
+def test_requests_without_a_valid_token_are_rejected(fake, board, new_wrapper, authorization):
+    receiver = MondayWebhookReceiver(new_wrapper("Hooks"), signing_secret=SECRET)
+
+    status_code, body = receiver.handle_http_body(b'{"challenge": "abc123"}', authorization)
+
+    assert status_code == 401
+    assert receiver.events_received == 0
+
+
+def test_signed_event_is_applied_to_the_wrapper(fake, board, new_wrapper):
+    wrapper = new_wrapper("Hooks")
+    snapshot = wrapper.enable_board_snapshot()
+    item_id = int(wrapper.get_item_id_by_name("a"))
+    done = wrapper.get_group_id("Done")
+    received = []
+    receiver = MondayWebhookReceiver(wrapper, signing_secret=SECRET, on_event=received.append)
+    event = {"type": "move_pulse_into_group", "boardId": int(wrapper.get_board_id()), "pulseId": item_id, "destGroupId": done}
+
+    status_code, body = receiver.handle_http_body(json.dumps({"event": event}).encode("utf-8"), f"Bearer {make_token({'exp': time.time() + 60})}")
+
+    assert status_code == 200
+    assert snapshot.get_record_by_id(item_id).group_id == done
+    assert received == [event]
+    assert (receiver.events_received, receiver.events_applied) == (1, 1)
+
+
+def test_invalid_bodies_are_rejected(fake, board, new_wrapper):
+    receiver = MondayWebhookReceiver(new_wrapper("Hooks"))
+
+    assert receiver.handle_http_body(b"not json")[0] == 400
+    assert receiver.handle_http_body(b"[]")[0] == 400
+    assert receiver.handle_http_body(b'{"no": "event"}')[0] == 400
+
+
+def test_http_endpoint_answers_the_challenge(fake, board, new_wrapper):
+    with MondayWebhookReceiver(new_wrapper("Hooks"), path="/hooks") as receiver:
+        request = urllib.request.Request(receiver.url, data=b'{"challenge": "xyz"}', headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            assert json.loads(response.read()) == {"challenge": "xyz"}
+
+
+def test_events_update_the_snapshot_and_the_caches(fake, board, new_wrapper):
+    wrapper = new_wrapper("Hooks")
+    snapshot = wrapper.enable_board_snapshot()
+    board_id = int(wrapper.get_board_id())
+    item_id = int(wrapper.get_item_id_by_name("a"))
+    wrapper.get_columns_in_single_board()
+
+    assert wrapper.apply_webhook_event({"type": "create_pulse", "boardId": board_id, "pulseId": 99, "pulseName": "b"}) is True
+    assert wrapper.apply_webhook_event({"type": "update_name", "boardId": board_id, "pulseId": item_id,
+                                        "previousValue": {"name": "a"}, "value": {"name": "renamed"}}) is True
+    assert wrapper.apply_webhook_event({"type": "archive_pulse", "boardId": board_id, "pulseId": 99}) is True
+
+    assert sorted(record.name for record in snapshot.get_all_records()) == ["renamed"]
+    assert snapshot.get_record_by_id(item_id).name == "renamed"
+    assert (board_id, "a") not in wrapper.item_objects_cache
+
+    # A VALUE OF A KNOWN COLUMN KEEPS THE COLUMN LIST, A NEW COLUMN DROPS IT
+    wrapper.apply_webhook_event({"type": "update_column_value", "boardId": board_id, "pulseId": item_id, "columnId": "name"})
+    assert "Hooks" in wrapper.column_objects_cache
+    wrapper.apply_webhook_event({"type": "create_column", "boardId": board_id, "columnId": "new"})
+    assert "Hooks" not in wrapper.column_objects_cache
+    assert wrapper.apply_webhook_event({"type": "create_update", "boardId": board_id, "pulseId": item_id}) is False
@@ -0,0 +1,144 @@
+import threading
+import time
+
+from MondayWrapper import WriteBehindBuffer
+
+from conftest import item_ids_by_name
+
+
+def seed_board(fake):
+    board = fake.add_board("Buffered", columns=[("Status", "color"), ("Text", "text")])
+    for name in ("a", "b"):
+        fake.add_item(board, name)
+    return board
+
+
+def test_repeated_cell_changes_are_coalesced_into_one_write(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+    buffer = WriteBehindBuffer(wrapper, max_delay=None)
+
+    for status in ("Stuck", "Working on it", "Done"):
+        buffer.change_value("a", "Status", status)
+    buffer.change_columns("a", {"Text": "first"})
+    buffer.change_columns("b", {"Text": "second", "Status": None})
+    assert len(buffer) == 3
+    assert buffer.coalesced == 2
+
+    assert buffer.flush() == []
+
+    ids = item_ids_by_name(fake, board)
+    assert fake.get_item_values(ids["a"][0])["Status"] == "Done"
+    assert fake.get_item_values(ids["a"][0])["Text"] == "first"
+    assert fake.get_item_values(ids["b"][0]) == {"Name": "b", "Status": "", "Text": "second"}
+    assert len(buffer) == 0
+
+
+def test_length_is_read_under_the_buffer_lock(fake, new_wrapper):
+    seed_board(fake)
+    buffer = WriteBehindBuffer(new_wrapper("Buffered"), max_delay=None)
+    buffer.change_value("a", "Text", "first")
+    lengths = []
+
+    with buffer.lock:
+        reader = threading.Thread(target=lambda: lengths.append(len(buffer)))
+        reader.start()
+        reader.join(0.05)
+        # THE READER WAITS FOR A CHANGE IN PROGRESS TO BE COMPLETE
+        assert lengths == []
+        buffer.pending[("Buffered", "b")] = {"Text": "second"}
+        buffer.pending_cells += 1
+    reader.join()
+
+    assert lengths == [2]
+
+
+def test_size_triggered_flush_writes_pending_cells(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+    buffer = WriteBehindBuffer(wrapper, max_pending=2, max_delay=None)
+
+    buffer.change_value("a", "Text", "x")
+    buffer.change_value("b", "Text", "y")
+
+    ids = item_ids_by_name(fake, board)
+    assert len(buffer) == 0
+    assert fake.get_item_values(ids["b"][0])["Text"] == "y"
+
+
+def test_flush_reports_failed_writes_with_their_values(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+    buffer = WriteBehindBuffer(wrapper, max_delay=None)
+
+    buffer.change_value("a", "Status", "Not a label")
+    buffer.change_value("missing", "Text", "lost")
+    buffer.change_value("b", "Text", "written")
+    failures = buffer.flush()
+
+    assert sorted((result.operation.item_name, result.operation.column_values) for result in failures) == [
+        ("a", {"Status": "Not a label"}), ("missing", {"Text": "lost"})]
+    assert fake.get_item_values(item_ids_by_name(fake, board)["b"][0])["Text"] == "written"
+
+
+def test_failures_of_size_triggered_flushes_are_returned_by_next_flush(fake, new_wrapper):
+    seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+    reported = []
+    buffer = WriteBehindBuffer(wrapper, max_pending=1, max_delay=None)
+    buffer.change_value("missing", "Text", "lost")
+
+    assert [result.operation.item_name for result in buffer.flush()] == ["missing"]
+    assert buffer.flush() == []
+
+    buffer = WriteBehindBuffer(wrapper, max_pending=1, max_delay=None, on_failure=reported.extend)
+    buffer.change_value("missing", "Text", "lost")
+    assert [result.operation.item_name for result in reported] == ["missing"]
+    assert buffer.flush() == []
+
+
+
+def test_time_triggered_flush_writes_pending_cells(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+    buffer = WriteBehindBuffer(wrapper, max_delay=0.05)
+
+    buffer.change_value("a", "Text", "later")
+    deadline = time.time() + 5
+    while len(buffer) and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert fake.get_item_values(item_ids_by_name(fake, board)["a"][0])["Text"] == "later"
+    buffer.close()
+
+
+def test_wrapper_writes_go_through_the_buffer_when_enabled(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+    wrapper.enable_write_behind(max_delay=None)
+    ids = item_ids_by_name(fake, board)
+
+    wrapper.change_value_of_column("a", "Text", "first")
+    wrapper.update_item_columns("a", {"Text": "second", "Status": "Done"})
+    assert fake.get_item_values(ids["a"][0])["Text"] == ""
+
+    assert wrapper.flush_writes() == []
+    assert fake.get_item_values(ids["a"][0]) == {"Name": "a", "Status": "Done", "Text": "second"}
+    wrapper.change_value_of_column("b", "Text", "on disable")
+    assert wrapper.disable_write_behind() == []
+    assert fake.get_item_values(ids["b"][0])["Text"] == "on disable"
+    # WRITES ARE IMMEDIATE AGAIN
+    wrapper.change_value_of_column("b", "Text", "immediate")
+    assert fake.get_item_values(ids["b"][0])["Text"] == "immediate"
+
+
+def test_context_manager_keeps_failures_of_the_final_flush(fake, new_wrapper):
+    board = seed_board(fake)
+    wrapper = new_wrapper("Buffered")
+
+    with WriteBehindBuffer(wrapper, max_delay=None) as buffer:
+        buffer.change_value("a", "Text", "written")
+        buffer.change_value("missing", "Text", "lost")
+
+    assert [result.operation.item_name for result in buffer.last_failures] == ["missing"]
+    assert fake.get_item_values(item_ids_by_name(fake, board)["a"][0])["Text"] == "written"